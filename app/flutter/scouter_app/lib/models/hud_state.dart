@@ -53,6 +53,8 @@ class SensorContext {
   final String deviceType;
   final Map<String, dynamic> data;
   final Map<String, dynamic> schema;
+  // Per-field threshold level from the HUD: "ok", "warn" or "alert"
+  final Map<String, String> levels;
   final DateTime receivedAt;
 
   SensorContext({
@@ -61,6 +63,7 @@ class SensorContext {
     required this.deviceType,
     required this.data,
     required this.schema,
+    this.levels = const {},
     DateTime? receivedAt,
   }) : receivedAt = receivedAt ?? DateTime.now();
 
@@ -75,7 +78,9 @@ class SensorContext {
           entry.key == 'dtc_codes') continue;
       final fieldSchema = schema[entry.key];
       final unit = fieldSchema is Map ? (fieldSchema['unit'] ?? '') : '';
-      buf.writeln('  ${entry.key}: ${entry.value} $unit');
+      final level = levels[entry.key];
+      final flag = level == null || level == 'ok' ? '' : ' (${level.toUpperCase()})';
+      buf.writeln('  ${entry.key}: ${entry.value} $unit$flag');
     }
     if (data.containsKey('alerts') && data['alerts'] is List &&
         (data['alerts'] as List).isNotEmpty) {
@@ -186,6 +191,7 @@ class HudConnection extends ChangeNotifier {
     required String deviceType,
     required Map<String, dynamic> data,
     required Map<String, dynamic> schema,
+    Map<String, String> levels = const {},
   }) {
     _sensorContext = SensorContext(
       deviceId: deviceId,
@@ -193,6 +199,7 @@ class HudConnection extends ChangeNotifier {
       deviceType: deviceType,
       data: data,
       schema: schema,
+      levels: levels,
     );
     notifyListeners();
   }
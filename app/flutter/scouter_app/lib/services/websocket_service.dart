@@ -12,6 +12,9 @@ class WebSocketService {
   String? _url;
   bool _shouldReconnect = false;
 
+  // Sensor schemas by hash (the HUD sends each schema once per connection)
+  final Map<String, Map<String, dynamic>> _schemas = {};
+
   WebSocketService(this.hudConnection);
 
   bool get isConnected => hudConnection.isConnected;
@@ -59,6 +62,12 @@ class WebSocketService {
     });
   }
 
+  /// Ask the HUD for sensor_data at most every [intervalMs] ms
+  /// (null restores the device's own refresh rate).
+  void requestSensorRate(int? intervalMs) {
+    _send({'type': 'sensor_rate', 'interval_ms': intervalMs});
+  }
+
   void _send(Map<String, dynamic> msg) {
     if (_channel != null && hudConnection.isConnected) {
       _channel!.sink.add(jsonEncode(msg));
@@ -75,6 +84,7 @@ class WebSocketService {
       await channel.ready;
 
       _channel = channel;
+      _schemas.clear();
       hudConnection.setConnected(true);
 
       _channel!.stream.listen(
@@ -114,13 +124,21 @@ class WebSocketService {
         final selected = msg['selected'] as int? ?? 0;
         final activeId = msg['active'] as String? ?? '';
         hudConnection.updateDeviceList(devices, selected, activeId);
+      } else if (type == 'sensor_schema') {
+        final hash = msg['schema_hash'] as String? ?? '';
+        _schemas[hash] = Map<String, dynamic>.from(msg['schema'] as Map? ?? {});
       } else if (type == 'sensor_data') {
+        final inline = msg['schema'] as Map?;
+        final schema = inline != null
+            ? Map<String, dynamic>.from(inline)
+            : _schemas[msg['schema_hash'] as String? ?? ''] ?? {};
         hudConnection.updateSensorData(
           deviceId: msg['device_id'] as String? ?? '',
           deviceName: msg['device_name'] as String? ?? '',
           deviceType: msg['device_type'] as String? ?? '',
           data: Map<String, dynamic>.from(msg['data'] as Map? ?? {}),
-          schema: Map<String, dynamic>.from(msg['schema'] as Map? ?? {}),
+          schema: schema,
+          levels: Map<String, String>.from(msg['levels'] as Map? ?? {}),
         );
       }
     } catch (_) {
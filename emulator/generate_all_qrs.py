@@ -5,25 +5,67 @@ Outputs:
   - Individual PNG files in qr_output/ (one per device)
   - A single printable A4 PDF with all QR codes (6 per page)
 
+For provisioning runs (thousands of Bridges) the device list can come from
+a CSV file or a generated id range instead of config.yaml. Cards are then
+rendered across a process pool and PDF pages are written as soon as their
+six cards are ready; --pdf-pages splits the sheet into several files so
+the PDF writer never holds more than that many pages.
+
 Usage:
     python generate_all_qrs.py
     python generate_all_qrs.py --config config.yaml --output qr_output/
+    python generate_all_qrs.py --csv bridges.csv --workers 8 --pdf-pages 100
+    python generate_all_qrs.py --range "bridge-{n:04d}:1-5000" --type bridge \\
+        --topic-template "bridges/{id}" --no-png
 """
 
 import argparse
+import csv
+import io
+import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+from urllib.parse import urlencode
 
 import qrcode
 import yaml
 from PIL import Image, ImageDraw, ImageFont
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from devices import DEVICE_TYPES
 from devices.base import BaseDevice
 
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+# PDF layout: 2 cols x 3 rows per A4 page
+PDF_COLS = 2
+PDF_ROWS = 3
+PER_PAGE = PDF_COLS * PDF_ROWS
+
+# Cards per task sent to a worker process (amortizes IPC overhead)
+CHUNK_SIZE = 24
+
+# Print every card's details only for small runs
+VERBOSE_LIMIT = 20
+
+
+class CardSpec(NamedTuple):
+    """Everything needed to render one QR card (picklable for worker processes)."""
+    id: str
+    name: str
+    type: str
+    auth: str
+    url: str
+
 
 def load_config(path: str) -> dict:
     with open(path) as f:
@@ -38,6 +80,105 @@ def create_device_for_qr(device_config: dict, broker_host: str, broker_port: int
     return cls(device_config, broker_host, broker_port)
 
 
+def qrlink_url(device_id: str, host: str, port: int, auth: str = "open", topic: str = "") -> str:
+    """QR-Link URL in the same format as BaseDevice.get_qrlink_url()."""
+    base = f"qrlink://v1/{device_id}/mqtt/{host}:{port}"
+    params = {}
+    if auth != "open":
+        params["auth"] = auth
+    if topic:
+        params["t"] = topic
+    if params:
+        return f"{base}?{urlencode(params)}"
+    return base
+
+
+# ── Device sources ──
+
+def specs_from_config(device_configs: list[dict], broker_host: str, broker_port: int) -> list[CardSpec]:
+    specs = []
+    for dc in device_configs:
+        device = create_device_for_qr(dc, broker_host, broker_port)
+        specs.append(CardSpec(device.id, device.name, device.type, device.auth,
+                              device.get_qrlink_url()))
+    return specs
+
+
+def specs_from_csv(path: str, broker_host: str, broker_port: int) -> Iterator[CardSpec]:
+    """Devices from a CSV file with a header row.
+
+    Required column: id. Optional: name, type, topic, auth, host, port
+    (host/port override the broker for that row).
+    """
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or "id" not in reader.fieldnames:
+            raise ValueError(f"{path}: CSV needs a header row with an 'id' column")
+        for line, row in enumerate(reader, start=2):
+            device_id = (row.get("id") or "").strip()
+            if not device_id:
+                raise ValueError(f"{path}:{line}: missing device id")
+            dtype = (row.get("type") or "device").strip()
+            auth = (row.get("auth") or "open").strip()
+            host = (row.get("host") or "").strip() or broker_host
+            port = int((row.get("port") or "").strip() or broker_port)
+            yield CardSpec(
+                id=device_id,
+                name=(row.get("name") or "").strip() or device_id,
+                type=dtype,
+                auth=auth,
+                url=qrlink_url(device_id, host, port, auth, (row.get("topic") or "").strip()),
+            )
+
+
+def parse_range(spec: str) -> tuple[str, int, int]:
+    """"bridge-{n:04d}:1-5000" → ("bridge-{n:04d}", 1, 5000)."""
+    template, sep, bounds = spec.rpartition(":")
+    start, dash, end = bounds.partition("-")
+    if not sep or not dash or "{n" not in template:
+        raise ValueError(f"Bad --range {spec!r}, expected e.g. 'bridge-{{n:04d}}:1-500'")
+    first, last = int(start), int(end)
+    if last < first:
+        raise ValueError(f"Bad --range {spec!r}: end before start")
+    return template, first, last
+
+
+def specs_from_range(
+    spec: str,
+    broker_host: str,
+    broker_port: int,
+    device_type: str,
+    auth: str,
+    name_template: str,
+    topic_template: str,
+) -> Iterator[CardSpec]:
+    """Generated devices, e.g. bridge-0001 … bridge-5000."""
+    template, first, last = parse_range(spec)
+    for n in range(first, last + 1):
+        device_id = template.format(n=n)
+        fields = {"id": device_id, "n": n, "type": device_type}
+        yield CardSpec(
+            id=device_id,
+            name=name_template.format(**fields),
+            type=device_type,
+            auth=auth,
+            url=qrlink_url(device_id, broker_host, broker_port, auth,
+                           topic_template.format(**fields)),
+        )
+
+
+# ── Rendering ──
+
+@lru_cache(maxsize=1)
+def _fonts() -> tuple[ImageFont.ImageFont, ImageFont.ImageFont]:
+    """(label, sublabel) fonts, loaded once per process."""
+    try:
+        return ImageFont.truetype(FONT_BOLD, 16), ImageFont.truetype(FONT_REGULAR, 12)
+    except OSError:
+        font = ImageFont.load_default()
+        return font, font
+
+
 def generate_qr_image(data: str, label: str, sublabel: str, size: int = 400) -> Image.Image:
     """Generate a QR code image with a label below it."""
     qr = qrcode.QRCode(
@@ -58,14 +199,7 @@ def generate_qr_image(data: str, label: str, sublabel: str, size: int = 400) ->
     card.paste(qr_img, (0, 0))
 
     draw = ImageDraw.Draw(card)
-
-    # Use default font (monospace-like)
-    try:
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-    except OSError:
-        font_large = ImageFont.load_default()
-        font_small = font_large
+    font_large, font_small = _fonts()
 
     # Draw label centered below QR
     label_bbox = draw.textbbox((0, 0), label, font=font_large)
@@ -79,95 +213,229 @@ def generate_qr_image(data: str, label: str, sublabel: str, size: int = 400) ->
     return card
 
 
-def generate_pdf(qr_cards: list[tuple[Image.Image, str]], output_path: str):
-    """Generate a printable A4 PDF with QR codes, 6 per page (2 cols x 3 rows)."""
-    page_w, page_h = A4  # 595 x 842 points
-    margin = 20 * mm
-    cols = 2
-    rows = 3
-    per_page = cols * rows
-
-    card_w = (page_w - 2 * margin - 10 * mm) / cols
-    card_h = (page_h - 2 * margin - 20 * mm) / rows
-
-    c = canvas.Canvas(output_path, pagesize=A4)
+def render_card(spec: CardSpec, png_dir: str | None = None) -> tuple[CardSpec, bytes]:
+    """Render one card to PNG bytes, also writing <id>.png if png_dir is set."""
+    card = generate_qr_image(
+        data=spec.url,
+        label=spec.name,
+        sublabel=f"{spec.type} | {spec.auth}",
+    )
+    buf = io.BytesIO()
+    card.save(buf, format="PNG", compress_level=1)
+    png = buf.getvalue()
+    if png_dir is not None:
+        (Path(png_dir) / f"{spec.id}.png").write_bytes(png)
+    return spec, png
+
+
+def _render_chunk(specs: list[CardSpec], png_dir: str | None) -> list[tuple[CardSpec, bytes]]:
+    return [render_card(spec, png_dir) for spec in specs]
+
+
+def _chunks(specs: Iterable[CardSpec], size: int) -> Iterator[list[CardSpec]]:
+    chunk: list[CardSpec] = []
+    for spec in specs:
+        chunk.append(spec)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_cards(
+    specs: Iterable[CardSpec],
+    png_dir: str | None,
+    workers: int,
+) -> Iterator[tuple[CardSpec, bytes]]:
+    """Yield (spec, png bytes) in input order, rendered on `workers` processes.
+
+    At most a few chunks per worker are in flight, so memory stays bounded
+    no matter how many cards are generated.
+    """
+    if workers <= 1:
+        for spec in specs:
+            yield render_card(spec, png_dir)
+        return
+
+    max_inflight = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        inflight: deque = deque()
+        for chunk in _chunks(specs, CHUNK_SIZE):
+            inflight.append(pool.submit(_render_chunk, chunk, png_dir))
+            if len(inflight) >= max_inflight:
+                yield from inflight.popleft().result()
+        while inflight:
+            yield from inflight.popleft().result()
+
+
+# ── PDF ──
+
+class PdfSheetWriter:
+    """Printable A4 sheets, 6 cards per page (2 cols x 3 rows).
+
+    Pages are emitted as soon as they fill up. With pages_per_file > 0 the
+    output is split into <stem>_001.pdf, <stem>_002.pdf, … and each file is
+    written to disk (and released) once it has that many pages.
+    """
+
+    def __init__(self, output_path: Path, pages_per_file: int = 0):
+        self._output_path = output_path
+        self._pages_per_file = pages_per_file
+        self._canvas: canvas.Canvas | None = None
+        self._slot = 0  # card position on the current page
+        self._pages_in_file = 0
+        self.files: list[Path] = []
+
+        page_w, page_h = A4  # 595 x 842 points
+        self._page_h = page_h
+        self._margin = 20 * mm
+        self._card_w = (page_w - 2 * self._margin - 10 * mm) / PDF_COLS
+        self._card_h = (page_h - 2 * self._margin - 20 * mm) / PDF_ROWS
+
+    def _open(self) -> canvas.Canvas:
+        if self._pages_per_file > 0:
+            path = self._output_path.with_name(
+                f"{self._output_path.stem}_{len(self.files) + 1:03d}{self._output_path.suffix}")
+        else:
+            path = self._output_path
+        self.files.append(path)
+        self._pages_in_file = 0
+        return canvas.Canvas(str(path), pagesize=A4)
+
+    def add(self, png: bytes) -> None:
+        if self._canvas is None:
+            self._canvas = self._open()
+
+        col = self._slot % PDF_COLS
+        row = self._slot // PDF_COLS
+        x = self._margin + col * (self._card_w + 5 * mm)
+        y = self._page_h - self._margin - (row + 1) * self._card_h - row * 5 * mm
+        self._canvas.drawImage(
+            ImageReader(io.BytesIO(png)), x, y,
+            width=self._card_w, height=self._card_h,
+            preserveAspectRatio=True,
+        )
 
-    for page_start in range(0, len(qr_cards), per_page):
-        page_items = qr_cards[page_start:page_start + per_page]
+        self._slot += 1
+        if self._slot >= PER_PAGE:
+            self._end_page()
 
-        for idx, (card_img, device_id) in enumerate(page_items):
-            col = idx % cols
-            row = idx // cols
+    def _end_page(self) -> None:
+        self._canvas.showPage()
+        self._slot = 0
+        self._pages_in_file += 1
+        if self._pages_per_file > 0 and self._pages_in_file >= self._pages_per_file:
+            self._canvas.save()
+            self._canvas = None
 
-            x = margin + col * (card_w + 5 * mm)
-            y = page_h - margin - (row + 1) * card_h - row * 5 * mm
+    def close(self) -> None:
+        if self._canvas is None:
+            return
+        if self._slot:
+            self._canvas.showPage()
+        self._canvas.save()
+        self._canvas = None
 
-            # Save card as temp file and draw on PDF
-            temp_path = f"/tmp/scouterhud_qr_{device_id}.png"
-            card_img.save(temp_path)
-            c.drawImage(
-                temp_path, x, y,
-                width=card_w, height=card_h,
-                preserveAspectRatio=True,
-            )
 
-        if page_start + per_page < len(qr_cards):
-            c.showPage()
+# ── CLI ──
 
-    c.save()
+def _print_card(spec: CardSpec, png_dir: Path | None) -> None:
+    print(f"  [{spec.id}]")
+    print(f"    Name: {spec.name}")
+    print(f"    Type: {spec.type}")
+    print(f"    URL:  {spec.url}")
+    print(f"    Len:  {len(spec.url)} bytes")
+    if png_dir is not None:
+        print(f"    PNG:  {png_dir / f'{spec.id}.png'}")
+    print()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate QR codes for ScouterHUD devices")
     parser.add_argument("--config", default="config.yaml", help="Config file path")
     parser.add_argument("--output", default="qr_output", help="Output directory")
-    args = parser.parse_args()
 
-    config = load_config(args.config)
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--csv", metavar="FILE",
+                        help="Read devices from CSV (columns: id[,name,type,topic,auth,host,port])")
+    source.add_argument("--range", metavar="TEMPLATE:START-END",
+                        help="Generate device ids, e.g. 'bridge-{n:04d}:1-5000'")
+    parser.add_argument("--type", default="bridge", help="Device type for --range (default: bridge)")
+    parser.add_argument("--auth", default="open", help="Auth mode for --range (default: open)")
+    parser.add_argument("--name-template", default="{id}",
+                        help="Card label for --range; fields {id}, {n}, {type}")
+    parser.add_argument("--topic-template", default="{type}/{id}",
+                        help="MQTT topic for --range; fields {id}, {n}, {type}")
+    parser.add_argument("--host", help="Broker host for --csv/--range (default: from config)")
+    parser.add_argument("--port", type=int, help="Broker port for --csv/--range (default: from config)")
+
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Render processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--no-png", action="store_true", help="Skip individual PNG files")
+    parser.add_argument("--no-pdf", action="store_true", help="Skip the printable PDF")
+    parser.add_argument("--pdf-pages", type=int, default=0,
+                        help="Split the PDF into files of N pages (default: one file)")
+    args = parser.parse_args()
 
-    broker_host = config.get("broker", {}).get("host", "0.0.0.0")
-    broker_port = config.get("broker", {}).get("port", 1883)
+    batch = bool(args.csv or args.range)
+    config = {}
+    if not batch or Path(args.config).exists():
+        config = load_config(args.config) or {}
+    broker_host = args.host or config.get("broker", {}).get("host", "0.0.0.0")
+    broker_port = args.port or config.get("broker", {}).get("port", 1883)
 
-    device_configs = config.get("devices", [])
-    if not device_configs:
-        print("No devices found in config.")
+    try:
+        if args.csv:
+            specs = list(specs_from_csv(args.csv, broker_host, broker_port))
+        elif args.range:
+            specs = list(specs_from_range(
+                args.range, broker_host, broker_port, args.type, args.auth,
+                args.name_template, args.topic_template,
+            ))
+        else:
+            specs = specs_from_config(config.get("devices", []), broker_host, broker_port)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
-    qr_cards: list[tuple[Image.Image, str]] = []
-
-    print(f"Generating QR codes for {len(device_configs)} devices...\n")
-
-    for dc in device_configs:
-        device = create_device_for_qr(dc, broker_host, broker_port)
-        qr_url = device.get_qrlink_url()
-
-        print(f"  [{device.id}]")
-        print(f"    Name: {device.name}")
-        print(f"    Type: {device.type}")
-        print(f"    URL:  {qr_url}")
-        print(f"    Len:  {len(qr_url)} bytes")
-
-        card = generate_qr_image(
-            data=qr_url,
-            label=device.name,
-            sublabel=f"{device.type} | {device.auth}",
-        )
-
-        # Save individual PNG
-        png_path = output_dir / f"{device.id}.png"
-        card.save(str(png_path))
-        print(f"    PNG:  {png_path}")
-        print()
-
-        qr_cards.append((card, device.id))
+    if not specs:
+        print("No devices found.")
+        sys.exit(1)
 
-    # Generate PDF
-    pdf_path = output_dir / "ALL_DEVICES_printable.pdf"
-    generate_pdf(qr_cards, str(pdf_path))
-    print(f"PDF generated: {pdf_path}")
-    print(f"\nDone! {len(qr_cards)} QR codes generated in {output_dir}/")
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    png_dir = None if args.no_png else output_dir
+    workers = max(1, min(args.workers, -(-len(specs) // CHUNK_SIZE)))
+    verbose = len(specs) <= VERBOSE_LIMIT
+
+    print(f"Generating QR codes for {len(specs)} devices ({workers} worker(s))...\n")
+
+    pdf = None if args.no_pdf else PdfSheetWriter(
+        output_dir / "ALL_DEVICES_printable.pdf", args.pdf_pages)
+    progress_every = max(PER_PAGE, len(specs) // 20)
+    start = time.perf_counter()
+    done = 0
+
+    for spec, png in render_cards(specs, str(png_dir) if png_dir else None, workers):
+        if pdf is not None:
+            pdf.add(png)
+        done += 1
+        if verbose:
+            _print_card(spec, png_dir)
+        elif done % progress_every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"  {done}/{len(specs)} cards  ({done / elapsed:.1f} cards/s)")
+
+    if pdf is not None:
+        pdf.close()
+    elapsed = time.perf_counter() - start
+
+    if pdf is not None:
+        for path in pdf.files:
+            print(f"PDF generated: {path}")
+    print(f"\nDone! {done} QR codes generated in {output_dir}/")
+    print(f"  {elapsed:.2f} s, {done / elapsed if elapsed > 0 else 0.0:.1f} cards/s")
 
 
 if __name__ == "__main__":
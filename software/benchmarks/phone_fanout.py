@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Load test for the phone WebSocket fan-out.
+
+Starts a PhoneInput server, connects N local observer clients (spread over
+a few worker processes) and broadcasts state and sensor_data messages at a
+fixed rate. Each message carries its send time; clients report delivery
+latency (broadcast call → message received), which is summarized per run.
+
+"delivered" is the share of sent messages each client actually received.
+Below 100% means the server conflated messages for clients that fell
+behind (only the newest state/sensor_data is kept per client).
+
+Clients run on the same machine as the server and compete with it for
+CPU, so results on a single-core box are a pessimistic bound.
+
+Usage:
+    python benchmarks/phone_fanout.py                        # 10, 100, 500 clients
+    python benchmarks/phone_fanout.py --clients 50 --rate 20 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing as mp
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scouterhud.input.phone_input import PhoneInput  # noqa: E402
+
+DEFAULT_CLIENTS = (10, 100, 500)
+
+
+# ── Client side (worker processes) ──
+
+async def _client(url: str, stop_at: float, latencies: list[float]) -> None:
+    import websockets
+
+    async with websockets.connect(url, max_size=None) as ws:
+        connected_at = time.monotonic()
+        while True:
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            msg = json.loads(raw)
+            sent_at = msg.get("t") or msg.get("data", {}).get("t")
+            # Skip the replay of the last push from before this client connected
+            if sent_at is not None and sent_at >= connected_at:
+                latencies.append(time.monotonic() - sent_at)
+
+
+async def _run_clients(url: str, count: int, stop_at: float) -> list[float]:
+    latencies: list[float] = []
+    tasks = []
+    # Connect in small batches so the listen backlog isn't overrun
+    for start in range(0, count, 25):
+        batch = [
+            asyncio.ensure_future(_client(url, stop_at, latencies))
+            for _ in range(min(25, count - start))
+        ]
+        tasks.extend(batch)
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return latencies
+
+
+def _worker(url: str, count: int, stop_at: float, results) -> None:
+    latencies = asyncio.run(_run_clients(url, count, stop_at))
+    results.put((count, latencies))
+
+
+# ── Server side ──
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+    return values[idx]
+
+
+def run(pi: PhoneInput, port: int, clients: int, rate: float, duration: float,
+        workers: int) -> dict:
+    url = f"ws://127.0.0.1:{port}/?role=observer"
+    connect_budget = 5.0 + clients / 50.0
+    stop_at = time.monotonic() + connect_budget + duration + 2.0
+
+    results: mp.Queue = mp.Queue()
+    procs = []
+    per_worker = [clients // workers + (1 if i < clients % workers else 0) for i in range(workers)]
+    for count in per_worker:
+        if count:
+            p = mp.Process(target=_worker, args=(url, count, stop_at, results))
+            p.start()
+            procs.append(p)
+
+    # Wait for every client to be registered on the server
+    deadline = time.monotonic() + connect_budget
+    while pi.stats()["clients"] < clients and time.monotonic() < deadline:
+        time.sleep(0.05)
+    ready = pi.stats()["clients"]
+
+    sent = 0
+    interval = 1.0 / rate
+    end = time.monotonic() + duration
+    next_send = time.monotonic()
+    while time.monotonic() < end:
+        now = time.monotonic()
+        if sent % 2 == 0:
+            pi.send_state("streaming", device="bench", t=now, seq=sent)
+        else:
+            pi.send_sensor_data("bench", "Bench", "bench", {"seq": sent, "t": now}, {})
+        sent += 1
+        next_send += interval
+        time.sleep(max(0.0, next_send - time.monotonic()))
+
+    server_stats = pi.stats()
+    latencies: list[float] = []
+    for _ in procs:
+        _count, lat = results.get(timeout=stop_at - time.monotonic() + 10.0)
+        latencies.extend(lat)
+    for p in procs:
+        p.join(timeout=5.0)
+
+    # Wait for the server to notice the disconnects before the next run
+    deadline = time.monotonic() + 5.0
+    while pi.stats()["clients"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    ms = [x * 1000.0 for x in latencies]
+    expected = sent * max(ready, 1)
+    return {
+        "clients": ready,
+        "sent": sent,
+        "delivered_pct": 100.0 * len(ms) / expected if expected else 0.0,
+        "p50": _percentile(ms, 50),
+        "p95": _percentile(ms, 95),
+        "p99": _percentile(ms, 99),
+        "max": max(ms, default=0.0),
+        "mean": statistics.fmean(ms) if ms else 0.0,
+        "conflated": server_stats["conflated"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Phone WebSocket fan-out load test")
+    parser.add_argument("--clients", type=int, nargs="+", default=list(DEFAULT_CLIENTS),
+                        help="Client counts to test (default: 10 100 500)")
+    parser.add_argument("--rate", type=float, default=20.0,
+                        help="Broadcasts per second (default: 20)")
+    parser.add_argument("--duration", type=float, default=5.0,
+                        help="Seconds of broadcasting per run (default: 5)")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Client worker processes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    pi = PhoneInput(port=args.port)
+    pi.start()
+    time.sleep(0.5)
+
+    print(f"{'clients':>8} {'sent':>6} {'deliv%':>7} {'mean':>7} {'p50':>7} "
+          f"{'p95':>7} {'p99':>7} {'max':>7} {'conflated':>10}   (latency in ms)")
+    try:
+        for clients in args.clients:
+            r = run(pi, args.port, clients, args.rate, args.duration,
+                    min(args.workers, clients))
+            print(f"{r['clients']:>8} {r['sent']:>6} {r['delivered_pct']:>6.1f}% "
+                  f"{r['mean']:>7.1f} {r['p50']:>7.1f} {r['p95']:>7.1f} "
+                  f"{r['p99']:>7.1f} {r['max']:>7.1f} {r['conflated']:>10}")
+    finally:
+        pi.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Energy estimate for the power governor over a simulated hour of use.
+
+Replays a scripted session through the same RenderBudget and
+PowerGovernor the HUD uses, on a simulated clock (no display needed):
+
+    0-2 min    SCANNING (a few key presses)
+    2-55 min   STREAMING stable vitals from a 1 s monitor, ±0.5% noise,
+               with a one-minute SpO2 alert at 40 min and input now and then
+    55-60 min  SCANNING
+
+Frames are counted the way the main loop sends them: a full frame per
+render outside STREAMING, a full frame per new data dict in STREAMING,
+and the alert border strips as partial updates. Each run prints backlight
+duty, frames sent per second and the EnergyModel estimate in mWh per hour,
+with and without the governor.
+
+Usage:
+    python benchmarks/power_governor.py
+    python benchmarks/power_governor.py --minutes 120 --refresh-ms 500
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scouterhud.display.animation import FLASH_PERIOD, border_strips  # noqa: E402
+from scouterhud.perf.budget import RenderBudget  # noqa: E402
+from scouterhud.perf.power import PowerGovernor, screen_share  # noqa: E402
+
+
+class SimClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _state_at(t: float, minutes: float) -> str:
+    end = minutes * 60.0
+    return "STREAMING" if 120.0 <= t < end - 300.0 else "SCANNING"
+
+
+def run(governed: bool, minutes: float, refresh_ms: int, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    clock = SimClock()
+    budget = RenderBudget(battery=None, clock=clock)
+    power = PowerGovernor(clock=clock)
+    strips = screen_share(border_strips())
+
+    end = minutes * 60.0
+    inputs = sorted([0.0, 30.0, 115.0, 600.0, 1800.0, 2700.0] + [end - 200.0])
+    alert = (2400.0, 2460.0)
+    refresh = refresh_ms / 1000.0
+
+    next_frame = next_data = next_toggle = 0.0
+    data = None
+    shown_data = None
+    while clock.t < end:
+        t = clock.t
+        state = _state_at(t, minutes)
+        alerting = state == "STREAMING" and alert[0] <= t < alert[1]
+
+        input_now = bool(inputs) and inputs[0] <= t
+        while inputs and inputs[0] <= t:
+            inputs.pop(0)
+            power.activity(t)
+
+        if state == "STREAMING" and t >= next_data:
+            spo2 = 86.0 if alerting else 97.0
+            data = {
+                "spo2": spo2 * (1 + rng.uniform(-0.005, 0.005)),
+                "heart_rate": 72.0 * (1 + rng.uniform(-0.005, 0.005)),
+                "alerts": ["LOW_SPO2"] if alerting else [],
+            }
+            next_data = t + refresh
+
+        if input_now or t >= next_frame:
+            if state != "STREAMING":
+                power.frame_sent()
+                shown_data = None
+            elif data is not None and data is not shown_data:
+                shown_data = data
+                power.frame_sent()
+                power.data(data, alerting, t)
+            budget.frame_done(None if input_now else next_frame, t)
+            if governed:
+                power.update(state, t)
+            scale = power.interval_scale if governed else 1.0
+            next_frame = t + budget.next_interval(state, refresh_ms, scale)
+
+        if alerting and t >= next_toggle:
+            power.frame_sent(strips)
+            next_toggle = t + FLASH_PERIOD / 2
+
+        wake = [next_frame, end]
+        if state == "STREAMING":
+            wake.append(next_data)
+        if alerting:
+            wake.append(next_toggle)
+        if inputs:
+            wake.append(inputs[0])
+        clock.t = max(min(wake), t + 1e-6)
+
+    return power.energy(end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Power governor energy estimate")
+    parser.add_argument("--minutes", type=float, default=60.0, help="Session length (default: 60)")
+    parser.add_argument("--refresh-ms", type=int, default=1000,
+                        help="Monitor refresh_ms while streaming (default: 1000)")
+    args = parser.parse_args()
+
+    print(f"{'governor':>9} {'duty':>6} {'frames/s':>9} {'mWh/h':>8}")
+    results = {}
+    for governed in (False, True):
+        r = results[governed] = run(governed, args.minutes, args.refresh_ms)
+        print(f"{'on' if governed else 'off':>9} {r['backlight_duty']:>6.2f} "
+              f"{r['frames_per_s']:>9.2f} {r['mwh_per_hour']:>8.1f}")
+    off, on = results[False]["mwh_per_hour"], results[True]["mwh_per_hour"]
+    if off:
+        print(f"saving: {100.0 * (off - on) / off:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
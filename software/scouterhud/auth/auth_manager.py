@@ -6,18 +6,24 @@ authentication flow before allowing data subscription.
 Auth levels:
   - "open"  → no auth needed, connect immediately
   - "pin"   → user must enter a numeric PIN via Gauntlet/keyboard
-  - "token" → pre-shared token (stored in config file)
+  - "token" → pre-shared token (stored in config file), sent as the MQTT
+               username/password without user interaction
 
 Security (Phase S0):
   - No "accept any PIN" fallback — unknown devices are rejected
   - PINs loaded from config, not hardcoded in source
   - Rate limiting: 5 failed attempts → 15 minute lockout per device
+  - PINs held as salted hashes, PINs and tokens compared in constant time,
+    and the lockout state survives restarts (see credential_store.py)
 """
 
 import logging
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
+from scouterhud.auth.credential_store import CredentialStore
 from scouterhud.qrlink.protocol import DeviceLink
 
 log = logging.getLogger("scouterhud.auth")
@@ -39,20 +45,41 @@ class AuthResult:
 class AuthManager:
     """Manages authentication for device connections."""
 
-    def __init__(self, pins: dict[str, str] | None = None):
+    def __init__(
+        self,
+        pins: dict[str, str] | None = None,
+        tokens: dict[str, str] | None = None,
+        state_path: Path | None = None,
+        store: CredentialStore | None = None,
+    ):
         """Initialize with optional PIN mapping.
 
         Args:
             pins: dict of device_id → PIN. Loaded from config by the caller.
                   If None, no demo/preset PINs are available.
+            tokens: dict of device_id → token, also loaded from config.
+            state_path: JSON file for stored credentials and lockout state.
+                  If None, nothing is persisted.
+            store: CredentialStore to use instead of creating one.
         """
-        self._config_pins: dict[str, str] = dict(pins) if pins else {}
-        self._stored_tokens: dict[str, str] = {}  # device_id → token
-        self._stored_pins: dict[str, str] = {}     # device_id → PIN (runtime overrides)
+        self._store = store if store is not None else CredentialStore(state_path)
+        for device_id, pin in (pins or {}).items():
+            self._store.set_pin(device_id, str(pin))
+        for device_id, token in (tokens or {}).items():
+            self._store.set_token(device_id, str(token))
 
-        # Rate limiting: per-device tracking
-        self._failed_attempts: dict[str, int] = {}    # device_id → consecutive failures
-        self._lockout_until: dict[str, float] = {}    # device_id → timestamp
+        # Token credentials resolved in the background (device_id → future)
+        self._prewarmed: dict[str, Future] = {}
+        self._prewarm_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Rate limiting: per-device tracking (persisted by the store)
+        self._failed_attempts = self._store.failed_attempts   # device_id → consecutive failures
+        self._lockout_until = self._store.lockout_until       # device_id → monotonic timestamp
+
+    def stats(self) -> dict[str, int]:
+        """Key derivations, cached keys and active lockouts."""
+        return self._store.stats()
 
     def needs_auth(self, link: DeviceLink) -> bool:
         """Check if a device requires authentication."""
@@ -71,6 +98,7 @@ class AuthManager:
         if lockout_time:
             self._lockout_until.pop(device_id, None)
             self._failed_attempts.pop(device_id, None)
+            self._store.save()
         return False
 
     def get_lockout_remaining(self, device_id: str) -> int:
@@ -99,18 +127,19 @@ class AuthManager:
                 error=f"Locked out. Try again in {remaining // 60 + 1} min",
             )
 
-        # Look up expected PIN: runtime override > config
-        expected = self._stored_pins.get(link.id) or self._config_pins.get(link.id)
+        # Runtime override > config, checked against the salted hash
+        valid = self._store.verify_pin(link.id, pin)
 
-        if expected is None:
+        if valid is None:
             log.warning(f"No PIN configured for {link.id}, rejecting")
             return AuthResult(success=False, error="No PIN configured for this device")
 
-        if pin == expected:
+        if valid:
             log.info(f"PIN accepted for {link.id}")
             # Clear failed attempts on success
-            self._failed_attempts.pop(link.id, None)
-            self._lockout_until.pop(link.id, None)
+            if self._failed_attempts.pop(link.id, None) is not None:
+                self._lockout_until.pop(link.id, None)
+                self._store.save()
             return AuthResult(success=True, credential=pin)
 
         # Failed attempt — track and possibly lock out
@@ -120,18 +149,31 @@ class AuthManager:
 
         if failures >= MAX_PIN_ATTEMPTS:
             self._lockout_until[link.id] = time.monotonic() + LOCKOUT_SECONDS
+            self._store.save()
             log.warning(f"Device {link.id} locked out for {LOCKOUT_SECONDS}s after {failures} failed attempts")
             return AuthResult(
                 success=False,
                 error=f"Too many attempts. Locked for {LOCKOUT_SECONDS // 60} min",
             )
 
+        self._store.save()
         remaining = MAX_PIN_ATTEMPTS - failures
         return AuthResult(success=False, error=f"Invalid PIN ({remaining} attempts left)")
 
-    def validate_token(self, link: DeviceLink) -> AuthResult:
-        """Validate a stored token for the device."""
-        token = self._stored_tokens.get(link.id)
+    def validate_token(self, link: DeviceLink, token: str | None = None) -> AuthResult:
+        """Validate a token for the device.
+
+        With a token, it is compared with the stored one. Without one, the
+        stored token (if any) is used.
+        """
+        if token is not None:
+            if self._store.verify_token(link.id, token):
+                log.info(f"Token accepted for {link.id}")
+                return AuthResult(success=True, credential=token)
+            log.warning(f"Invalid or unknown token for {link.id}")
+            return AuthResult(success=False, error="Invalid token")
+
+        token = self._store.token(link.id)
         if token:
             log.info(f"Token found for {link.id}")
             return AuthResult(success=True, credential=token)
@@ -139,10 +181,39 @@ class AuthManager:
         log.warning(f"No token stored for {link.id}")
         return AuthResult(success=False, error="No token configured")
 
+    def prewarm(self, link: DeviceLink) -> "Future[tuple[str, str] | None] | None":
+        """Start resolving MQTT credentials for a token device.
+
+        Called as soon as a QR-Link is parsed (from any thread), so the
+        token check is done by the time the transport needs it. Returns a
+        future with (username, password), or None if the device does not
+        use token auth. Repeated calls return the same future.
+        """
+        if link.auth != "token":
+            return None
+        with self._prewarm_lock:
+            future = self._prewarmed.get(link.id)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth")
+                future = self._executor.submit(self._resolve_credentials, link.id)
+                self._prewarmed[link.id] = future
+            return future
+
+    def _resolve_credentials(self, device_id: str) -> tuple[str, str] | None:
+        # The token is presented as is: the broker checks it, not the HUD
+        token = self._store.token(device_id)
+        if not token:
+            log.warning(f"No token stored for {device_id}")
+            return None
+        return device_id, token
+
     def store_pin(self, device_id: str, pin: str) -> None:
-        """Store a PIN for a device (for future connections)."""
-        self._stored_pins[device_id] = pin
+        """Store a PIN for a device (for future connections, persisted as a hash)."""
+        self._store.set_pin(device_id, pin, persist=True)
 
     def store_token(self, device_id: str, token: str) -> None:
-        """Store a token for a device."""
-        self._stored_tokens[device_id] = token
+        """Store a token for a device (persisted in the 0600 state file)."""
+        self._store.set_token(device_id, token, persist=True)
+        with self._prewarm_lock:
+            self._prewarmed.pop(device_id, None)
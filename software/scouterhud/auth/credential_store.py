@@ -0,0 +1,267 @@
+"""Salted credential hashes and persisted lockout state for AuthManager.
+
+PINs are never stored in plaintext: each one is kept as a
+PBKDF2-HMAC-SHA256 hash with its own random salt, and candidates are
+checked with hmac.compare_digest.
+
+Tokens are different: the HUD does not check them, it presents them to the
+broker, so a hash would be useless after a restart. They are kept as is,
+in memory and in the state file, whose 0600 mode is what protects them.
+
+PBKDF2 is slow on purpose (~0.5 s per check on a Pi Zero 2 W), which would
+stall the PIN screen on every attempt. Derived keys are therefore cached in
+memory, keyed by a fast HMAC of the candidate, so only the first check of a
+given PIN pays for the key derivation.
+
+Two layers for PINs and for tokens:
+  - config  → set at startup from config files, never written to disk.
+              Config PINs are hashed on first use, not when set: a PBKDF2
+              run per PIN would otherwise delay the first frame. Until then
+              the PIN stays in memory as read from the config file.
+  - runtime → set with persist=True (store_pin/store_token), saved to the
+              state file and taking precedence over config
+
+The state file (JSON, mode 0600) also holds the PIN lockout counters, so a
+reboot does not reset an active lockout. Lockout deadlines are saved as
+wall-clock times and converted back to time.monotonic() on load.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+log = logging.getLogger("scouterhud.auth")
+
+PBKDF2_ITERATIONS = 100_000
+SALT_BYTES = 16
+HASH_SCHEME = "pbkdf2_sha256"
+
+# Default state file (runtime credentials + lockouts)
+DEFAULT_STATE_PATH = Path.home() / ".scouterhud" / "credentials.json"
+
+# Derived keys kept in memory (candidate digest → key)
+DERIVED_CACHE_SIZE = 64
+
+
+class CredentialHash(NamedTuple):
+    iterations: int
+    salt: bytes
+    key: bytes
+
+    def encode(self) -> str:
+        """"pbkdf2_sha256$<iterations>$<salt b64>$<key b64>"."""
+        salt = base64.b64encode(self.salt).decode()
+        key = base64.b64encode(self.key).decode()
+        return f"{HASH_SCHEME}${self.iterations}${salt}${key}"
+
+    @classmethod
+    def decode(cls, encoded: str) -> "CredentialHash":
+        try:
+            scheme, iterations, salt, key = encoded.split("$")
+            if scheme != HASH_SCHEME:
+                raise ValueError(f"unsupported scheme {scheme!r}")
+            return cls(int(iterations), base64.b64decode(salt), base64.b64decode(key))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid credential hash: {e}") from None
+
+
+def hash_secret(secret: str, iterations: int = PBKDF2_ITERATIONS, salt: bytes | None = None) -> CredentialHash:
+    """Salted PBKDF2 hash of a PIN."""
+    salt = salt if salt is not None else secrets.token_bytes(SALT_BYTES)
+    key = hashlib.pbkdf2_hmac("sha256", secret.encode(), salt, iterations)
+    return CredentialHash(iterations, salt, key)
+
+
+class CredentialStore:
+    """Hashed PINs and plain tokens per device, plus persisted PIN lockout counters."""
+
+    def __init__(self, path: Path | None = None, iterations: int = PBKDF2_ITERATIONS):
+        """
+        Args:
+            path: JSON state file. None keeps everything in memory only.
+            iterations: PBKDF2 iterations for newly hashed PINs.
+        """
+        self._path = path
+        self._iterations = iterations
+        self._config_pins: dict[str, CredentialHash] = {}
+        self._runtime_pins: dict[str, CredentialHash] = {}
+        # Config PINs not hashed yet (see module docstring)
+        self._pending_pins: dict[str, str] = {}
+        self._config_tokens: dict[str, str] = {}
+        self._runtime_tokens: dict[str, str] = {}
+        self._derived: OrderedDict[tuple[bytes, int, bytes], bytes] = OrderedDict()
+
+        # Lockout state, owned by AuthManager (deadlines are time.monotonic())
+        self.failed_attempts: dict[str, int] = {}
+        self.lockout_until: dict[str, float] = {}
+
+        self.derivations = 0  # PBKDF2 runs (cache misses), for perf stats
+        self._load()
+
+    # ── PINs ──
+
+    def set_pin(self, device_id: str, pin: str, persist: bool = False) -> None:
+        """Store a PIN (persist=True: runtime layer, hashed and saved to disk).
+
+        Config PINs are only hashed by the first verify_pin().
+        """
+        if persist:
+            self.set_pin_hash(device_id, self._hash(pin), persist)
+        else:
+            self._config_pins.pop(device_id, None)
+            self._pending_pins[device_id] = pin
+
+    def set_pin_hash(self, device_id: str, cred: CredentialHash | str, persist: bool = False) -> None:
+        """Store an already-hashed PIN (CredentialHash or its encoded form)."""
+        if isinstance(cred, str):
+            cred = CredentialHash.decode(cred)
+        if persist:
+            self._runtime_pins[device_id] = cred
+            self.save()
+        else:
+            self._config_pins[device_id] = cred
+            self._pending_pins.pop(device_id, None)
+
+    def verify_pin(self, device_id: str, pin: str) -> bool | None:
+        """Check a candidate PIN. None if no PIN is stored."""
+        cred = self._runtime_pins.get(device_id) or self._config_hash(device_id)
+        if cred is None:
+            return None
+        return hmac.compare_digest(self._derive(cred, pin), cred.key)
+
+    # ── Tokens ──
+
+    def set_token(self, device_id: str, token: str, persist: bool = False) -> None:
+        """Store a token (persist=True: runtime layer, saved to disk)."""
+        if persist:
+            self._runtime_tokens[device_id] = token
+            self.save()
+        else:
+            self._config_tokens[device_id] = token
+
+    def token(self, device_id: str) -> str | None:
+        """Token to present for device_id (runtime over config), or None."""
+        return self._runtime_tokens.get(device_id) or self._config_tokens.get(device_id)
+
+    def verify_token(self, device_id: str, token: str) -> bool | None:
+        """Constant-time check of a token. None if none is stored."""
+        stored = self.token(device_id)
+        if stored is None:
+            return None
+        return hmac.compare_digest(stored.encode(), token.encode())
+
+    def _config_hash(self, device_id: str) -> CredentialHash | None:
+        pin = self._pending_pins.pop(device_id, None)
+        if pin is not None:
+            self._config_pins[device_id] = self._hash(pin)
+        return self._config_pins.get(device_id)
+
+    def _hash(self, secret: str) -> CredentialHash:
+        """hash_secret(), with the key cached so verifying secret costs no second run."""
+        cred = hash_secret(secret, self._iterations)
+        self.derivations += 1
+        self._cache(cred, secret, cred.key)
+        return cred
+
+    def _derive(self, cred: CredentialHash, secret: str) -> bytes:
+        """PBKDF2 key for secret under cred's salt, cached in memory."""
+        cache_key = self._cache_key(cred, secret)
+        key = self._derived.get(cache_key)
+        if key is not None:
+            self._derived.move_to_end(cache_key)
+            return key
+        key = hashlib.pbkdf2_hmac("sha256", secret.encode(), cred.salt, cred.iterations)
+        self.derivations += 1
+        self._cache(cred, secret, key)
+        return key
+
+    @staticmethod
+    def _cache_key(cred: CredentialHash, secret: str) -> tuple[bytes, int, bytes]:
+        digest = hmac.new(cred.salt, secret.encode(), hashlib.sha256).digest()
+        return cred.salt, cred.iterations, digest
+
+    def _cache(self, cred: CredentialHash, secret: str, key: bytes) -> None:
+        self._derived[self._cache_key(cred, secret)] = key
+        if len(self._derived) > DERIVED_CACHE_SIZE:
+            self._derived.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "derivations": self.derivations,
+            "cached_keys": len(self._derived),
+            "locked_out": sum(1 for t in self.lockout_until.values() if t > time.monotonic()),
+        }
+
+    # ── Persistence ──
+
+    def _load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text())
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable credential store {self._path}: {e}")
+            return
+
+        for device_id, encoded in data.get("pins", {}).items():
+            try:
+                self._runtime_pins[device_id] = CredentialHash.decode(encoded)
+            except ValueError as e:
+                log.warning(f"Skipping stored PIN for {device_id}: {e}")
+        for device_id, token in data.get("tokens", {}).items():
+            if not isinstance(token, str) or token.startswith(f"{HASH_SCHEME}$"):
+                # Older state files kept only a hash, which can't be presented
+                log.warning(f"Stored token for {device_id} can't be used, store it again")
+                continue
+            self._runtime_tokens[device_id] = token
+
+        wall_now = time.time()
+        mono_now = time.monotonic()
+        for device_id, entry in data.get("lockouts", {}).items():
+            failures = int(entry.get("failures", 0))
+            if failures:
+                self.failed_attempts[device_id] = failures
+            until = float(entry.get("until", 0))
+            # Never longer than what was left at save time (clock set back, RTC-less boot)
+            remaining = min(until - wall_now, float(entry.get("duration", 0)))
+            if remaining > 0:
+                self.lockout_until[device_id] = mono_now + remaining
+
+    def save(self) -> None:
+        """Write runtime credentials and lockout state to the state file."""
+        if self._path is None:
+            return
+        wall_now = time.time()
+        mono_now = time.monotonic()
+        lockouts = {}
+        for device_id in set(self.failed_attempts) | set(self.lockout_until):
+            entry: dict[str, float] = {"failures": self.failed_attempts.get(device_id, 0)}
+            until = self.lockout_until.get(device_id)
+            if until is not None and until > mono_now:
+                entry["until"] = wall_now + (until - mono_now)
+                entry["duration"] = until - mono_now
+            lockouts[device_id] = entry
+
+        data = {
+            "pins": {d: c.encode() for d, c in self._runtime_pins.items()},
+            "tokens": dict(self._runtime_tokens),
+            "lockouts": lockouts,
+        }
+
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            log.warning(f"Failed to save credential store {self._path}: {e}")
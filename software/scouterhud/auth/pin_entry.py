@@ -5,6 +5,11 @@ from the Gauntlet (or keyboard in dev mode). The user navigates digits
 with LEFT/RIGHT and changes values with UP/DOWN, then submits with CONFIRM.
 
 This mirrors the Gauntlet Modo 2 (numeric) described in gauntlet-tech-doc.md.
+
+Rendering is incremental: the static parts (header, hints, bottom bar) are
+drawn once, and each render_update() redraws only the digit cells and
+status line whose state changed, returning the bounding box of the change
+so the display backend can push just that region.
 """
 
 import logging
@@ -12,7 +17,7 @@ from typing import Any
 
 from PIL import Image, ImageDraw
 
-from scouterhud.display.backend import DISPLAY_WIDTH, DISPLAY_HEIGHT
+from scouterhud.display.backend import Box, DISPLAY_WIDTH, DISPLAY_HEIGHT, FULL_SCREEN
 from scouterhud.display.widgets import (
     BLACK, CYAN, DIM, GREEN, RED, WHITE, YELLOW,
     FONT_LARGE, FONT_MEDIUM, FONT_SMALL, FONT_TINY,
@@ -21,6 +26,21 @@ from scouterhud.input.events import EventType, InputEvent
 
 log = logging.getLogger("scouterhud.auth.pin")
 
+# Digit cell layout
+CELL_WIDTH = 40
+CELL_HEIGHT = 50
+CELL_GAP = 10
+CELL_Y = 90
+
+# Attempt counter + error message
+STATUS_BOX: Box = (0, 160, DISPLAY_WIDTH, 210)
+
+
+def _union(a: Box | None, b: Box) -> Box:
+    if a is None:
+        return b
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
 
 class PinEntry:
     """Interactive PIN entry with digit-by-digit navigation."""
@@ -35,6 +55,12 @@ class PinEntry:
         self._attempts = 0
         self._error_msg = ""
 
+        # Render cache: static background, current frame and what it shows
+        self._background: Image.Image | None = None
+        self._frame: Image.Image | None = None
+        self._drawn_cells: list[tuple[int, bool] | None] = [None] * pin_length
+        self._drawn_status: tuple[int, str] | None = None
+
     @property
     def is_done(self) -> bool:
         return self._submitted or self._cancelled
@@ -69,20 +95,20 @@ class PinEntry:
             self._cursor = max(self._cursor - 1, 0)
             self._error_msg = ""
 
-        # Rotary digit entry (Gauntlet/keyboard +/-)
+        # Rotary digit entry (Gauntlet/keyboard +/-); count > 1 for coalesced repeats
         elif event.type in (EventType.DIGIT_UP, EventType.NAV_UP):
-            self._digits[self._cursor] = (self._digits[self._cursor] + 1) % 10
+            self._digits[self._cursor] = (self._digits[self._cursor] + event.count) % 10
             self._error_msg = ""
 
         elif event.type in (EventType.DIGIT_DOWN, EventType.NAV_DOWN):
-            self._digits[self._cursor] = (self._digits[self._cursor] - 1) % 10
+            self._digits[self._cursor] = (self._digits[self._cursor] - event.count) % 10
             self._error_msg = ""
 
         elif event.type in (EventType.DIGIT_NEXT, EventType.NAV_RIGHT):
-            self._cursor = min(self._cursor + 1, self.pin_length - 1)
+            self._cursor = min(self._cursor + event.count, self.pin_length - 1)
 
         elif event.type in (EventType.DIGIT_PREV, EventType.NAV_LEFT):
-            self._cursor = max(self._cursor - 1, 0)
+            self._cursor = max(self._cursor - event.count, 0)
 
         elif event.type in (EventType.DIGIT_SUBMIT, EventType.CONFIRM):
             self._submitted = True
@@ -99,7 +125,48 @@ class PinEntry:
         self._cursor = 0
 
     def render(self) -> Image.Image:
-        """Render the PIN entry screen. Returns a 240x240 PIL Image."""
+        """Render the PIN entry screen. Returns a 240x240 PIL Image.
+
+        The image is cached and updated in place by later calls.
+        """
+        return self.render_update()[0]
+
+    def render_update(self) -> tuple[Image.Image, Box | None]:
+        """Bring the cached frame up to date.
+
+        Returns (frame, box): box covers everything redrawn since the last
+        call (the full screen the first time), or is None if nothing changed.
+        """
+        damaged: Box | None = None
+        if self._frame is None:
+            self._frame = self._render_background().copy()
+            damaged = FULL_SCREEN
+
+        draw = ImageDraw.Draw(self._frame)
+
+        for i in range(self.pin_length):
+            state = (self._digits[i], i == self._cursor)
+            if self._drawn_cells[i] != state:
+                box = self._cell_box(i)
+                self._clear(box)
+                self._draw_cell(draw, i, *state)
+                self._drawn_cells[i] = state
+                damaged = _union(damaged, box)
+
+        status = (self._attempts, self._error_msg)
+        if self._drawn_status != status:
+            self._clear(STATUS_BOX)
+            self._draw_status(draw)
+            self._drawn_status = status
+            damaged = _union(damaged, STATUS_BOX)
+
+        return self._frame, damaged
+
+    def _render_background(self) -> Image.Image:
+        """Static parts of the screen, drawn once."""
+        if self._background is not None:
+            return self._background
+
         img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), BLACK)
         draw = ImageDraw.Draw(img)
 
@@ -117,35 +184,49 @@ class PinEntry:
         # Instructions
         draw.text((30, 65), "\u25c4\u25ba move   \u25b2\u25bc change", fill=DIM, font=FONT_TINY)
 
-        # Digit boxes
-        box_width = 40
-        gap = 10
-        total_width = self.pin_length * box_width + (self.pin_length - 1) * gap
-        start_x = (DISPLAY_WIDTH - total_width) // 2
-        y = 90
+        # Bottom bar
+        draw.line([(0, 215), (240, 215)], fill=DIM, width=1)
+        draw.text((10, 220), "ENTER=Submit", fill=GREEN, font=FONT_TINY)
+        draw.text((140, 220), "ESC=Cancel", fill=DIM, font=FONT_TINY)
 
-        for i in range(self.pin_length):
-            x = start_x + i * (box_width + gap)
-
-            # Box background
-            if i == self._cursor:
-                # Selected digit — highlighted
-                draw.rectangle([(x, y), (x + box_width, y + 50)], outline=CYAN, width=2)
-                digit_color = CYAN
-            else:
-                draw.rectangle([(x, y), (x + box_width, y + 50)], outline=DIM, width=1)
-                digit_color = WHITE
-
-            # Digit value
-            digit_str = str(self._digits[i])
-            # Center the digit in the box
-            draw.text((x + 10, y + 8), digit_str, fill=digit_color, font=FONT_LARGE)
-
-            # Up/down arrows for selected digit
-            if i == self._cursor:
-                draw.text((x + 14, y - 14), "\u25b2", fill=CYAN, font=FONT_TINY)
-                draw.text((x + 14, y + 52), "\u25bc", fill=CYAN, font=FONT_TINY)
+        self._background = img
+        return img
 
+    def _clear(self, box: Box) -> None:
+        """Restore a region of the frame to the background."""
+        self._frame.paste(self._background.crop(box), box[:2])
+
+    def _cell_x(self, i: int) -> int:
+        total_width = self.pin_length * CELL_WIDTH + (self.pin_length - 1) * CELL_GAP
+        return (DISPLAY_WIDTH - total_width) // 2 + i * (CELL_WIDTH + CELL_GAP)
+
+    def _cell_box(self, i: int) -> Box:
+        """Region of digit cell i, including its selection arrows."""
+        x = self._cell_x(i)
+        return (x - 1, CELL_Y - 14, x + CELL_WIDTH + 2, CELL_Y + CELL_HEIGHT + 16)
+
+    def _draw_cell(self, draw: ImageDraw.ImageDraw, i: int, digit: int, selected: bool) -> None:
+        x = self._cell_x(i)
+        y = CELL_Y
+
+        # Box background
+        if selected:
+            # Selected digit — highlighted
+            draw.rectangle([(x, y), (x + CELL_WIDTH, y + CELL_HEIGHT)], outline=CYAN, width=2)
+            digit_color = CYAN
+        else:
+            draw.rectangle([(x, y), (x + CELL_WIDTH, y + CELL_HEIGHT)], outline=DIM, width=1)
+            digit_color = WHITE
+
+        # Digit value, centered in the box
+        draw.text((x + 10, y + 8), str(digit), fill=digit_color, font=FONT_LARGE)
+
+        # Up/down arrows for selected digit
+        if selected:
+            draw.text((x + 14, y - 14), "\u25b2", fill=CYAN, font=FONT_TINY)
+            draw.text((x + 14, y + 52), "\u25bc", fill=CYAN, font=FONT_TINY)
+
+    def _draw_status(self, draw: ImageDraw.ImageDraw) -> None:
         # Attempt counter
         if self._attempts > 0:
             draw.text((10, 165), f"Attempt {self._attempts + 1}", fill=DIM, font=FONT_TINY)
@@ -154,10 +235,3 @@ class PinEntry:
         if self._error_msg:
             draw.rectangle([(0, 180), (240, 200)], fill=(80, 0, 0))
             draw.text((10, 182), self._error_msg, fill=RED, font=FONT_SMALL)
-
-        # Bottom bar
-        draw.line([(0, 215), (240, 215)], fill=DIM, width=1)
-        draw.text((10, 220), "ENTER=Submit", fill=GREEN, font=FONT_TINY)
-        draw.text((140, 220), "ESC=Cancel", fill=DIM, font=FONT_TINY)
-
-        return img
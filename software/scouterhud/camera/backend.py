@@ -7,6 +7,7 @@ Concrete backends:
 
 from abc import ABC, abstractmethod
 
+import numpy as np
 from PIL import Image
 
 
@@ -16,6 +17,14 @@ class CameraBackend(ABC):
     def capture_frame(self) -> Image.Image:
         """Capture a single frame and return as PIL Image."""
 
+    def capture_gray(self) -> np.ndarray:
+        """Capture a single frame as a 2-D uint8 grayscale array.
+
+        Used by continuous scanning. Backends that can produce grayscale
+        natively should override this to skip the RGB round trip.
+        """
+        return np.asarray(self.capture_frame().convert("L"))
+
     @abstractmethod
     def start(self) -> None:
         """Start the camera / open the source."""
@@ -8,6 +8,7 @@ Two modes:
 import logging
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 from scouterhud.camera.backend import CameraBackend
@@ -62,6 +63,15 @@ class DesktopCameraBackend(CameraBackend):
 
         raise RuntimeError("No camera source configured")
 
+    def capture_gray(self) -> np.ndarray:
+        if self._use_webcam and self._webcam is not None:
+            import cv2
+            ret, frame = self._webcam.read()
+            if ret:
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            raise RuntimeError("Failed to capture frame from webcam")
+        return super().capture_gray()
+
     def set_qr_image(self, path: str) -> None:
         """Change the QR image file to load (for testing)."""
         self._qr_image_path = path
@@ -5,6 +5,7 @@ Backend-agnostic: works with any CameraBackend that returns PIL Images.
 
 import logging
 
+import numpy as np
 from PIL import Image
 from pyzbar.pyzbar import decode, ZBarSymbol
 
@@ -24,3 +25,32 @@ def scan_qr(image: Image.Image) -> str | None:
         return data
 
     return None
+
+
+def scan_qr_all(image: Image.Image) -> list[str]:
+    """Scan a PIL Image for every QR code. Returns unique payloads in scan order."""
+    gray = image.convert("L")
+
+    payloads: list[str] = []
+    for result in decode(gray, symbols=[ZBarSymbol.QRCODE]):
+        data = result.data.decode("utf-8")
+        if data not in payloads:
+            payloads.append(data)
+    log.debug(f"{len(payloads)} QR codes detected")
+    return payloads
+
+
+def scan_qr_gray(gray: np.ndarray) -> str | None:
+    """Scan a 2-D uint8 grayscale array (e.g. a candidate region) for a QR code."""
+    if gray.size == 0:
+        return None
+    gray = np.ascontiguousarray(gray, dtype=np.uint8)
+    height, width = gray.shape
+    results = decode((gray.tobytes(), width, height), symbols=[ZBarSymbol.QRCODE])
+
+    if results:
+        data = results[0].data.decode("utf-8")
+        log.debug(f"QR detected: {data[:80]}...")
+        return data
+
+    return None
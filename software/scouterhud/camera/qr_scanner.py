@@ -0,0 +1,415 @@
+"""Continuous QR scanning from a live camera.
+
+scan_qr() decodes one still image. For a webcam the HUD needs to scan
+continuously without stalling the render loop, so ContinuousQRScanner:
+
+  1. captures grayscale frames in a background thread (latest frame wins)
+  2. finds QR candidate regions on a downsampled copy with NumPy:
+     local contrast + black/white transition density per tile, then the
+     1:1:3:1:1 finder-pattern run ratio inside each tile cluster
+  3. decodes only those regions at full resolution, in a second thread;
+     frames that arrive while a decode is in flight are skipped
+  4. falls back to a full-frame decode every FULL_FRAME_EVERY scans, in
+     case the heuristics miss a code (glare, extreme angle)
+
+Decoded payloads go to the on_result callback; the same payload is not
+reported again for `repeat_after` seconds. A QR that stays in view is not
+even re-decoded: regions are fingerprinted with a perceptual hash and
+recent hash → payload results are reused for DECODE_CACHE_TTL seconds.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable
+
+import numpy as np
+
+from scouterhud.camera.backend import CameraBackend
+
+log = logging.getLogger(__name__)
+
+# Downsampling factor for candidate search (640x480 → 320x240)
+DEFAULT_DOWNSAMPLE = 2
+
+# Tile size (pixels of the downsampled image) for contrast/transition stats
+TILE = 8
+
+# A tile is "QR-like" with at least this max-min contrast (0-255) …
+MIN_CONTRAST = 48
+# … and at least this share of pixels at a black/white edge, in both axes
+MIN_TRANSITION_DENSITY = 0.08
+
+# Smallest tile cluster considered a candidate (2x2 tiles)
+MIN_CLUSTER_TILES = 4
+
+# Tiles added around each cluster: finder patterns are large solid areas
+# with few transitions, so a code's corners often fall just outside it
+CLUSTER_PAD_TILES = 2
+
+# Regions decoded per frame (best finder-pattern score first)
+MAX_REGIONS = 3
+
+# Full-frame decode fallback, every N scans without a result
+FULL_FRAME_EVERY = 15
+
+# Recent decode results (region hash → payload)
+DECODE_CACHE_TTL = 2.0
+DECODE_CACHE_SIZE = 32
+# Hashes this many bits apart still count as the same region (sensor noise)
+DECODE_CACHE_MAX_DISTANCE = 4
+
+# Finder pattern: dark-light-dark-light-dark runs in ratio 1:1:3:1:1
+_FINDER_RATIO = np.array([1, 1, 3, 1, 1], dtype=np.float32)
+_FINDER_TOLERANCE = 0.5  # per-run tolerance, in modules
+
+Box = tuple[int, int, int, int]  # (left, top, right, bottom) in full-frame pixels
+
+
+def _downsample(gray: np.ndarray, factor: int) -> np.ndarray:
+    """Block-mean downsample (crops to a multiple of factor)."""
+    if factor <= 1:
+        return gray.astype(np.float32)
+    h = gray.shape[0] // factor * factor
+    w = gray.shape[1] // factor * factor
+    blocks = gray[:h, :w].reshape(h // factor, factor, w // factor, factor)
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+def region_hash(gray: np.ndarray) -> int:
+    """64-bit difference hash (dHash) of an image region.
+
+    The region is reduced to 8x9 block means and each bit records whether
+    a block is brighter than its right neighbour, so small shifts, noise
+    and exposure changes between frames give the same hash.
+    """
+    h, w = gray.shape
+    if h < 8 or w < 9:
+        return -1
+    rows = np.linspace(0, h, 9, dtype=int)[:-1]
+    cols = np.linspace(0, w, 10, dtype=int)[:-1]
+    sums = np.add.reduceat(np.add.reduceat(gray.astype(np.uint32), rows, axis=0), cols, axis=1)
+    areas = np.outer(np.diff(np.append(rows, h)), np.diff(np.append(cols, w)))
+    means = sums / areas
+    bits = (means[:, 1:] > means[:, :-1]).ravel()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+class DecodeCache:
+    """Short-lived LRU of region hash → decoded payload.
+
+    Lookups match any entry within max_distance bits (Hamming distance),
+    since two frames of the same code rarely hash identically.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DECODE_CACHE_TTL,
+        max_entries: int = DECODE_CACHE_SIZE,
+        max_distance: int = DECODE_CACHE_MAX_DISTANCE,
+    ):
+        self._ttl = ttl
+        self._max = max_entries
+        self._max_distance = max_distance
+        self._entries: OrderedDict[int, tuple[str, float]] = OrderedDict()
+        self.hits = 0
+
+    def get(self, key: int, now: float | None = None) -> str | None:
+        if key < 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            for other in self._entries:
+                if (other ^ key).bit_count() <= self._max_distance:
+                    key, entry = other, self._entries[other]
+                    break
+            else:
+                return None
+        now = time.monotonic() if now is None else now
+        payload, expires = entry
+        if now >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, key: int, payload: str, now: float | None = None) -> None:
+        if key < 0:
+            return
+        now = time.monotonic() if now is None else now
+        self._entries[key] = (payload, now + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _finder_hits(dark: np.ndarray) -> int:
+    """Number of rows in a binary image containing a 1:1:3:1:1 finder run."""
+    hits = 0
+    for row in dark:
+        edges = np.flatnonzero(row[1:] != row[:-1]) + 1
+        if edges.size < 4:
+            continue
+        bounds = np.concatenate(([0], edges, [row.size]))
+        runs = np.diff(bounds).astype(np.float32)
+        starts_dark = row[bounds[:-1]]
+        if runs.size < 5:
+            continue
+        windows = np.lib.stride_tricks.sliding_window_view(runs, 5)
+        module = windows.sum(axis=1) / _FINDER_RATIO.sum()
+        error = np.abs(windows - module[:, None] * _FINDER_RATIO)
+        ok = (error <= module[:, None] * _FINDER_TOLERANCE).all(axis=1)
+        ok &= starts_dark[: ok.size] & (module >= 1.0)
+        if ok.any():
+            hits += 1
+    return hits
+
+
+def _clusters(mask: np.ndarray) -> list[list[tuple[int, int]]]:
+    """4-connected components of True cells in a (small) tile grid."""
+    seen = np.zeros_like(mask, dtype=bool)
+    out = []
+    rows, cols = mask.shape
+    for r0, c0 in zip(*np.nonzero(mask)):
+        if seen[r0, c0]:
+            continue
+        stack = [(r0, c0)]
+        seen[r0, c0] = True
+        cells = []
+        while stack:
+            r, c = stack.pop()
+            cells.append((r, c))
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < rows and 0 <= nc < cols and mask[nr, nc] and not seen[nr, nc]:
+                    seen[nr, nc] = True
+                    stack.append((nr, nc))
+        out.append(cells)
+    return out
+
+
+def find_qr_candidates(
+    gray: np.ndarray,
+    downsample: int = DEFAULT_DOWNSAMPLE,
+    max_regions: int = MAX_REGIONS,
+) -> list[Box]:
+    """Find likely QR code regions in a grayscale frame.
+
+    Returns boxes in full-frame coordinates, best candidates first.
+    """
+    small = _downsample(gray, downsample)
+    th, tw = small.shape[0] // TILE, small.shape[1] // TILE
+    if th == 0 or tw == 0:
+        return []
+    small = small[: th * TILE, : tw * TILE]
+    tiles = small.reshape(th, TILE, tw, TILE)
+
+    # Local contrast and threshold per tile
+    lo = tiles.min(axis=(1, 3))
+    hi = tiles.max(axis=(1, 3))
+    mean = tiles.mean(axis=(1, 3))
+    dark = small < np.repeat(np.repeat(mean, TILE, axis=0), TILE, axis=1)
+
+    # Black/white transitions per tile, horizontally and vertically
+    h_edges = np.zeros_like(dark)
+    h_edges[:, 1:] = dark[:, 1:] != dark[:, :-1]
+    v_edges = np.zeros_like(dark)
+    v_edges[1:, :] = dark[1:, :] != dark[:-1, :]
+    area = TILE * TILE
+    h_density = h_edges.reshape(th, TILE, tw, TILE).sum(axis=(1, 3)) / area
+    v_density = v_edges.reshape(th, TILE, tw, TILE).sum(axis=(1, 3)) / area
+
+    mask = (
+        (hi - lo >= MIN_CONTRAST)
+        & (h_density >= MIN_TRANSITION_DENSITY)
+        & (v_density >= MIN_TRANSITION_DENSITY)
+    )
+    if not mask.any():
+        return []
+
+    scored = []
+    for cells in _clusters(mask):
+        if len(cells) < MIN_CLUSTER_TILES:
+            continue
+        rs = [r for r, _ in cells]
+        cs = [c for _, c in cells]
+        pad = CLUSTER_PAD_TILES
+        r0, r1 = max(min(rs) - pad, 0), min(max(rs) + 1 + pad, th)
+        c0, c1 = max(min(cs) - pad, 0), min(max(cs) + 1 + pad, tw)
+        patch = dark[r0 * TILE: r1 * TILE, c0 * TILE: c1 * TILE]
+        score = _finder_hits(patch) + _finder_hits(patch.T)
+        scale = TILE * max(downsample, 1)
+        box = (int(c0) * scale, int(r0) * scale, int(c1) * scale, int(r1) * scale)
+        scored.append((score, len(cells), box))
+
+    scored.sort(key=lambda s: (s[0], s[1]), reverse=True)
+    return [box for _score, _n, box in scored[:max_regions]]
+
+
+class ContinuousQRScanner:
+    """Background webcam QR scanner with candidate-region decoding."""
+
+    def __init__(
+        self,
+        camera: CameraBackend,
+        on_result: Callable[[str], None],
+        decoder: Callable[[np.ndarray], str | None] | None = None,
+        downsample: int = DEFAULT_DOWNSAMPLE,
+        repeat_after: float = 3.0,
+        max_fps: float = 15.0,
+    ):
+        self._camera = camera
+        self._on_result = on_result
+        self._decoder = decoder
+        self._downsample = downsample
+        self._repeat_after = repeat_after
+        self._frame_interval = 1.0 / max_fps if max_fps else 0.0
+
+        self._cond = threading.Condition()
+        self._frame: np.ndarray | None = None
+        self._running = False
+        self.paused = False
+        self._threads: list[threading.Thread] = []
+
+        self._last_payload: str | None = None
+        self._last_payload_at = 0.0
+        self._cache = DecodeCache()
+
+        # Stats
+        self._started_at = 0.0
+        self.frames = 0
+        self.scans = 0
+        self.skipped = 0
+        self.regions = 0
+        self.decoded = 0
+        self._since_full = 0
+        self._capture_cpu_s = 0.0
+        self._decode_cpu_s = 0.0
+        self._scan_times: deque[float] = deque(maxlen=64)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        if self._decoder is None:
+            from scouterhud.camera.qr_decoder import scan_qr_gray
+
+            self._decoder = scan_qr_gray
+        self._running = True
+        self._started_at = time.monotonic()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="qr-capture", daemon=True),
+            threading.Thread(target=self._decode_loop, name="qr-decode", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self) -> None:
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout=2.0)
+        self._threads = []
+
+    # ── Threads ──
+
+    def _capture_loop(self) -> None:
+        cpu0 = time.thread_time()
+        next_frame = time.monotonic()
+        while self._running:
+            if self.paused:
+                time.sleep(0.1)
+                continue
+            # Webcams block in read() at their own rate; this caps file/fast sources
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_frame = max(next_frame + self._frame_interval, time.monotonic())
+            try:
+                gray = self._camera.capture_gray()
+            except Exception as e:
+                log.warning(f"Camera capture failed: {e}")
+                time.sleep(0.5)
+                continue
+            with self._cond:
+                if self._frame is not None:
+                    self.skipped += 1  # decoder still busy with an older frame
+                self._frame = gray
+                self.frames += 1
+                self._cond.notify()
+            cpu1 = time.thread_time()
+            self._capture_cpu_s += cpu1 - cpu0
+            cpu0 = cpu1
+
+    def _decode_loop(self) -> None:
+        while self._running:
+            with self._cond:
+                self._cond.wait_for(lambda: self._frame is not None or not self._running)
+                frame, self._frame = self._frame, None
+            if frame is None:
+                continue
+            cpu0 = time.thread_time()
+            payload = self._scan(frame)
+            self._decode_cpu_s += time.thread_time() - cpu0
+            self._scan_times.append(time.monotonic())
+            if payload:
+                self._report(payload)
+
+    # ── Scanning ──
+
+    def _scan(self, gray: np.ndarray) -> str | None:
+        """Decode candidate regions of one frame (full frame as a periodic fallback)."""
+        self.scans += 1
+        boxes = find_qr_candidates(gray, self._downsample)
+        self.regions += len(boxes)
+        for left, top, right, bottom in boxes:
+            region = gray[top:bottom, left:right]
+            key = region_hash(region)
+            payload = self._cache.get(key)
+            if payload is None:
+                payload = self._decoder(region)
+                if payload:
+                    self._cache.put(key, payload)
+            if payload:
+                self._since_full = 0
+                return payload
+
+        self._since_full += 1
+        if self._since_full >= FULL_FRAME_EVERY:
+            self._since_full = 0
+            return self._decoder(gray)
+        return None
+
+    def _report(self, payload: str) -> None:
+        now = time.monotonic()
+        if payload == self._last_payload and now - self._last_payload_at < self._repeat_after:
+            self._last_payload_at = now
+            return
+        self._last_payload = payload
+        self._last_payload_at = now
+        self.decoded += 1
+        log.info(f"QR scanned: {payload[:80]}")
+        self._on_result(payload)
+
+    def stats(self) -> dict:
+        """Scans/s (recent), capture fps, scanner CPU share and counters."""
+        now = time.monotonic()
+        elapsed = max(now - self._started_at, 1e-6) if self._started_at else 0.0
+        times = list(self._scan_times)
+        recent = [t for t in times if now - t <= 5.0]
+        cpu_s = self._capture_cpu_s + self._decode_cpu_s
+        return {
+            "scans_per_s": round(len(recent) / 5.0, 2),
+            "frames_per_s": round(self.frames / elapsed, 2) if elapsed else 0.0,
+            "cpu_pct": round(100.0 * cpu_s / elapsed, 1) if elapsed else 0.0,
+            "frames": self.frames,
+            "scans": self.scans,
+            "skipped": self.skipped,
+            "regions": self.regions,
+            "decoded": self.decoded,
+            "cache_hits": self._cache.hits,
+        }
@@ -3,8 +3,16 @@
 All rendering goes through this ABC. Concrete backends:
 - DesktopBackend (pygame) for development on laptop/PC
 - SPIBackend (ST7789) for Raspberry Pi hardware (future)
+
+Many frames repeat (static SCANNING / ERROR / CONNECTING screens are
+re-rendered on every tick). Backends call _is_repeat() at the top of
+show(): a CRC-32 of the raw pixels is compared with the last full frame
+sent, and a repeat is dropped before any resize, conversion or transfer.
+Partial writes and clear() change the screen behind the fingerprint, so
+they call _invalidate_frame().
 """
 
+import zlib
 from abc import ABC, abstractmethod
 
 from PIL import Image
@@ -14,17 +22,59 @@ from PIL import Image
 DISPLAY_WIDTH = 240
 DISPLAY_HEIGHT = 240
 
+# Screen rectangle (x0, y0, x1, y1), right/bottom exclusive like PIL crop()
+Box = tuple[int, int, int, int]
+FULL_SCREEN: Box = (0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+
 
 class DisplayBackend(ABC):
 
+    # Fingerprint of the last full frame sent (None: screen changed since)
+    _last_crc: int | None = None
+    frames_shown = 0
+    frames_skipped = 0
+
     @abstractmethod
     def show(self, image: Image.Image) -> None:
         """Render a PIL Image to the display."""
 
+    def show_region(self, image: Image.Image, box: Box) -> None:
+        """Update only the box region of the display from a full-size image.
+
+        Backends that can't write a partial window redraw the whole frame.
+        """
+        self.show(image)
+
+    def show_regions(self, image: Image.Image, boxes: list[Box]) -> None:
+        """Update several regions of the display from one full-size image."""
+        for box in boxes:
+            self.show_region(image, box)
+
     @abstractmethod
     def set_brightness(self, level: int) -> None:
         """Set brightness (0-255). Not all backends support this."""
 
+    def stats(self) -> dict[str, int]:
+        """Transfer counters for perf stats."""
+        return {"frames_shown": self.frames_shown, "frames_skipped": self.frames_skipped}
+
+    def _is_repeat(self, image: Image.Image) -> bool:
+        """True if image is pixel-identical to the last full frame sent.
+
+        Otherwise it becomes the new last frame (the caller must send it).
+        """
+        crc = zlib.crc32(image.tobytes(), zlib.crc32(f"{image.mode}{image.size}".encode()))
+        if crc == self._last_crc:
+            self.frames_skipped += 1
+            return True
+        self._last_crc = crc
+        self.frames_shown += 1
+        return False
+
+    def _invalidate_frame(self) -> None:
+        """The screen no longer shows the last full frame (partial write, clear)."""
+        self._last_crc = None
+
     @abstractmethod
     def clear(self) -> None:
         """Clear the display to black."""
@@ -27,6 +27,10 @@ class DesktopBackend(DisplayBackend):
         self.clear()
 
     def show(self, image: Image.Image) -> None:
+        if self._is_repeat(image):
+            self._pump_events()
+            return
+
         # Ensure correct size
         if image.size != (DISPLAY_WIDTH, DISPLAY_HEIGHT):
             image = image.resize((DISPLAY_WIDTH, DISPLAY_HEIGHT))
@@ -45,8 +49,10 @@ class DesktopBackend(DisplayBackend):
         surface = pygame.image.frombuffer(raw, scaled.size, "RGB")
         self.screen.blit(surface, (0, 0))
         pygame.display.flip()
+        self._pump_events()
 
-        # Process pygame events to keep window responsive
+    def _pump_events(self) -> None:
+        """Process pygame events to keep the window responsive."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 raise KeyboardInterrupt("Window closed")
@@ -57,6 +63,7 @@ class DesktopBackend(DisplayBackend):
     def clear(self) -> None:
         self.screen.fill((0, 0, 0))
         pygame.display.flip()
+        self._invalidate_frame()
 
     def close(self) -> None:
         pygame.quit()
@@ -9,7 +9,7 @@ from pathlib import Path
 
 from PIL import Image
 
-from scouterhud.display.backend import DisplayBackend, DISPLAY_WIDTH, DISPLAY_HEIGHT
+from scouterhud.display.backend import Box, DisplayBackend, DISPLAY_WIDTH, DISPLAY_HEIGHT
 
 
 class PreviewBackend(DisplayBackend):
@@ -25,9 +25,21 @@ class PreviewBackend(DisplayBackend):
 
     def show(self, image: Image.Image) -> None:
         now = time.monotonic()
-        if now - self._last_write < self._min_interval:
+        if now - self._last_write < self._min_interval or self._is_repeat(image):
             return
+        self._write(image, now)
 
+    def show_region(self, image: Image.Image, box: Box) -> None:
+        # Partial updates are only sent when something changed (a keypress),
+        # so they bypass the fps limit instead of being dropped
+        self._invalidate_frame()
+        self._write(image, time.monotonic())
+
+    def show_regions(self, image: Image.Image, boxes: list[Box]) -> None:
+        self._invalidate_frame()
+        self._write(image, time.monotonic())
+
+    def _write(self, image: Image.Image, now: float) -> None:
         if image.size != (DISPLAY_WIDTH, DISPLAY_HEIGHT):
             image = image.resize((DISPLAY_WIDTH, DISPLAY_HEIGHT))
 
@@ -46,6 +58,7 @@ class PreviewBackend(DisplayBackend):
     def clear(self) -> None:
         img = Image.new("RGB", (DISPLAY_WIDTH * 3, DISPLAY_HEIGHT * 3), (0, 0, 0))
         img.save(str(self._output_path))
+        self._invalidate_frame()
 
     def close(self) -> None:
         pass
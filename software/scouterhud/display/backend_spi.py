@@ -12,6 +12,13 @@ Default wiring (Pi Zero 2W → Seengreat ST7789 8-pin JST):
     DC   → Pin 22 (GPIO 25)
     CS   → Pin 24 (GPIO 8  — SPI0 CE0)
     BL   → Pin 18 (GPIO 24 — PWM)
+
+Black is transparent on the beam splitter, so a HUD frame is mostly
+black. Full frames are split into row bands of BAND_ROWS; a band that is
+black now and was black in the frame already on the panel is not sent.
+The remaining bands go out as one windowed write per run of adjacent
+bands. The backend tracks which bands are known black on the panel
+(none after init, all after clear(), updated by every write).
 """
 
 import time
@@ -21,7 +28,16 @@ import spidev
 from gpiozero import DigitalOutputDevice, PWMOutputDevice
 from PIL import Image
 
-from scouterhud.display.backend import DISPLAY_HEIGHT, DISPLAY_WIDTH, DisplayBackend
+from scouterhud.display.backend import Box, DISPLAY_HEIGHT, DISPLAY_WIDTH, DisplayBackend
+
+# Rows per band for black skipping (240 / 8 = 30 bands)
+BAND_ROWS = 8
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """[start, end) index pairs of the runs of True in a 1-D bool array."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
 
 
 class SPIBackend(DisplayBackend):
@@ -70,6 +86,12 @@ class SPIBackend(DisplayBackend):
         # Pre-allocate clear buffer (all zeros = black in RGB565)
         self._clear_buf = b'\x00' * (self._w * self._h * 2)
 
+        # Bands known to be black on the panel (panel RAM is random after init)
+        self._bands = -(-self._h // BAND_ROWS)
+        self._band_black = np.zeros(self._bands, dtype=bool)
+        self.bytes_sent = 0
+        self.bands_skipped = 0
+
         self._init_display()
 
     def _write_cmd(self, cmd: int) -> None:
@@ -163,19 +185,73 @@ class SPIBackend(DisplayBackend):
 
     def show(self, image: Image.Image) -> None:
         """Send a PIL Image to the ST7789 display via SPI."""
+        if self._is_repeat(image):
+            return
+        img = self._prepare(image)
+        if self._mirror:
+            img = img.transpose(Image.FLIP_LEFT_RIGHT)
+
+        pixels = self._to_rgb565(img)
+        # Pad to whole bands so the band test is one reshape + any()
+        padded = np.zeros((self._bands * BAND_ROWS, self._w), dtype=pixels.dtype)
+        padded[: self._h] = pixels
+        black = ~padded.reshape(self._bands, -1).any(axis=1)
+        send = ~(black & self._band_black)
+        self._band_black = black
+        self.bands_skipped += self._bands - int(np.count_nonzero(send))
+
+        for b0, b1 in _runs(send):
+            y0, y1 = b0 * BAND_ROWS, min(b1 * BAND_ROWS, self._h)
+            self._set_window(0, y0, self._w, y1)
+            self._write_pixels(pixels[y0:y1].tobytes())
+
+    def show_region(self, image: Image.Image, box: Box) -> None:
+        """Send only the box region of a full-size image (windowed RAM write)."""
+        self._invalidate_frame()
+        self._write_region(self._prepare(image), box)
+
+    def show_regions(self, image: Image.Image, boxes: list[Box]) -> None:
+        """Windowed writes for several boxes, converting the image once."""
+        self._invalidate_frame()
+        img = self._prepare(image)
+        for box in boxes:
+            self._write_region(img, box)
+
+    def _write_region(self, img: Image.Image, box: Box) -> None:
+        x0, y0, x1, y1 = box
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self._w, x1), min(self._h, y1)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        region = img.crop((x0, y0, x1, y1))
+        if self._mirror:
+            region = region.transpose(Image.FLIP_LEFT_RIGHT)
+            x0, x1 = self._w - x1, self._w - x0
+
+        pixels = self._to_rgb565(region)
+        if pixels.any():
+            self._band_black[y0 // BAND_ROWS : -(-y1 // BAND_ROWS)] = False
+        self._set_window(x0, y0, x1, y1)
+        self._write_pixels(pixels.tobytes())
+
+    def _prepare(self, image: Image.Image) -> Image.Image:
         img = image.convert("RGB")
         if img.size != (self._w, self._h):
             img = img.resize((self._w, self._h), Image.NEAREST)
-        if self._mirror:
-            img = img.transpose(Image.FLIP_LEFT_RIGHT)
+        return img
 
+    @staticmethod
+    def _to_rgb565(img: Image.Image) -> np.ndarray:
+        """(height, width) big-endian RGB565 array."""
         arr = np.asarray(img, dtype=np.uint16)
         r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
         rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-        buf = rgb565.astype('>u2').tobytes()
+        return rgb565.astype('>u2')
 
-        self._set_window(0, 0, self._w, self._h)
+    def _write_pixels(self, buf: bytes) -> None:
         self._dc.on()
+        self.bytes_sent += len(buf)
         for i in range(0, len(buf), 4096):
             self._spi.writebytes2(buf[i : i + 4096])
 
@@ -187,9 +263,17 @@ class SPIBackend(DisplayBackend):
     def clear(self) -> None:
         """Clear display to black."""
         self._set_window(0, 0, self._w, self._h)
-        self._dc.on()
-        for i in range(0, len(self._clear_buf), 4096):
-            self._spi.writebytes2(self._clear_buf[i : i + 4096])
+        self._write_pixels(self._clear_buf)
+        self._band_black[:] = True
+        self._invalidate_frame()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **super().stats(),
+            "bytes_sent": self.bytes_sent,
+            "bands_skipped": self.bands_skipped,
+            "bands_black": int(np.count_nonzero(self._band_black)),
+        }
 
     def close(self) -> None:
         """Clear display and release resources."""
@@ -0,0 +1,524 @@
+"""Declarative device layouts, compiled into render plans.
+
+A layout describes where each data field goes on the 240x240 screen:
+
+    {
+        "name": "medical",
+        "match": "medical.*",            # fnmatch on device type ("auto" layouts)
+        "widgets": [
+            {"kind": "big",   "field": "spo2", "label": "SpO2", "unit": "%",
+             "x": 4, "y": 34, "color": "threshold"},
+            {"kind": "small", "field": "resp_rate", "label": "Resp", "unit": " rpm",
+             "x": 4, "y": 89},
+            {"kind": "chart", "field": "spo2", "label": "SpO2", "x": 4, "y": 129,
+             "w": 112, "h": 60, "color": "cyan"},
+            {"kind": "status"},
+        ],
+    }
+
+Widget kinds:
+  big / small  value with label (+ unit). color: a color name, "threshold"
+               (schema alert bands, see telemetry/thresholds.py) or a map
+               {value: color name, "*": fallback}. format: "${}" style.
+  text         bare value (font: large/medium/small/tiny)
+  codes        list of codes (e.g. DTCs) with label; drawn only when non-empty
+  chart        trend chart from the history store (skipped without one)
+  fields       every data key as label/value rows (the generic layout)
+  status       bottom status bar. field (default "status") or text, alerts
+               (default "alerts", null to disable), count (alert count
+               field), ok/alert (status text without/with alerts)
+
+Where a layout comes from, per device:
+  1. $meta "layout" as an inline dict
+  2. $meta "layout" as a name: a registered layout (see load_layout_dir)
+  3. "auto": the first registered, then built-in, layout whose match
+     pattern fits the device type
+  4. otherwise a layout generated from the device schema, or the generic
+     key/value list when there is no schema
+
+Each layout is compiled once per device name/type into a RenderPlan: a
+static layer (header, labels) rendered once, and a list of closures with
+positions, fonts and colors already resolved. Rendering a frame copies the
+static layer and runs the closures.
+"""
+
+import fnmatch
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from PIL import Image, ImageDraw
+
+from scouterhud.display.backend import DISPLAY_HEIGHT, DISPLAY_WIDTH
+from scouterhud.display.widgets import (
+    BLACK, CYAN, DIM, GREEN, ORANGE, RED, WHITE, YELLOW,
+    SIZE_LARGE, SIZE_MEDIUM, SIZE_SMALL, SIZE_TINY,
+    draw_header,
+    draw_mini_chart,
+    draw_status_bar,
+    field_color,
+    get_font,
+)
+
+if TYPE_CHECKING:
+    from scouterhud.qrlink.protocol import DeviceLink
+    from scouterhud.telemetry.history import HistoryStore
+
+log = logging.getLogger(__name__)
+
+# Trend charts: 10 s buckets, one per 2 px of chart width (~9 min)
+TREND_STEP = 10.0
+TREND_POINTS = 56
+
+# Compiled plans kept (one per device layout/name/type)
+MAX_PLANS = 32
+
+COLORS = {
+    "white": WHITE, "green": GREEN, "yellow": YELLOW, "red": RED,
+    "cyan": CYAN, "orange": ORANGE, "dim": DIM,
+}
+FONT_SIZES = {"large": SIZE_LARGE, "medium": SIZE_MEDIUM, "small": SIZE_SMALL, "tiny": SIZE_TINY}
+
+# Header height (draw_header) and status bar position
+CONTENT_Y = 34
+STATUS_Y = 215
+
+# (draw, data, link, history) → None
+DrawOp = Callable[[ImageDraw.ImageDraw, dict[str, Any], "DeviceLink", "HistoryStore | None"], None]
+
+
+BUILTIN_LAYOUTS: list[dict[str, Any]] = [
+    {
+        "name": "medical",
+        "match": "medical.*",
+        "widgets": [
+            {"kind": "big", "field": "spo2", "label": "SpO2", "unit": "%", "x": 4, "y": 34, "color": "threshold"},
+            {"kind": "big", "field": "heart_rate", "label": "HR", "unit": "bpm", "x": 124, "y": 34,
+             "color": "threshold"},
+            {"kind": "small", "field": "resp_rate", "label": "Resp", "unit": " rpm", "x": 4, "y": 89},
+            {"kind": "small", "field": "temp_c", "label": "Temp", "unit": "°C", "x": 124, "y": 89},
+            {"kind": "chart", "field": "spo2", "label": "SpO2", "x": 4, "y": 129, "w": 112, "h": 60,
+             "color": "cyan"},
+            {"kind": "chart", "field": "heart_rate", "label": "HR", "x": 124, "y": 129, "w": 112, "h": 60,
+             "color": "orange"},
+            {"kind": "status"},
+        ],
+    },
+    {
+        "name": "vehicle",
+        "match": "vehicle.*",
+        "widgets": [
+            {"kind": "big", "field": "rpm", "label": "RPM", "x": 4, "y": 34, "color": "threshold"},
+            {"kind": "big", "field": "speed_kmh", "label": "km/h", "x": 124, "y": 34, "color": "cyan"},
+            {"kind": "small", "field": "coolant_temp_c", "label": "Coolant", "unit": "°C", "x": 4, "y": 89,
+             "color": "threshold"},
+            {"kind": "small", "field": "fuel_pct", "label": "Fuel", "unit": "%", "x": 124, "y": 89,
+             "color": "threshold"},
+            {"kind": "small", "field": "battery_v", "label": "Battery", "unit": "V", "x": 4, "y": 129},
+            {"kind": "codes", "field": "dtc_codes", "label": "DTC:", "x": 124, "y": 129},
+            {"kind": "status", "alerts": "dtc_codes", "ok": "OK", "alert": "DTC"},
+        ],
+    },
+    {
+        "name": "infra",
+        "match": "infra.*",
+        "widgets": [
+            {"kind": "big", "field": "cpu_pct", "label": "CPU", "unit": "%", "x": 4, "y": 34, "color": "threshold"},
+            {"kind": "big", "field": "mem_pct", "label": "MEM", "unit": "%", "x": 124, "y": 34, "color": "threshold"},
+            {"kind": "small", "field": "disk_pct", "label": "Disk", "unit": "%", "x": 4, "y": 89},
+            {"kind": "small", "field": "monthly_cost_usd", "label": "Cost", "unit": "/mo", "format": "${}",
+             "x": 124, "y": 89, "color": "orange"},
+            {"kind": "text", "field": "instance_id", "x": 4, "y": 129, "font": "tiny", "color": "dim",
+             "default": ""},
+            {"kind": "status", "count": "active_alerts"},
+        ],
+    },
+    {
+        "name": "home",
+        "match": "home.*",
+        "widgets": [
+            {"kind": "big", "field": "temp_c", "label": "Temp", "unit": "°C", "x": 4, "y": 34, "color": "cyan"},
+            {"kind": "big", "field": "target_temp_c", "label": "Target", "unit": "°C", "x": 124, "y": 34,
+             "color": "dim"},
+            {"kind": "small", "field": "humidity_pct", "label": "Humidity", "unit": "%", "x": 4, "y": 89},
+            {"kind": "small", "field": "mode", "label": "Mode", "x": 124, "y": 89, "default": "unknown",
+             "color": {"heating": "orange", "cooling": "cyan", "idle": "dim", "*": "white"}},
+            {"kind": "status", "field": "mode", "default": "unknown", "alerts": None},
+        ],
+    },
+    {
+        "name": "industrial",
+        "match": "industrial.*",
+        "widgets": [
+            {"kind": "big", "field": "pressure_bar", "label": "Pressure", "unit": "bar", "x": 4, "y": 34,
+             "color": "threshold"},
+            {"kind": "small", "field": "temp_c", "label": "Temp", "unit": "°C", "x": 4, "y": 89,
+             "color": "threshold"},
+            {"kind": "small", "field": "cycle_count", "label": "Cycles", "x": 124, "y": 89},
+            {"kind": "status", "alerts": None},
+        ],
+    },
+]
+
+GENERIC_LAYOUT: dict[str, Any] = {
+    "name": "generic",
+    "type_default": "custom",
+    "widgets": [
+        {"kind": "fields", "x": 4, "y": 34},
+        {"kind": "status", "text": "LIVE", "alerts": None},
+    ],
+}
+
+
+# ── Widget compilers ──
+
+def _color_resolver(spec: dict[str, Any], default: str = "white") -> Callable[["DeviceLink", Any], tuple]:
+    color = spec.get("color", default)
+    field = spec.get("field", "")
+    if color == "threshold":
+        return lambda link, value: field_color(link.thresholds, field, value)
+    if isinstance(color, dict):
+        mapping = {str(k): _named_color(v) for k, v in color.items() if k != "*"}
+        fallback = _named_color(color.get("*", "white"))
+        return lambda link, value: mapping.get(str(value), fallback)
+    fixed = _named_color(color)
+    return lambda link, value: fixed
+
+
+def _named_color(name: Any) -> tuple[int, int, int]:
+    if isinstance(name, (list, tuple)) and len(name) == 3:
+        return tuple(int(c) for c in name)
+    try:
+        return COLORS[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown color {name!r}") from None
+
+
+def _font(name: str):
+    try:
+        return get_font(FONT_SIZES[name])
+    except KeyError:
+        raise ValueError(f"Unknown font {name!r}") from None
+
+
+def _value_text(spec: dict[str, Any]) -> Callable[[dict[str, Any]], tuple[Any, str]]:
+    field = spec["field"]
+    default = spec.get("default", "--")
+    fmt = spec.get("format")
+    if fmt:
+        return lambda data: (v := data.get(field, default), fmt.format(v))
+    return lambda data: (v := data.get(field, default), str(v))
+
+
+def _compile_big(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y = int(spec["x"]), int(spec["y"])
+    static.text((x, y), spec.get("label", spec["field"]), fill=DIM, font=get_font(SIZE_TINY))
+    value_of, color_of = _value_text(spec), _color_resolver(spec, "green")
+    unit = spec.get("unit", "")
+    font_value, font_unit = get_font(SIZE_LARGE), get_font(SIZE_SMALL)
+
+    def op(draw, data, link, history):
+        raw, text = value_of(data)
+        draw.text((x, y + 12), text, fill=color_of(link, raw), font=font_value)
+        if unit:
+            draw.text((x + len(text) * 17 + 4, y + 20), unit, fill=DIM, font=font_unit)
+
+    return op
+
+
+def _compile_small(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y = int(spec["x"]), int(spec["y"])
+    static.text((x, y), f"{spec.get('label', spec['field'])}:", fill=DIM, font=get_font(SIZE_TINY))
+    value_of, color_of = _value_text(spec), _color_resolver(spec)
+    unit = spec.get("unit", "")
+    font = get_font(SIZE_MEDIUM)
+
+    def op(draw, data, link, history):
+        raw, text = value_of(data)
+        draw.text((x, y + 12), f"{text}{unit}", fill=color_of(link, raw), font=font)
+
+    return op
+
+
+def _compile_text(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y = int(spec["x"]), int(spec["y"])
+    value_of, color_of = _value_text({"default": "", **spec}), _color_resolver(spec)
+    font = _font(spec.get("font", "small"))
+
+    def op(draw, data, link, history):
+        raw, text = value_of(data)
+        draw.text((x, y), text, fill=color_of(link, raw), font=font)
+
+    return op
+
+
+def _compile_codes(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y = int(spec["x"]), int(spec["y"])
+    field, label, limit = spec["field"], spec.get("label", ""), int(spec.get("max", 3))
+    color = _named_color(spec.get("color", "red"))
+    font_label, font_codes = get_font(SIZE_TINY), get_font(SIZE_SMALL)
+
+    def op(draw, data, link, history):
+        codes = data.get(field)
+        if not codes or not isinstance(codes, list):
+            return
+        if label:
+            draw.text((x, y + 2), label, fill=DIM, font=font_label)
+        draw.text((x, y + 14), " ".join(str(c) for c in codes[:limit]), fill=color, font=font_codes)
+
+    return op
+
+
+def _compile_chart(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y, w, h = int(spec["x"]), int(spec["y"]), int(spec.get("w", 112)), int(spec.get("h", 60))
+    field, label = spec["field"], spec.get("label", spec["field"])
+    color = _named_color(spec.get("color", "cyan"))
+    step, points = float(spec.get("step", TREND_STEP)), int(spec.get("points", TREND_POINTS))
+
+    def op(draw, data, link, history):
+        if history is None:
+            return
+        series = history.series(link.id, field, step=step, points=points)
+        draw_mini_chart(draw, x, y, w, h, series, label, color, link.schema.get(field))
+
+    return op
+
+
+def _compile_fields(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    x, y0 = int(spec.get("x", 4)), int(spec.get("y", CONTENT_Y))
+    max_y = int(spec.get("max_y", 200))
+    skip = frozenset(spec.get("skip", ("ts",)))
+    font_label, font_value, font_more = get_font(SIZE_TINY), get_font(SIZE_MEDIUM), get_font(SIZE_SMALL)
+
+    def op(draw, data, link, history):
+        y = y0
+        for key, value in data.items():
+            if key in skip:
+                continue
+            if y > max_y:
+                draw.text((x, y), "...", fill=DIM, font=font_more)
+                break
+            draw.text((x, y), f"{key}:", fill=DIM, font=font_label)
+            draw.text((x, y + 12), str(value), fill=WHITE, font=font_value)
+            y += 32
+
+    return op
+
+
+def _compile_status(spec, static: ImageDraw.ImageDraw) -> DrawOp:
+    y = int(spec.get("y", STATUS_Y))
+    text = spec.get("text")
+    field = spec.get("field", "status")
+    default = spec.get("default", "unknown")
+    alerts_field = spec.get("alerts", "alerts")
+    count_field = spec.get("count")
+    ok_text, alert_text = spec.get("ok"), spec.get("alert")
+
+    def op(draw, data, link, history):
+        if count_field:
+            n = data.get(count_field, 0)
+            status = "OK" if not n else f"{n} ALERTS"
+            draw_status_bar(draw, y, status, [status] if n else [])
+            return
+        alerts = data.get(alerts_field, []) if alerts_field else []
+        if text is not None:
+            status = text
+        elif alerts and alert_text is not None:
+            status = alert_text
+        elif not alerts and ok_text is not None:
+            status = ok_text
+        else:
+            status = str(data.get(field, default))
+        draw_status_bar(draw, y, status, alerts if alerts_field else None)
+
+    return op
+
+
+_COMPILERS: dict[str, Callable[[dict[str, Any], ImageDraw.ImageDraw], DrawOp]] = {
+    "big": _compile_big,
+    "small": _compile_small,
+    "text": _compile_text,
+    "codes": _compile_codes,
+    "chart": _compile_chart,
+    "fields": _compile_fields,
+    "status": _compile_status,
+}
+
+
+# ── Plans ──
+
+class RenderPlan:
+    """A compiled layout: static layer + draw closures."""
+
+    __slots__ = ("name", "static", "ops", "_refs")
+
+    def __init__(self, name: str, static: Image.Image, ops: list[DrawOp], refs: tuple = ()):
+        self.name = name
+        self.static = static
+        self.ops = ops
+        self._refs = refs  # objects whose id() is part of the cache key
+
+    def render(
+        self,
+        link: "DeviceLink",
+        data: dict[str, Any],
+        history: "HistoryStore | None" = None,
+    ) -> Image.Image:
+        img = self.static.copy()
+        draw = ImageDraw.Draw(img)
+        for op in self.ops:
+            op(draw, data, link, history)
+        return img
+
+
+def compile_layout(spec: dict[str, Any], name: str, device_type: str, refs: tuple = ()) -> RenderPlan:
+    """Compile a layout spec for one device name/type. Raises ValueError if invalid."""
+    if not isinstance(spec, dict) or not isinstance(spec.get("widgets"), list):
+        raise ValueError("layout needs a 'widgets' list")
+
+    static = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), BLACK)
+    static_draw = ImageDraw.Draw(static)
+    draw_header(static_draw, name, device_type or spec.get("type_default", ""), y=0)
+
+    ops = []
+    for widget in spec["widgets"]:
+        kind = widget.get("kind") if isinstance(widget, dict) else None
+        compiler = _COMPILERS.get(kind)
+        if compiler is None:
+            raise ValueError(f"unknown widget kind {kind!r}")
+        try:
+            ops.append(compiler(widget, static_draw))
+        except KeyError as e:
+            raise ValueError(f"{kind} widget needs {e}") from None
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{kind} widget: {e}") from None
+    return RenderPlan(spec.get("name", "inline"), static, ops, (spec, *refs))
+
+
+def validate_layout(spec: dict[str, Any]) -> None:
+    """Raise ValueError if spec does not compile."""
+    compile_layout(spec, "validate", "")
+
+
+def auto_layout(schema: dict[str, Any]) -> dict[str, Any]:
+    """Layout generated from a device schema (for types without a layout).
+
+    The first two numeric fields are shown big, up to four more small in
+    two columns; enumerated fields (schema "values") are shown as text.
+    """
+    fields = [
+        (name, info) for name, info in schema.items()
+        if isinstance(info, dict) and name not in ("status", "alerts", "ts")
+    ]
+    widgets: list[dict[str, Any]] = []
+    slots_big = [(4, CONTENT_Y), (124, CONTENT_Y)]
+    slots_small = [(4, 89), (124, 89), (4, 129), (124, 129), (4, 169), (124, 169)]
+    for name, info in fields:
+        unit = str(info.get("unit", ""))
+        if slots_big and "values" not in info:
+            x, y = slots_big.pop(0)
+            widgets.append({"kind": "big", "field": name, "label": name, "unit": unit,
+                            "x": x, "y": y, "color": "threshold"})
+        elif slots_small:
+            x, y = slots_small.pop(0)
+            widgets.append({"kind": "small", "field": name, "label": name, "unit": unit,
+                            "x": x, "y": y, "color": "threshold"})
+        else:
+            break
+    widgets.append({"kind": "status"})
+    return {"name": "auto", "widgets": widgets}
+
+
+# ── Registry and cache ──
+
+_registered: dict[str, dict[str, Any]] = {}
+_plans: OrderedDict[tuple, RenderPlan] = OrderedDict()
+_stats = {"compiles": 0, "errors": 0}
+
+
+def register_layouts(specs: list[dict[str, Any]]) -> None:
+    """Add named layouts (local files); they take precedence over built-ins."""
+    for spec in specs:
+        validate_layout(spec)
+        _registered[spec["name"]] = spec
+    _plans.clear()
+
+
+def load_layout_dir(directory: str | Path) -> int:
+    """Register every *.yaml / *.yml / *.json layout in a directory. Returns the count."""
+    specs = []
+    for path in sorted(Path(directory).glob("*")):
+        if path.suffix not in (".yaml", ".yml", ".json"):
+            continue
+        try:
+            text = path.read_text()
+            if path.suffix == ".json":
+                import json
+
+                spec = json.loads(text)
+            else:
+                import yaml
+
+                spec = yaml.safe_load(text)
+            if not isinstance(spec, dict):
+                raise ValueError("expected a mapping")
+            spec.setdefault("name", path.stem)
+            validate_layout(spec)
+        except Exception as e:
+            log.warning(f"Skipping layout {path}: {e}")
+            continue
+        specs.append(spec)
+    register_layouts(specs)
+    log.info(f"Loaded {len(specs)} layouts from {directory}")
+    return len(specs)
+
+
+def _find_layout(link: "DeviceLink") -> tuple[tuple, dict[str, Any], tuple]:
+    """(cache key, spec, objects to keep alive) for a device."""
+    layout = link.layout
+    if isinstance(layout, dict):
+        return ("inline", id(layout)), layout, ()
+    if layout and layout != "auto":
+        spec = _registered.get(layout) or next((s for s in BUILTIN_LAYOUTS if s["name"] == layout), None)
+        if spec is not None:
+            return ("named", layout), spec, ()
+        log.debug(f"Unknown layout {layout!r} for {link.id}, using auto")
+
+    device_type = link.type or ""
+    for spec in (*_registered.values(), *BUILTIN_LAYOUTS):
+        pattern = spec.get("match")
+        if pattern and fnmatch.fnmatch(device_type, pattern):
+            return ("named", spec["name"]), spec, ()
+
+    if link.schema:
+        return ("schema", id(link.schema)), auto_layout(link.schema), (link.schema,)
+    return ("generic",), GENERIC_LAYOUT, ()
+
+
+def plan_for(link: "DeviceLink") -> RenderPlan:
+    """Compiled plan for a device (cached per layout, name and type)."""
+    layout_key, spec, refs = _find_layout(link)
+    name = link.name or link.id
+    key = (layout_key, name, link.type)
+    plan = _plans.get(key)
+    if plan is not None:
+        _plans.move_to_end(key)
+        return plan
+
+    try:
+        plan = compile_layout(spec, name, link.type or "", refs)
+    except ValueError as e:
+        # A bad $meta layout must not take the HUD down: fall back to generic
+        log.warning(f"Invalid layout for {link.id}: {e}")
+        _stats["errors"] += 1
+        plan = compile_layout(GENERIC_LAYOUT, name, link.type or "", refs)
+    _stats["compiles"] += 1
+    _plans[key] = plan
+    if len(_plans) > MAX_PLANS:
+        _plans.popitem(last=False)
+    return plan
+
+
+def stats() -> dict[str, int]:
+    return {"plans": len(_plans), "registered": len(_registered), **_stats}
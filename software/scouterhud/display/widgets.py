@@ -4,8 +4,12 @@ All widgets draw on a PIL Image with black background.
 Black = transparent on the beam splitter, so only colored pixels are visible.
 """
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw, ImageFont
 
+from scouterhud.telemetry.thresholds import FieldBands, ThresholdTable
+
 # Colors (bright for visibility through beam splitter)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 100)
@@ -16,8 +20,27 @@ ORANGE = (255, 140, 0)
 DIM = (80, 80, 80)
 BLACK = (0, 0, 0)
 
+# Threshold level (OK, WARN, ALERT) → color
+LEVEL_COLORS = (GREEN, YELLOW, RED)
+
+
+# Common font sizes (also exposed as FONT_LARGE / FONT_MEDIUM / FONT_SMALL / FONT_TINY)
+SIZE_LARGE = 28
+SIZE_MEDIUM = 18
+SIZE_SMALL = 13
+SIZE_TINY = 10
 
-def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+_FONT_SIZES = {
+    "FONT_LARGE": SIZE_LARGE,
+    "FONT_MEDIUM": SIZE_MEDIUM,
+    "FONT_SMALL": SIZE_SMALL,
+    "FONT_TINY": SIZE_TINY,
+}
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load a font of the given size (cached — each size is read from disk once)."""
     try:
         return ImageFont.truetype(
             "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", size
@@ -26,36 +49,46 @@ def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
-# Pre-load common sizes
-FONT_LARGE = _get_font(28)
-FONT_MEDIUM = _get_font(18)
-FONT_SMALL = _get_font(13)
-FONT_TINY = _get_font(10)
+def __getattr__(name: str):
+    """Load FONT_* constants on first use instead of at import time.
+
+    Importing this module stays cheap on the Pi; the TTF is only read
+    when something actually draws text.
+    """
+    size = _FONT_SIZES.get(name)
+    if size is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    font = get_font(size)
+    globals()[name] = font
+    return font
 
 
 def value_color(
     value: float,
     schema: dict | None = None,
 ) -> tuple[int, int, int]:
-    """Pick color based on value and schema thresholds."""
+    """Pick color based on value and schema thresholds.
+
+    Compiles the field's thresholds on every call; renderers use
+    field_color with the device's precompiled table instead.
+    """
     if not schema:
         return WHITE
+    return LEVEL_COLORS[FieldBands.from_schema(schema).level(value)]
 
-    alert_above = schema.get("alert_above")
-    alert_below = schema.get("alert_below")
-
-    if alert_above is not None and value >= alert_above:
-        return RED
-    if alert_below is not None and value <= alert_below:
-        return RED
 
-    # Warning zone: within 10% of threshold
-    if alert_above is not None and value >= alert_above * 0.9:
-        return YELLOW
-    if alert_below is not None and value <= alert_below * 1.1:
-        return YELLOW
+def field_color(
+    table: ThresholdTable,
+    field: str,
+    value,
+) -> tuple[int, int, int]:
+    """Color for a data field from a precompiled threshold table.
 
-    return GREEN
+    WHITE for non-numeric values and fields without a schema entry.
+    Applies the field's hysteresis, if any.
+    """
+    level = table.display_level(field, value)
+    return WHITE if level is None else LEVEL_COLORS[level]
 
 
 def draw_header(
@@ -67,11 +100,11 @@ def draw_header(
     """Draw device name header. Returns next y position."""
     # Device name (truncate if too long)
     display_name = name[:22] if len(name) > 22 else name
-    draw.text((4, y + 2), display_name, fill=CYAN, font=FONT_SMALL)
+    draw.text((4, y + 2), display_name, fill=CYAN, font=get_font(SIZE_SMALL))
 
     # Type badge
     type_short = device_type.split(".")[-1] if device_type else ""
-    draw.text((4, y + 18), type_short, fill=DIM, font=FONT_TINY)
+    draw.text((4, y + 18), type_short, fill=DIM, font=get_font(SIZE_TINY))
 
     # Separator line
     draw.line([(0, y + 30), (240, y + 30)], fill=DIM, width=1)
@@ -90,10 +123,10 @@ def draw_big_value(
     width: int = 110,
 ) -> None:
     """Draw a large value with label above and unit beside."""
-    draw.text((x, y), label, fill=DIM, font=FONT_TINY)
-    draw.text((x, y + 12), value, fill=color, font=FONT_LARGE)
+    draw.text((x, y), label, fill=DIM, font=get_font(SIZE_TINY))
+    draw.text((x, y + 12), value, fill=color, font=get_font(SIZE_LARGE))
     if unit:
-        draw.text((x + len(value) * 17 + 4, y + 20), unit, fill=DIM, font=FONT_SMALL)
+        draw.text((x + len(value) * 17 + 4, y + 20), unit, fill=DIM, font=get_font(SIZE_SMALL))
 
 
 def draw_small_value(
@@ -106,8 +139,8 @@ def draw_small_value(
     color: tuple = WHITE,
 ) -> None:
     """Draw a compact key-value pair."""
-    draw.text((x, y), f"{label}:", fill=DIM, font=FONT_TINY)
-    draw.text((x, y + 12), f"{value}{unit}", fill=color, font=FONT_MEDIUM)
+    draw.text((x, y), f"{label}:", fill=DIM, font=get_font(SIZE_TINY))
+    draw.text((x, y + 12), f"{value}{unit}", fill=color, font=get_font(SIZE_MEDIUM))
 
 
 def draw_status_bar(
@@ -122,10 +155,10 @@ def draw_status_bar(
     if alerts:
         alert_text = " ".join(alerts)
         draw.rectangle([(0, y + 2), (240, y + 20)], fill=(80, 0, 0))
-        draw.text((4, y + 4), f"ALERT: {alert_text}", fill=RED, font=FONT_SMALL)
+        draw.text((4, y + 4), f"ALERT: {alert_text}", fill=RED, font=get_font(SIZE_SMALL))
     else:
         color = GREEN if status in ("stable", "running", "idle") else YELLOW
-        draw.text((4, y + 4), status.upper(), fill=color, font=FONT_SMALL)
+        draw.text((4, y + 4), status.upper(), fill=color, font=get_font(SIZE_SMALL))
 
 
 def draw_alert_flash(
@@ -136,3 +169,122 @@ def draw_alert_flash(
     """Draw a red border flash for critical alerts."""
     for i in range(3):
         draw.rectangle([(i, i), (width - 1 - i, height - 1 - i)], outline=RED)
+
+
+def draw_alert_banner(
+    draw: ImageDraw.ImageDraw,
+    title: str,
+    text: str,
+    width: int = 240,
+) -> None:
+    """Draw an interrupt banner over the header (alert on another device)."""
+    draw.rectangle([(0, 0), (width - 1, 30)], fill=(80, 0, 0), outline=RED)
+    draw.text((4, 2), title[:30], fill=WHITE, font=get_font(SIZE_SMALL))
+    draw.text((4, 18), text[:36], fill=RED, font=get_font(SIZE_TINY))
+
+
+def sparkline_segments(
+    values,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    vmin: float | None = None,
+    vmax: float | None = None,
+) -> list[list[tuple[float, float]]]:
+    """Screen polylines for a series, split at NaN gaps.
+
+    values are spread over width (oldest left) and scaled to
+    [vmin, vmax] (default: the series' own range) inside height.
+    """
+    # numpy is only needed once a chart is drawn
+    import numpy as np
+
+    v = np.asarray(values, dtype=np.float32)
+    n = len(v)
+    finite = np.isfinite(v)
+    if n == 0 or not finite.any():
+        return []
+
+    lo = float(np.nanmin(v)) if vmin is None else vmin
+    hi = float(np.nanmax(v)) if vmax is None else vmax
+    span = hi - lo if hi > lo else 1.0
+
+    xs = x + np.linspace(0, width - 1, n) if n > 1 else np.array([x + width - 1.0])
+    norm = np.clip((v - lo) / span, 0.0, 1.0)
+    if hi <= lo:
+        norm = np.full(n, 0.5, dtype=np.float32)  # flat line mid-height
+    ys = y + (height - 1) * (1.0 - norm)
+
+    # Runs of consecutive finite samples
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], finite, [False])).astype(np.int8)))
+    segments = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        segments.append(list(zip(xs[start:end].tolist(), ys[start:end].tolist())))
+    return segments
+
+
+def draw_sparkline(
+    draw: ImageDraw.ImageDraw,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    values,
+    color: tuple = CYAN,
+    vmin: float | None = None,
+    vmax: float | None = None,
+) -> None:
+    """Draw a series as a line (no axes), with a dot on the newest point."""
+    segments = sparkline_segments(values, x, y, width, height, vmin, vmax)
+    for segment in segments:
+        if len(segment) > 1:
+            draw.line(segment, fill=color, width=1)
+        else:
+            draw.point(segment, fill=color)
+    if segments:
+        lx, ly = segments[-1][-1]
+        draw.rectangle([(lx - 1, ly - 1), (lx + 1, ly + 1)], fill=color)
+
+
+def draw_mini_chart(
+    draw: ImageDraw.ImageDraw,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    values,
+    label: str,
+    color: tuple = CYAN,
+    schema: dict | None = None,
+) -> None:
+    """Framed sparkline with label, min/max and schema alert thresholds."""
+    import numpy as np
+
+    draw.rectangle([(x, y), (x + width - 1, y + height - 1)], outline=DIM)
+    draw.text((x + 3, y + 1), label, fill=DIM, font=get_font(SIZE_TINY))
+
+    v = np.asarray(values, dtype=np.float32)
+    if not np.isfinite(v).any():
+        draw.text((x + 3, y + height // 2 - 5), "no data", fill=DIM, font=get_font(SIZE_TINY))
+        return
+
+    lo, hi = float(np.nanmin(v)), float(np.nanmax(v))
+    thresholds = []
+    if schema:
+        thresholds = [t for t in (schema.get("alert_above"), schema.get("alert_below"))
+                      if isinstance(t, (int, float))]
+    # Scale includes the alert thresholds, so a trend shows how close it is
+    for t in thresholds:
+        lo, hi = min(lo, t), max(hi, t)
+
+    cx, cy, cw, ch = x + 2, y + 13, width - 4, height - 15
+    span = hi - lo if hi > lo else 1.0
+    for t in thresholds:
+        ty = cy + (ch - 1) * (1.0 - (t - lo) / span)
+        draw.line([(cx, ty), (cx + cw - 1, ty)], fill=(100, 20, 20), width=1)
+
+    draw_sparkline(draw, cx, cy, cw, ch, v, color, lo, hi)
+
+    scale = f"{lo:.3g}-{hi:.3g}" if hi > lo else f"{lo:.3g}"
+    draw.text((x + width - 3 - len(scale) * 6, y + 1), scale, fill=DIM, font=get_font(SIZE_TINY))
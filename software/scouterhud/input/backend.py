@@ -1,17 +1,24 @@
 """Abstract base class for input backends.
 
 Each backend (keyboard, Gauntlet BLE, voice) implements this interface.
-The InputManager polls all backends and merges events into one queue.
+Backends that receive input on their own thread push events into the
+InputManager's EventBus via _emit(); the rest are polled each frame.
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from scouterhud.input.events import InputEvent
 
+if TYPE_CHECKING:
+    from scouterhud.input.event_bus import EventBus
+
 
 class InputBackend(ABC):
     """Base class for all input sources."""
 
+    _bus: "EventBus | None" = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -37,3 +44,17 @@ class InputBackend(ABC):
     def is_available(self) -> bool:
         """Whether this backend is currently connected/available."""
         return True
+
+    def attach_bus(self, bus: "EventBus") -> None:
+        """Route events emitted from background threads into a shared bus."""
+        self._bus = bus
+
+    def _emit(self, event: InputEvent) -> None:
+        """Deliver an event: to the attached bus, or to the local queue for poll().
+
+        Backends calling this must define self._queue for standalone use.
+        """
+        if self._bus is not None:
+            self._bus.push(event, self.name)
+        else:
+            self._queue.append(event)
@@ -0,0 +1,53 @@
+"""Coalescing of repeated navigation and digit events.
+
+Holding a d-pad button on the phone sends up to 30 events per second.
+Handling each one separately means a device-list broadcast or a device
+switch per event. coalesce() merges runs of identical navigation/rotary
+events from the same source into one event with `count` set to the run
+length, so the handler applies the net movement once.
+
+Only identical consecutive events are merged. Opposite directions are not
+cancelled against each other: the device list and the PIN cursor clamp at
+their ends, so UP×3 + DOWN×1 is not always the same as UP×2.
+"""
+
+from scouterhud.input.events import EventType, InputEvent
+
+# Events that only move a cursor/value and can be applied N times at once.
+# Direct digits (DIGIT_0..9), CONFIRM, QRLINK etc. are never merged.
+COALESCABLE = frozenset({
+    EventType.NAV_UP,
+    EventType.NAV_DOWN,
+    EventType.NAV_LEFT,
+    EventType.NAV_RIGHT,
+    EventType.DIGIT_UP,
+    EventType.DIGIT_DOWN,
+    EventType.DIGIT_NEXT,
+    EventType.DIGIT_PREV,
+    EventType.NEXT_DEVICE,
+    EventType.PREV_DEVICE,
+})
+
+
+def coalesce(events: list[InputEvent]) -> list[InputEvent]:
+    """Merge runs of identical coalescable events into one event with a count.
+
+    The merged event keeps the first event's timestamp and trace, so
+    latency is measured from the oldest input in the run.
+    """
+    if len(events) < 2:
+        return events
+
+    out: list[InputEvent] = []
+    for event in events:
+        prev = out[-1] if out else None
+        if (
+            prev is not None
+            and event.type in COALESCABLE
+            and event.type == prev.type
+            and event.source == prev.source
+        ):
+            prev.count += event.count
+            continue
+        out.append(event)
+    return out
@@ -0,0 +1,135 @@
+"""Thread-safe event bus shared by all input backends.
+
+Backends that receive input on their own thread (phone WebSocket, Gauntlet
+BLE, stdin reader) push events here as they arrive. The main loop blocks on
+the bus with a timeout and drains everything pending once per frame, so a
+burst of taps is handled in one go instead of one event per loop tick.
+
+Each source gets its own bounded queue. drain() takes events round-robin
+across sources, so a chatty backend cannot starve the others.
+
+Events are stamped with trace["dequeued"] when handed to the main loop,
+for input-to-display latency tracing.
+"""
+
+import threading
+import time
+from collections import deque
+
+from scouterhud.input.events import InputEvent
+
+# Per-source queue limit (oldest events are dropped when full)
+DEFAULT_MAX_PER_SOURCE = 64
+
+# Upper bound of events handed out by a single drain()
+DEFAULT_MAX_DRAIN = 64
+
+
+class _SourceStats:
+    """Counters for one event source."""
+
+    __slots__ = ("pushed", "drained", "dropped", "max_depth")
+
+    def __init__(self):
+        self.pushed = 0
+        self.drained = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+
+class EventBus:
+    """Multi-producer, single-consumer event queue with per-source fairness."""
+
+    def __init__(self, max_per_source: int = DEFAULT_MAX_PER_SOURCE):
+        self._max_per_source = max_per_source
+        self._cond = threading.Condition()
+        self._queues: dict[str, deque[InputEvent]] = {}
+        self._stats: dict[str, _SourceStats] = {}
+        self._count = 0
+        self._next_source = 0  # round-robin start position
+
+    def push(self, event: InputEvent, source: str | None = None) -> None:
+        """Add an event (safe to call from any thread)."""
+        key = source or event.source or "unknown"
+        with self._cond:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = deque()
+                self._queues[key] = queue
+                self._stats[key] = _SourceStats()
+            stats = self._stats[key]
+
+            if len(queue) >= self._max_per_source:
+                queue.popleft()
+                stats.dropped += 1
+                self._count -= 1
+
+            queue.append(event)
+            self._count += 1
+            stats.pushed += 1
+            stats.max_depth = max(stats.max_depth, len(queue))
+            self._cond.notify()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until at least one event is pending or the timeout expires.
+
+        Returns True if events are pending.
+        """
+        with self._cond:
+            if self._count == 0:
+                self._cond.wait_for(lambda: self._count > 0, timeout=timeout)
+            return self._count > 0
+
+    def pop(self) -> InputEvent | None:
+        """Take the next event (round-robin across sources), or None."""
+        events = self.drain(max_events=1)
+        return events[0] if events else None
+
+    def drain(self, max_events: int = DEFAULT_MAX_DRAIN) -> list[InputEvent]:
+        """Take up to max_events pending events, one per source per round."""
+        out: list[InputEvent] = []
+        with self._cond:
+            if self._count == 0:
+                return out
+
+            keys = list(self._queues)
+            n = len(keys)
+            start = self._next_source % n
+            order = keys[start:] + keys[:start]
+
+            while self._count > 0 and len(out) < max_events:
+                for key in order:
+                    queue = self._queues[key]
+                    if not queue:
+                        continue
+                    out.append(queue.popleft())
+                    self._count -= 1
+                    self._stats[key].drained += 1
+                    if len(out) >= max_events:
+                        break
+
+            # Next drain starts one source later
+            self._next_source = (start + 1) % n
+
+        now = time.monotonic()
+        for event in out:
+            event.trace["dequeued"] = now
+        return out
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._count
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-source counters: current depth, max depth, pushed, drained, dropped."""
+        with self._cond:
+            return {
+                key: {
+                    "depth": len(self._queues[key]),
+                    "max_depth": s.max_depth,
+                    "pushed": s.pushed,
+                    "drained": s.drained,
+                    "dropped": s.dropped,
+                }
+                for key, s in self._stats.items()
+            }
@@ -57,6 +57,7 @@ class EventType(Enum):
     PREV_DEVICE = auto()
     SCAN_QR = auto()
     QRLINK_RECEIVED = auto()  # QR-Link URL received from phone app
+    DEVICE_ALERT = auto()     # value = device id (critical background alert)
 
     # System
     TOGGLE_VOICE = auto()
@@ -70,3 +71,9 @@ class InputEvent:
     value: Any = None
     source: str = ""  # "keyboard", "gauntlet", "voice"
     timestamp: float = field(default_factory=time.monotonic)
+    # Repeat count: >1 when consecutive identical events were coalesced
+    count: int = 1
+    # Latency tracing: stage name → time.monotonic() mark (see perf/latency.py)
+    trace: dict[str, float] = field(default_factory=dict, repr=False, compare=False)
+    # Estimated wire/transport delay before the event reached the HUD (seconds)
+    transport_latency: float | None = field(default=None, repr=False, compare=False)
@@ -20,6 +20,7 @@ import json
 import logging
 import struct
 import threading
+import time
 from collections import deque
 from enum import IntEnum
 
@@ -66,6 +67,31 @@ class HapticPattern(IntEnum):
     SUCCESS = 0x04     # 3× short ascending — auth OK
 
 
+class WireClock:
+    """Estimates BLE transport latency from the Gauntlet's wire timestamp.
+
+    The firmware stamps each notification with a wrapping uint16 millisecond
+    counter on its own clock. The HUD cannot know the absolute clock offset,
+    but the fastest delivery seen recently sets a baseline: the estimate is
+    how much later than that best case the current notification arrived
+    (connection-interval waits, retransmissions, host scheduling).
+    """
+
+    def __init__(self, window: int = 64):
+        self._offsets: deque[int] = deque(maxlen=window)
+        self._ref: int | None = None
+
+    def estimate(self, device_ms: int, host_s: float) -> float:
+        """Return the estimated transport delay in seconds for one notification."""
+        raw = (int(host_s * 1000) - device_ms) & 0xFFFF
+        if self._ref is None:
+            self._ref = raw
+        # Unwrap relative to the first sample (signed 16-bit difference)
+        offset = ((raw - self._ref + 0x8000) & 0xFFFF) - 0x8000
+        self._offsets.append(offset)
+        return (offset - min(self._offsets)) / 1000.0
+
+
 # ── Pad-to-event mapping ──
 
 # Mode 1: Navigation — single pad taps
@@ -118,7 +144,7 @@ class GauntletInput(InputBackend):
     1. Scans for a nearby Gauntlet via BLE advertisement
     2. Connects and subscribes to input_event notifications
     3. Translates pad events into InputEvents
-    4. Queues them for the main thread to poll()
+    4. Pushes them into the input EventBus (or queues them for poll())
     """
 
     def __init__(self, device_address: str | None = None):
@@ -134,6 +160,7 @@ class GauntletInput(InputBackend):
         self._connected = False
         self._running = False
         self._battery_pct: int | None = None
+        self._wire_clock = WireClock()
 
         # Background thread for asyncio BLE loop
         self._thread: threading.Thread | None = None
@@ -291,13 +318,15 @@ class GauntletInput(InputBackend):
         if len(data) < 4:
             return
 
+        received = time.monotonic()
         event_type = data[0]
         pad_mask = data[1]
-        # timestamp_ms = struct.unpack_from("<H", data, 2)[0]  # available if needed
+        timestamp_ms = struct.unpack_from("<H", data, 2)[0]
 
         mapped = self._translate_event(event_type, pad_mask)
         if mapped:
-            self._queue.append(mapped)
+            mapped.transport_latency = self._wire_clock.estimate(timestamp_ms, received)
+            self._emit(mapped)
 
     def _on_battery_notification(self, _sender, data: bytearray) -> None:
         """Handle battery level notification."""
@@ -1,25 +1,41 @@
-"""Unified input manager that polls all backends.
+"""Unified input manager that multiplexes all backends.
 
-Merges events from keyboard, Gauntlet, voice, etc. into a single stream.
-The app state machine calls input_manager.poll() to get the next event.
+Merges events from keyboard, Gauntlet, phone, voice, etc. into a single
+EventBus. Threaded backends push into the bus as events arrive; polled
+backends (pygame keyboard) are pumped into it each frame. The app main
+loop calls input_manager.wait() to block until input or the next frame,
+then handles every pending event at once.
 """
 
 import logging
 
 from scouterhud.input.backend import InputBackend
+from scouterhud.input.event_bus import EventBus
 from scouterhud.input.events import InputEvent
 
 log = logging.getLogger("scouterhud.input")
 
+# Safety cap on events pulled from one polled backend per pump
+_MAX_PUMP_PER_BACKEND = 256
+
 
 class InputManager:
-    """Polls multiple input backends and returns events in priority order."""
+    """Feeds all input backends into one EventBus."""
 
     def __init__(self, backends: list[InputBackend] | None = None):
-        self._backends: list[InputBackend] = backends or []
+        self._bus = EventBus()
+        self._backends: list[InputBackend] = []
+        for backend in backends or []:
+            self._backends.append(backend)
+            backend.attach_bus(self._bus)
+
+    @property
+    def bus(self) -> EventBus:
+        return self._bus
 
     def add_backend(self, backend: InputBackend) -> None:
         self._backends.append(backend)
+        backend.attach_bus(self._bus)
         log.info(f"Input backend added: {backend.name}")
 
     def start(self) -> None:
@@ -37,17 +53,35 @@ class InputManager:
                 pass
 
     def poll(self) -> InputEvent | None:
-        """Non-blocking poll of all backends. Returns first event found."""
-        for backend in self._backends:
-            if not backend.is_available:
-                continue
-            event = backend.poll()
-            if event:
-                return event
-        return None
+        """Non-blocking: return the next pending event, or None."""
+        self._pump()
+        return self._bus.pop()
+
+    def wait(self, timeout: float) -> list[InputEvent]:
+        """Block up to timeout seconds for input, then return all pending events."""
+        self._pump()
+        if not len(self._bus):
+            self._bus.wait(timeout)
+            self._pump()
+        return self._bus.drain()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-source queue metrics from the event bus."""
+        return self._bus.stats()
 
     def set_numeric_mode(self, enabled: bool) -> None:
         """Switch all backends that support numeric mode."""
         for backend in self._backends:
             if hasattr(backend, "numeric_mode"):
                 backend.numeric_mode = enabled
+
+    def _pump(self) -> None:
+        """Move events from polled backends into the bus."""
+        for backend in self._backends:
+            if not backend.is_available:
+                continue
+            for _ in range(_MAX_PUMP_PER_BACKEND):
+                event = backend.poll()
+                if event is None:
+                    break
+                self._bus.push(event, backend.name)
@@ -20,6 +20,7 @@ In numeric mode (set externally):
 """
 
 import logging
+import threading
 from collections import deque
 
 from scouterhud.input.backend import InputBackend
@@ -27,20 +28,19 @@ from scouterhud.input.events import EventType, InputEvent
 
 log = logging.getLogger("scouterhud.input.keyboard")
 
-try:
-    import pygame
-    _HAS_PYGAME = True
-except ImportError:
-    _HAS_PYGAME = False
-
 
 class KeyboardInput(InputBackend):
-    """Reads keyboard input via pygame events."""
+    """Reads keyboard input via pygame events.
+
+    pygame is imported in start(), so importing this module (e.g. for
+    StdinKeyboardInput in --preview/--spi mode) does not pull it in.
+    """
 
     def __init__(self):
         self._queue: deque[InputEvent] = deque(maxlen=32)
         self._running = False
         self._numeric_mode = False
+        self._pygame = None
 
     @property
     def name(self) -> str:
@@ -55,9 +55,12 @@ class KeyboardInput(InputBackend):
         self._numeric_mode = value
 
     def start(self) -> None:
-        if not _HAS_PYGAME:
+        try:
+            import pygame
+        except ImportError:
             log.warning("pygame not available, keyboard input disabled")
             return
+        self._pygame = pygame
         self._running = True
         log.info("Keyboard input started")
 
@@ -65,8 +68,9 @@ class KeyboardInput(InputBackend):
         self._running = False
 
     def poll(self) -> InputEvent | None:
-        if not self._running or not _HAS_PYGAME:
+        if not self._running:
             return None
+        pygame = self._pygame
 
         # Pump pygame events and convert key presses
         for event in pygame.event.get(eventtype=pygame.KEYDOWN):
@@ -89,6 +93,7 @@ class KeyboardInput(InputBackend):
         return self._map_key_nav(key)
 
     def _map_key_nav(self, key: int) -> InputEvent | None:
+        pygame = self._pygame
         mapping = {
             pygame.K_UP: EventType.NAV_UP,
             pygame.K_DOWN: EventType.NAV_DOWN,
@@ -108,6 +113,7 @@ class KeyboardInput(InputBackend):
         return None
 
     def _map_key_numeric(self, key: int) -> InputEvent | None:
+        pygame = self._pygame
         mapping = {
             pygame.K_UP: EventType.DIGIT_UP,
             pygame.K_DOWN: EventType.DIGIT_DOWN,
@@ -125,7 +131,8 @@ class KeyboardInput(InputBackend):
 class StdinKeyboardInput(InputBackend):
     """Fallback keyboard input using stdin (for --preview mode without pygame window).
 
-    Uses non-blocking reads. Single key presses:
+    A reader thread blocks on stdin and emits key presses as they arrive.
+    Single key presses:
       w/a/s/d → NAV, Enter → CONFIRM, x → CANCEL, q → QUIT
       n → NEXT_DEVICE, p → PREV_DEVICE
     """
@@ -135,6 +142,7 @@ class StdinKeyboardInput(InputBackend):
         self._running = False
         self._numeric_mode = False
         self._old_settings = None
+        self._thread: threading.Thread | None = None
 
     @property
     def name(self) -> str:
@@ -159,29 +167,45 @@ class StdinKeyboardInput(InputBackend):
             log.info("Stdin keyboard input started (w/a/s/d=nav, enter=confirm, x=cancel, q=quit)")
         except Exception:
             log.warning("Cannot set terminal to cbreak mode, stdin input disabled")
+            return
+
+        self._thread = threading.Thread(
+            target=self._read_loop,
+            name="stdin-keys",
+            daemon=True,
+        )
+        self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
         if self._old_settings:
             import sys
             import termios
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._old_settings)
 
     def poll(self) -> InputEvent | None:
-        if not self._running:
-            return None
+        if self._queue:
+            return self._queue.popleft()
+        return None
 
+    def _read_loop(self) -> None:
+        """Reader thread: wait for key presses and emit them immediately."""
         import sys
         import select
 
-        # Non-blocking read
-        if select.select([sys.stdin], [], [], 0)[0]:
+        while self._running:
+            # Short timeout so stop() is honoured promptly
+            if not select.select([sys.stdin], [], [], 0.2)[0]:
+                continue
             ch = sys.stdin.read(1)
+            if not ch:  # EOF
+                break
             mapped = self._map_char(ch)
             if mapped:
-                return mapped
-
-        return None
+                self._emit(mapped)
 
     def _map_char(self, ch: str) -> InputEvent | None:
         if self._numeric_mode:
@@ -0,0 +1,194 @@
+"""Per-client outbound message channel for the phone WebSocket server.
+
+PhoneInput serializes each outgoing message once and hands the same text
+to every connected phone's ClientChannel. Each channel has its own sender
+task, so a slow phone only delays itself:
+
+  - "Latest value" message types (state, mode, device_list, sensor_data)
+    keep only the newest pending message. A phone that falls behind skips
+    straight to the current HUD state instead of replaying old frames.
+  - Other types (ai_response, sensor_schema) are queued in order, up to
+    MAX_PENDING_FIFO; the oldest are dropped beyond that.
+  - A conflated type can have a minimum send interval (set_rate). The
+    newest value is held back until the interval has passed, so a fast
+    source is downsampled per phone without ever losing the latest value.
+
+A channel is either a "controller" (the default: its input drives the
+HUD) or a read-only "observer" (e.g. phones following a HUD projected in
+a training room), chosen with ?role=observer on the WebSocket URL.
+
+All methods except stats() run on the server's asyncio loop.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from itertools import count
+from typing import Any
+
+log = logging.getLogger("scouterhud.input.phone")
+
+# Message types where only the newest pending message matters
+CONFLATED_TYPES = frozenset({"state", "mode", "device_list", "sensor_data"})
+
+# Bound on queued in-order messages (ai_response) per client
+MAX_PENDING_FIFO = 32
+
+# Window for the bytes/s and msgs/s rates
+RATE_WINDOW_S = 5.0
+
+ROLE_CONTROLLER = "controller"
+ROLE_OBSERVER = "observer"
+
+
+class ClientChannel:
+    """Bounded outbound queue and sender task for one WebSocket client."""
+
+    def __init__(
+        self,
+        websocket,
+        max_fifo: int = MAX_PENDING_FIFO,
+        role: str = ROLE_CONTROLLER,
+        max_inbound_per_s: int = 30,
+    ):
+        self._ws = websocket
+        self._max_fifo = max_fifo
+        self.role = role
+        # Inbound rate limiting: arrival times of the last max_inbound_per_s messages
+        self.inbound_times: deque[float] = deque(maxlen=max_inbound_per_s)
+        self.ignored = 0  # input messages dropped because the client is an observer
+        # key → text; conflated types use the type as key, others a unique seq
+        self._pending: OrderedDict[Any, str] = OrderedDict()
+        self._fifo_keys: deque[int] = deque()
+        self._seq = count()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._min_interval: dict[str, float] = {}  # msg type → seconds
+        self._last_sent: dict[str, float] = {}
+        # Sensor streaming: schema hashes this client already has, and the
+        # interval it asked for with a "sensor_rate" message (None = device default)
+        self.schemas_sent: set[str] = set()
+        self.sensor_interval: float | None = None
+
+        self.sent_msgs = 0
+        self.sent_bytes = 0
+        self.conflated = 0
+        self.dropped = 0
+        self._recent: deque[tuple[float, int]] = deque()  # (monotonic, bytes)
+
+    @property
+    def remote(self) -> str:
+        addr = getattr(self._ws, "remote_address", None)
+        if isinstance(addr, tuple) and len(addr) >= 2:
+            return f"{addr[0]}:{addr[1]}"
+        return str(addr)
+
+    @property
+    def is_observer(self) -> bool:
+        return self.role == ROLE_OBSERVER
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def set_rate(self, msg_type: str, interval_s: float | None) -> None:
+        """Limit msg_type to one send per interval_s (None removes the limit)."""
+        if interval_s:
+            self._min_interval[msg_type] = interval_s
+        else:
+            self._min_interval.pop(msg_type, None)
+        self._ready.set()
+
+    def rate(self, msg_type: str) -> float | None:
+        return self._min_interval.get(msg_type)
+
+    def put(self, msg_type: str, text: str) -> None:
+        """Queue an already-serialized message for this client."""
+        if self._closed:
+            return
+        if msg_type in CONFLATED_TYPES:
+            if self._pending.pop(msg_type, None) is not None:
+                self.conflated += 1
+            # Re-insert at the end so the newest value is sent last
+            self._pending[msg_type] = text
+        else:
+            if len(self._fifo_keys) >= self._max_fifo:
+                self._pending.pop(self._fifo_keys.popleft(), None)
+                self.dropped += 1
+            key = next(self._seq)
+            self._fifo_keys.append(key)
+            self._pending[key] = text
+        self._ready.set()
+
+    async def run(self) -> None:
+        """Sender loop: send pending messages one at a time until closed."""
+        try:
+            while not self._closed:
+                key, wait_s = self._next_due(time.monotonic())
+                if key is None:
+                    self._ready.clear()
+                    try:
+                        await asyncio.wait_for(self._ready.wait(), timeout=wait_s)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                text = self._pending.pop(key)
+                if self._fifo_keys and self._fifo_keys[0] == key:
+                    self._fifo_keys.popleft()
+                await self._ws.send(text)
+                if isinstance(key, str):
+                    self._last_sent[key] = time.monotonic()
+                self._record_sent(len(text))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.debug(f"Phone {self.remote}: send failed ({e})")
+        finally:
+            self._closed = True
+
+    def _next_due(self, now: float) -> tuple[Any, float | None]:
+        """Oldest pending key that may be sent now, else (None, seconds to wait)."""
+        wait_s = None
+        for key in self._pending:
+            interval = self._min_interval.get(key) if isinstance(key, str) else None
+            if interval is None:
+                return key, None
+            last = self._last_sent.get(key)
+            remaining = 0.0 if last is None else last + interval - now
+            if remaining <= 0:
+                return key, None
+            wait_s = remaining if wait_s is None else min(wait_s, remaining)
+        return None, wait_s
+
+    def close(self) -> None:
+        """Stop accepting messages and wake the sender so it can exit."""
+        self._closed = True
+        self._pending.clear()
+        self._fifo_keys.clear()
+        self._ready.set()
+
+    def _record_sent(self, nbytes: int) -> None:
+        now = time.monotonic()
+        self.sent_msgs += 1
+        self.sent_bytes += nbytes
+        self._recent.append((now, nbytes))
+        cutoff = now - RATE_WINDOW_S
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and send rates for this client."""
+        cutoff = time.monotonic() - RATE_WINDOW_S
+        recent = [(t, n) for t, n in list(self._recent) if t >= cutoff]
+        return {
+            "role": self.role,
+            "pending": len(self._pending),
+            "sent_msgs": self.sent_msgs,
+            "sent_bytes": self.sent_bytes,
+            "msgs_per_s": round(len(recent) / RATE_WINDOW_S, 2),
+            "bytes_per_s": round(sum(n for _, n in recent) / RATE_WINDOW_S, 1),
+            "conflated": self.conflated,
+            "dropped": self.dropped,
+            "ignored": self.ignored,
+        }
@@ -3,12 +3,15 @@
 Runs a WebSocket server that accepts connections from the ScouterApp
 web page (app/web/index.html). The phone sends JSON messages for
 navigation, numeric entry, and QR-Link URLs. The HUD sends state
-updates back to all connected phones.
+updates back to all connected phones, through one ClientChannel per
+phone (see phone_channel.py) so a slow phone cannot hold up the others.
 
-Also serves the HTML control page via HTTP on the same port.
+Also serves the HTML control page (precompressed, with ETags) and any
+static files next to it via HTTP on the same port.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import socket
@@ -17,9 +20,12 @@ import time
 from collections import deque
 from http import HTTPStatus
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 from scouterhud.input.backend import InputBackend
 from scouterhud.input.events import EventType, InputEvent
+from scouterhud.input.phone_channel import ROLE_CONTROLLER, ROLE_OBSERVER, ClientChannel
+from scouterhud.input.web_assets import AssetStore, StaticAsset
 
 log = logging.getLogger("scouterhud.input.phone")
 
@@ -66,6 +72,14 @@ MAX_QRLINK_URL_LENGTH = 512    # chars for qrlink:// URLs
 MAX_AI_CHAT_LENGTH = 1024      # chars for AI chat messages
 MAX_MESSAGES_PER_SECOND = 30   # per client rate limit
 
+# stats() lists individual clients only up to this many (slowest first)
+MAX_STATS_CLIENTS = 10
+
+# Sensor streaming to phones
+MIN_SENSOR_INTERVAL_MS = 100     # fastest rate a phone may request
+MAX_SENSOR_INTERVAL_MS = 60_000  # slowest rate a phone may request
+_VOLATILE_DATA_KEYS = frozenset({"ts", "timestamp"})  # ignored for change detection
+
 
 def _find_html_path() -> Path:
     """Resolve path to app/web/index.html relative to the project root."""
@@ -98,6 +112,12 @@ def _get_local_ips() -> list[str]:
     return sorted(set(ips))
 
 
+def _requested_role(path: str) -> str:
+    """Client role from the WebSocket URL query (?role=observer), default controller."""
+    roles = parse_qs(urlsplit(path or "").query).get("role", [])
+    return ROLE_OBSERVER if roles and roles[0] == ROLE_OBSERVER else ROLE_CONTROLLER
+
+
 class PhoneInput(InputBackend):
     """WebSocket-based input backend for phone control.
 
@@ -106,6 +126,8 @@ class PhoneInput(InputBackend):
     - Accepts WebSocket connections for bidirectional communication
     - Translates incoming JSON events to InputEvent objects
     - Broadcasts HUD state updates to all connected phones
+    - Accepts read-only observers (ws://host:port/?role=observer) whose
+      input is ignored but who receive every broadcast
     """
 
     def __init__(self, port: int = 8765, html_path: str | None = None):
@@ -115,11 +137,17 @@ class PhoneInput(InputBackend):
         self._running = False
         self._thread: threading.Thread | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._clients: set = set()
+        # Connected phones: id(websocket) → outbound channel (role, rate limit, stats)
+        self._clients: dict[int, ClientChannel] = {}
         self._html_bytes: bytes = b""
         self._html_path = Path(html_path) if html_path else _find_html_path()
-        # Per-client rate limiting: websocket → list of timestamps
-        self._client_msg_times: dict[int, deque] = {}
+        self._index: StaticAsset | None = None
+        self._assets = AssetStore(self._html_path.parent)
+        # Sensor streaming: last pushed (device_id, data without volatile keys),
+        # cached schema hash, and the last serialized push for newly connected phones
+        self._last_sensor: tuple[str, dict] | None = None
+        self._schema_cache: tuple[dict, str] | None = None
+        self._last_sensor_out: tuple[str, str, str, float | None] | None = None
 
     @property
     def name(self) -> str:
@@ -159,6 +187,21 @@ class PhoneInput(InputBackend):
             self._thread = None
         self._clients.clear()
 
+    def stats(self) -> dict:
+        """Outbound totals for all phones, plus the most backed-up clients."""
+        channels = list(self._clients.values())
+        per_client = [(ch.remote, ch.stats()) for ch in channels]
+        out = {
+            "clients": len(channels),
+            "observers": sum(1 for ch in channels if ch.is_observer),
+        }
+        for key in ("sent_msgs", "sent_bytes", "msgs_per_s", "bytes_per_s",
+                    "conflated", "dropped"):
+            out[key] = round(sum(st[key] for _, st in per_client), 2)
+        per_client.sort(key=lambda item: item[1]["pending"], reverse=True)
+        out.update(per_client[:MAX_STATS_CLIENTS])
+        return out
+
     def poll(self) -> InputEvent | None:
         """Non-blocking poll for the next queued event."""
         if self._queue:
@@ -193,21 +236,50 @@ class PhoneInput(InputBackend):
         device_type: str | None,
         data: dict,
         schema: dict,
-    ) -> None:
-        """Send latest sensor data + device context to all connected phones."""
-        self._broadcast({
+        refresh_ms: int | None = None,
+        levels: dict[str, str] | None = None,
+    ) -> bool:
+        """Push sensor data + device context to all phones if it changed.
+
+        The schema is sent to each phone once, as a "sensor_schema" message;
+        sensor_data only carries its hash. Each phone gets at most one
+        sensor_data per refresh_ms (or the interval it requested with a
+        "sensor_rate" message). levels ("ok"/"warn"/"alert" per field, see
+        ThresholdTable.levels) are the HUD's own color decisions, sent so the
+        phone does not re-derive them. Returns False if the data was unchanged.
+        """
+        values = {k: v for k, v in data.items() if k not in _VOLATILE_DATA_KEYS}
+        if self._last_sensor == (device_id, values):
+            return False
+        self._last_sensor = (device_id, values)
+
+        schema_hash = self._schema_hash(schema)
+        msg = {
             "type": "sensor_data",
             "device_id": device_id,
             "device_name": device_name or device_id,
             "device_type": device_type or "unknown",
             "data": data,
-            "schema": schema,
-        })
+            "schema_hash": schema_hash,
+        }
+        if levels:
+            msg["levels"] = levels
+        self._broadcast_sensor(
+            msg,
+            {
+                "type": "sensor_schema",
+                "device_id": device_id,
+                "schema_hash": schema_hash,
+                "schema": schema,
+            },
+            refresh_ms / 1000.0 if refresh_ms else None,
+        )
+        return True
 
     # ── Private ──
 
     def _load_html(self) -> None:
-        """Load the HTML control page from disk."""
+        """Load the HTML control page from disk and precompress it."""
         try:
             self._html_bytes = self._html_path.read_bytes()
             log.info(f"Loaded control page: {self._html_path}")
@@ -218,6 +290,10 @@ class PhoneInput(InputBackend):
                 b"<p>Control page not found. Place index.html in app/web/</p>"
                 b"</body></html>"
             )
+        # HTML is revalidated on every load (cheap 304 via ETag)
+        self._index = StaticAsset(self._html_bytes, "text/html; charset=utf-8", "no-cache")
+        sizes = ", ".join(f"{k} {len(v)} B" for k, v in self._index.encoded.items())
+        log.debug(f"Control page: {len(self._html_bytes)} B" + (f" ({sizes})" if sizes else ""))
 
     def _run_ws_loop(self) -> None:
         """Background thread entry point — runs the asyncio event loop."""
@@ -257,7 +333,7 @@ class PhoneInput(InputBackend):
         await server.wait_closed()
 
     def _process_request(self, connection, request):
-        """Serve HTML page for regular HTTP GET requests."""
+        """Serve the HTML page and static files for regular HTTP GET requests."""
         from websockets.datastructures import Headers
         from websockets.http11 import Response
 
@@ -265,34 +341,57 @@ class PhoneInput(InputBackend):
         if request.headers.get("Upgrade", "").lower() == "websocket":
             return None
 
-        if request.path in ("/", "/index.html"):
-            headers = Headers()
-            headers["Content-Type"] = "text/html; charset=utf-8"
-            headers["Cache-Control"] = "no-cache"
-            # Security headers (Phase S0)
-            headers["X-Content-Type-Options"] = "nosniff"
-            headers["X-Frame-Options"] = "DENY"
-            headers["X-XSS-Protection"] = "1; mode=block"
-            headers["Referrer-Policy"] = "no-referrer"
-            headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'unsafe-inline'; "
-                "style-src 'unsafe-inline'; "
-                "connect-src 'self' ws: wss:; "
-                "img-src 'self' data:; "
-                "frame-ancestors 'none'"
-            )
-            return Response(HTTPStatus.OK, "OK", headers, self._html_bytes)
-        # Return None for other paths
-        return None
+        if request.path.split("?", 1)[0] in ("/", "/index.html"):
+            if self._index is None:
+                self._load_html()
+            asset = self._index
+        else:
+            asset = self._assets.get(request.path)
+            if asset is None:
+                # Return None for other paths
+                return None
+
+        headers = Headers()
+        headers["Content-Type"] = asset.content_type
+        headers["Cache-Control"] = asset.cache_control
+        headers["ETag"] = asset.etag
+        headers["Vary"] = "Accept-Encoding"
+        # Security headers (Phase S0)
+        headers["X-Content-Type-Options"] = "nosniff"
+        headers["X-Frame-Options"] = "DENY"
+        headers["X-XSS-Protection"] = "1; mode=block"
+        headers["Referrer-Policy"] = "no-referrer"
+        headers["Content-Security-Policy"] = (
+            "default-src 'self'; "
+            "script-src 'unsafe-inline'; "
+            "style-src 'unsafe-inline'; "
+            "connect-src 'self' ws: wss:; "
+            "img-src 'self' data:; "
+            "frame-ancestors 'none'"
+        )
+
+        if asset.matches(request.headers.get("If-None-Match", "")):
+            return Response(HTTPStatus.NOT_MODIFIED, "Not Modified", headers, b"")
+
+        encoding, body = asset.select(request.headers.get("Accept-Encoding", ""))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(body))
+        return Response(HTTPStatus.OK, "OK", headers, body)
 
     async def _handler(self, websocket) -> None:
         """Handle a WebSocket connection from a phone."""
-        self._clients.add(websocket)
         remote = websocket.remote_address
         client_id = id(websocket)
-        self._client_msg_times[client_id] = deque(maxlen=MAX_MESSAGES_PER_SECOND)
-        log.info(f"Phone connected: {remote}")
+        role = _requested_role(getattr(getattr(websocket, "request", None), "path", ""))
+        channel = ClientChannel(
+            websocket, role=role, max_inbound_per_s=MAX_MESSAGES_PER_SECOND
+        )
+        sender = asyncio.ensure_future(channel.run())
+        self._clients[client_id] = channel
+        if self._last_sensor_out:
+            self._deliver_sensor(channel, *self._last_sensor_out)
+        log.info(f"Phone connected: {remote} ({role})")
 
         try:
             async for raw in websocket:
@@ -303,27 +402,36 @@ class PhoneInput(InputBackend):
 
                 # Rate limiting: drop messages if too fast
                 now = time.monotonic()
-                times = self._client_msg_times.get(client_id)
-                if times is not None and len(times) >= MAX_MESSAGES_PER_SECOND:
-                    if now - times[0] < 1.0:
-                        log.warning(f"Phone {remote}: rate limit exceeded, dropping message")
-                        continue
-                if times is not None:
-                    times.append(now)
-
-                event = self._parse_message(raw)
-                if event:
-                    self._queue.append(event)
+                times = channel.inbound_times
+                if len(times) >= MAX_MESSAGES_PER_SECOND and now - times[0] < 1.0:
+                    log.warning(f"Phone {remote}: rate limit exceeded, dropping message")
+                    continue
+                times.append(now)
+
+                event = self._parse_message(raw, channel)
+                if event and channel.is_observer:
+                    # Observers are read-only: only channel controls (sensor_rate) apply
+                    channel.ignored += 1
+                    log.debug(f"Phone {remote}: observer input ignored ({event.type.name})")
+                elif event:
+                    self._emit(event)
                     log.debug(f"Phone event: {event.type.name}")
         except Exception as e:
             log.debug(f"Phone disconnected: {remote} ({e})")
         finally:
-            self._clients.discard(websocket)
-            self._client_msg_times.pop(client_id, None)
+            self._clients.pop(client_id, None)
+            channel.close()
+            sender.cancel()
             log.info(f"Phone disconnected: {remote}")
 
-    def _parse_message(self, raw: str) -> InputEvent | None:
-        """Parse a JSON message from the phone into an InputEvent."""
+    def _parse_message(
+        self, raw: str, channel: ClientChannel | None = None
+    ) -> InputEvent | None:
+        """Parse a JSON message from the phone into an InputEvent.
+
+        Control messages for the sending phone's channel (sensor_rate) are
+        applied here and return None.
+        """
         try:
             data = json.loads(raw)
         except (json.JSONDecodeError, TypeError):
@@ -366,19 +474,87 @@ class PhoneInput(InputBackend):
                     source="phone",
                 )
 
+        elif msg_type == "sensor_rate":
+            if channel is not None:
+                self._set_sensor_rate(channel, data.get("interval_ms"))
+
         return None
 
     def _broadcast(self, msg: dict) -> None:
-        """Send a message to all connected phone clients (thread-safe)."""
+        """Send a message to all connected phone clients (thread-safe).
+
+        The message is serialized once here; each client's channel gets the
+        same text.
+        """
         if not self._loop or not self._clients:
             return
         text = json.dumps(msg)
-        asyncio.run_coroutine_threadsafe(
-            self._broadcast_async(text), self._loop
-        )
-
-    async def _broadcast_async(self, text: str) -> None:
-        """Actually broadcast to all clients (runs in asyncio loop)."""
-        import websockets
+        try:
+            self._loop.call_soon_threadsafe(self._fan_out, msg["type"], text)
+        except RuntimeError:
+            pass  # loop closed during shutdown
+
+    def _fan_out(self, msg_type: str, text: str) -> None:
+        """Queue a serialized message on every client channel (runs in asyncio loop)."""
+        for channel in list(self._clients.values()):
+            channel.put(msg_type, text)
+
+    # ── Sensor streaming ──
+
+    def _schema_hash(self, schema: dict) -> str:
+        """Short content hash of a schema (cached for the current schema object)."""
+        cached = self._schema_cache
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        digest = hashlib.sha1(
+            json.dumps(schema, sort_keys=True).encode()
+        ).hexdigest()[:12]
+        self._schema_cache = (schema, digest)
+        return digest
+
+    def _broadcast_sensor(
+        self, msg: dict, schema_msg: dict, interval_s: float | None
+    ) -> None:
+        """Serialize a sensor push once and queue it for every phone (thread-safe)."""
+        out = (json.dumps(msg), msg["schema_hash"], json.dumps(schema_msg), interval_s)
+        self._last_sensor_out = out
+        if not self._loop or not self._clients:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._fan_out_sensor, *out)
+        except RuntimeError:
+            pass  # loop closed during shutdown
 
-        websockets.broadcast(self._clients, text)
+    def _fan_out_sensor(
+        self, text: str, schema_hash: str, schema_text: str, interval_s: float | None
+    ) -> None:
+        for channel in list(self._clients.values()):
+            self._deliver_sensor(channel, text, schema_hash, schema_text, interval_s)
+
+    @staticmethod
+    def _deliver_sensor(
+        channel: ClientChannel,
+        text: str,
+        schema_hash: str,
+        schema_text: str,
+        interval_s: float | None,
+    ) -> None:
+        """Queue a sensor push on one channel, preceded by its schema if new."""
+        if schema_hash not in channel.schemas_sent:
+            channel.schemas_sent.add(schema_hash)
+            channel.put("sensor_schema", schema_text)
+        channel.set_rate("sensor_data", channel.sensor_interval or interval_s)
+        channel.put("sensor_data", text)
+
+    def _set_sensor_rate(self, channel: ClientChannel, interval_ms) -> None:
+        """Apply a phone's requested sensor_data interval (None/0 = device default)."""
+        valid = isinstance(interval_ms, (int, float)) and not isinstance(interval_ms, bool)
+        if not valid or interval_ms <= 0:
+            channel.sensor_interval = None
+        else:
+            clamped = min(max(interval_ms, MIN_SENSOR_INTERVAL_MS), MAX_SENSOR_INTERVAL_MS)
+            channel.sensor_interval = clamped / 1000.0
+        device_default = self._last_sensor_out[3] if self._last_sensor_out else None
+        channel.set_rate("sensor_data", channel.sensor_interval or device_default)
+        log.info(f"Phone {channel.remote}: sensor interval "
+                 f"{channel.sensor_interval or device_default or 0:.2f}s")
@@ -0,0 +1,144 @@
+"""Precompressed, cacheable static files for the phone control page.
+
+The control page is compressed once when PhoneInput starts (gzip, plus
+Brotli if the optional `brotli` package is installed) and every response
+carries a strong ETag, so:
+  - first loads on slow Wi-Fi transfer the smallest encoding the phone accepts
+  - reloads revalidate with If-None-Match and get a body-less 304
+
+Other files under app/web/ (icons, scripts the page may reference) are
+loaded and compressed on first request, then served from memory.
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+log = logging.getLogger("scouterhud.input.phone")
+
+# Don't bother compressing tiny bodies or already-compressed formats
+MIN_COMPRESS_SIZE = 256
+_COMPRESSIBLE_PREFIXES = ("text/", "application/javascript", "application/json",
+                          "image/svg+xml", "application/manifest+json")
+
+# Largest file served from app/web/ (whole files are kept in memory)
+MAX_ASSET_SIZE = 2 * 1024 * 1024
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    """Accept-Encoding header → {coding: q}."""
+    out: dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        out[coding] = q
+    return out
+
+
+class StaticAsset:
+    """One file held in memory in every useful encoding, with a strong ETag."""
+
+    def __init__(self, body: bytes, content_type: str, cache_control: str = "no-cache"):
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+        self.encoded: dict[str, bytes] = {}
+
+        if len(body) >= MIN_COMPRESS_SIZE and content_type.startswith(_COMPRESSIBLE_PREFIXES):
+            gz = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(gz) < len(body):
+                self.encoded["gzip"] = gz
+            if brotli is not None:
+                br = brotli.compress(body, quality=11)
+                if len(br) < len(gz):
+                    self.encoded["br"] = br
+
+    def select(self, accept_encoding: str) -> tuple[str | None, bytes]:
+        """Pick the smallest encoding the client accepts: (coding or None, body)."""
+        if self.encoded and accept_encoding:
+            accepted = _parse_accept_encoding(accept_encoding)
+            wildcard = accepted.get("*", 0.0)
+            for coding in ("br", "gzip"):
+                if coding in self.encoded and accepted.get(coding, wildcard) > 0:
+                    return coding, self.encoded[coding]
+        return None, self.body
+
+    def matches(self, if_none_match: str) -> bool:
+        """True if an If-None-Match header value matches this asset's ETag."""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return True
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag == self.etag:
+                return True
+        return False
+
+
+class AssetStore:
+    """Serves files from a web root directory, cached after first load."""
+
+    def __init__(self, root: Path, cache_control: str = "public, max-age=3600"):
+        self._root = root.resolve()
+        self._cache_control = cache_control
+        # Keyed by resolved file path: /a.js, //a.js and /x/../a.js share one
+        # entry, so the cache is bounded by the files under the web root
+        self._assets: dict[Path, StaticAsset] = {}
+
+    def get(self, path: str) -> StaticAsset | None:
+        """Asset for a URL path, or None if missing or outside the web root."""
+        target = self._resolve(path.split("?", 1)[0])
+        if target is None:
+            return None  # misses aren't cached (unbounded URL space)
+        asset = self._assets.get(target)
+        if asset is None:
+            asset = self._load(target)
+            if asset is not None:
+                self._assets[target] = asset
+        return asset
+
+    def _resolve(self, path: str) -> Path | None:
+        rel = path.lstrip("/")
+        if not rel:
+            return None
+        try:
+            target = (self._root / rel).resolve()
+        except (OSError, ValueError):
+            return None
+        # Path traversal guard (../, symlinks out of the web root)
+        if not target.is_relative_to(self._root) or not target.is_file():
+            return None
+        return target
+
+    def _load(self, target: Path) -> StaticAsset | None:
+        try:
+            if target.stat().st_size > MAX_ASSET_SIZE:
+                log.warning(f"Static file too large to serve: {target}")
+                return None
+            body = target.read_bytes()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        return StaticAsset(body, content_type, self._cache_control)
@@ -11,8 +11,14 @@ App state machine:
 
 Modes:
   --scan <qr_image>    Scan a QR image file, connect to device, show live data
+                       (several codes in one image: enroll all, pick from list)
   --demo <device_id>   Connect directly to an emulated device (no QR scan needed)
   --phone [PORT]       Start WebSocket server for phone control (default: 8765)
+  --webcam             Scan QR codes continuously from the webcam (needs OpenCV)
+
+Diagnostics:
+  --profile-startup    Log import/phase timing up to the first rendered frame
+  --perf-stats [SECS]  Log input-to-display latency histograms and queue stats
 
 Display:
   --preview            Use PNG file backend (for WSL2 / headless)
@@ -27,30 +33,57 @@ Usage:
 
 import argparse
 import logging
+import sys
 import threading
 import time
+from contextlib import nullcontext
 from enum import Enum, auto
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+# --profile-startup hooks imports here, before the scouterhud.* imports
+# below, so their cost shows up in the report (startup.py is stdlib-only)
+_startup_profiler = None
+if "--profile-startup" in sys.argv[1:]:
+    from scouterhud.perf.startup import StartupProfiler
 
+    _startup_profiler = StartupProfiler()
+    _startup_profiler.install()
+
+# Only lightweight modules are imported here. Backends (pygame, spidev,
+# pyzbar, websockets, paho) are imported when their mode is selected,
+# which keeps cold start on the Pi Zero 2W short.
 from scouterhud.auth.auth_manager import AuthManager
-from scouterhud.auth.pin_entry import PinEntry
-from scouterhud.camera.backend_desktop import DesktopCameraBackend
-from scouterhud.camera.qr_decoder import scan_qr
-from scouterhud.display.backend import DisplayBackend
-from scouterhud.display.backend_desktop import DesktopBackend
-from scouterhud.display.backend_preview import PreviewBackend
+from scouterhud.auth.credential_store import DEFAULT_STATE_PATH
+from scouterhud.display.animation import FLASH_PERIOD, BorderFlash
+from scouterhud.display.backend import Box, DisplayBackend
+from scouterhud.display.layout import stats as layout_stats
 from scouterhud.display.renderer import (
+    overlay_alert_banner,
     render_connecting_screen,
     render_device_list,
     render_error_screen,
     render_frame,
     render_scanning_screen,
 )
-from scouterhud.input.events import EventType
+from scouterhud.input.coalesce import coalesce
+from scouterhud.input.events import EventType, InputEvent
 from scouterhud.input.input_manager import InputManager
-from scouterhud.input.keyboard_input import KeyboardInput, StdinKeyboardInput
+from scouterhud.perf.budget import RenderBudget
+from scouterhud.perf.latency import LatencyTracer
+from scouterhud.perf.metrics import PerfStats
+from scouterhud.perf.power import PowerGovernor, screen_share
 from scouterhud.qrlink.connection import ConnectionManager
 from scouterhud.qrlink.protocol import DeviceLink, parse_qrlink_url
+from scouterhud.qrlink.watcher import DeviceWatcher
+from scouterhud.telemetry.history import HistoryStore
+from scouterhud.telemetry.rules import RuleEngine
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from scouterhud.auth.pin_entry import PinEntry
+    from scouterhud.camera.qr_scanner import ContinuousQRScanner
+    from scouterhud.perf.startup import StartupProfiler
 
 logging.basicConfig(
     level=logging.INFO,
@@ -59,6 +92,12 @@ logging.basicConfig(
 )
 log = logging.getLogger("scouterhud")
 
+# Fastest render cadence when no input arrives (~20 FPS; see perf/budget.py)
+FRAME_INTERVAL = 0.05
+
+# How long a background-device alert banner stays on screen
+ALERT_BANNER_SECONDS = 8.0
+
 
 class AppState(Enum):
     SCANNING = auto()
@@ -80,37 +119,86 @@ class ScouterHUD:
         rotation: int = 0,
         mirror: bool = False,
         phone_port: int | None = None,
+        profiler: "StartupProfiler | None" = None,
+        perf_log_interval: float | None = None,
+        rules: list[dict[str, Any]] | None = None,
+        auto_switch: bool = False,
     ):
+        self._profiler = profiler
+
+        # Performance stats (input-to-display latency, queue depths, ...)
+        self.perf = PerfStats()
+        self._tracer = LatencyTracer(self.perf)
+        self._perf_log_interval = perf_log_interval
+        self._last_perf_log = time.monotonic()
+        # Frame rate per state/device, display speed, battery and CPU load
+        self.budget = RenderBudget(base_interval=FRAME_INTERVAL, flash_period=FLASH_PERIOD)
+        self.perf.add_provider("budget", self.budget.stats)
+
         # Display
-        if use_spi:
-            from scouterhud.display.backend_spi import SPIBackend
+        with self._phase("display init"):
+            if use_spi:
+                from scouterhud.display.backend_spi import SPIBackend
 
-            self.display: DisplayBackend = SPIBackend(
-                spi_speed_hz=spi_speed, rotation=rotation, mirror=mirror,
-            )
-        elif use_preview:
-            self.display = PreviewBackend()
-        else:
-            self.display = DesktopBackend(scale=3, title="ScouterHUD")
+                self.display: DisplayBackend = SPIBackend(
+                    spi_speed_hz=spi_speed, rotation=rotation, mirror=mirror,
+                )
+            elif use_preview:
+                from scouterhud.display.backend_preview import PreviewBackend
+
+                self.display = PreviewBackend()
+            else:
+                from scouterhud.display.backend_desktop import DesktopBackend
+
+                self.display = DesktopBackend(scale=3, title="ScouterHUD")
+
+        self.perf.add_provider("display", self.display.stats)
+
+        # Backlight dimming and slower rendering while nothing needs attention
+        self.power = PowerGovernor(self.display.set_brightness)
+        self.perf.add_provider("power", self.power.stats)
 
         # Input
-        self.input = InputManager()
-        if use_spi or use_preview:
-            self.input.add_backend(StdinKeyboardInput())
-        else:
-            self.input.add_backend(KeyboardInput())
+        with self._phase("input init"):
+            self.input = InputManager()
+            if use_spi or use_preview:
+                from scouterhud.input.keyboard_input import StdinKeyboardInput
+
+                self.input.add_backend(StdinKeyboardInput())
+            else:
+                from scouterhud.input.keyboard_input import KeyboardInput
+
+                self.input.add_backend(KeyboardInput())
 
-        # Phone input (optional WebSocket server)
-        self._phone_input = None
-        if phone_port is not None:
-            from scouterhud.input.phone_input import PhoneInput
+            # Phone input (optional WebSocket server)
+            self._phone_input = None
+            self._scanner: "ContinuousQRScanner | None" = None
+            if phone_port is not None:
+                from scouterhud.input.phone_input import PhoneInput
 
-            self._phone_input = PhoneInput(port=phone_port)
-            self.input.add_backend(self._phone_input)
+                self._phone_input = PhoneInput(port=phone_port)
+                self.input.add_backend(self._phone_input)
+                self.perf.add_provider("phone", self._phone_input.stats)
+
+            self.perf.add_provider("input", self.input.stats)
 
         # Core systems
-        self.connection = ConnectionManager()
-        self.auth = AuthManager(pins=self._load_demo_pins())
+        with self._phase("core init"):
+            self.connection = ConnectionManager()
+            pins, tokens = self._load_demo_credentials()
+            self.auth = AuthManager(pins=pins, tokens=tokens, state_path=DEFAULT_STATE_PATH)
+            self.perf.add_provider("auth", self.auth.stats)
+            self.history = HistoryStore()
+            self.perf.add_provider("history", self.history.stats)
+            self.perf.add_provider("layout", layout_stats)
+            self.rules = RuleEngine(rules, perf=self.perf)
+            self.perf.add_provider("rules", self.rules.stats)
+            # Alerts of the other known devices, while one is on screen
+            self.watcher = DeviceWatcher(
+                self.rules, on_alert=self._on_background_alert, credentials_for=self.auth.prewarm,
+            )
+            self.perf.add_provider("watcher", self.watcher.stats)
+            self._auto_switch = auto_switch
 
         # State
         self._state = AppState.SCANNING
@@ -121,51 +209,77 @@ class ScouterHUD:
         self._error_return_state = AppState.SCANNING
 
         # PIN entry
-        self._pin_entry: PinEntry | None = None
+        self._pin_entry: "PinEntry | None" = None
         self._pending_link: DeviceLink | None = None
 
-        # Device list
+        # Device list (phone copy is re-sent once per frame when dirty)
         self._device_list_index = 0
+        self._device_list_dirty = False
+
+        # Last data dict offered to the phones (pushed when a new one arrives)
+        self._sensor_pushed: dict[str, Any] | None = None
 
-        # Sensor broadcast throttle (max 1 Hz to phone)
-        self._last_sensor_broadcast = 0.0
+        # Blinking alert border (partial updates between full frames)
+        self._flash = BorderFlash()
+        # (data, banner) of the last full STREAMING frame
+        self._streamed: tuple[Any, Any] | None = None
+
+        # Background alerts: (device id, title, text, shown until), set from MQTT threads
+        self._alert_banner: tuple[str, str, str, float] | None = None
+        # PIN devices unlocked this session (only those are watched in the background)
+        self._unlocked: set[str] = set()
+
+    def _phase(self, name: str):
+        """Context manager timing a startup phase (no-op without --profile-startup)."""
+        if self._profiler:
+            return self._profiler.phase(name)
+        return nullcontext()
 
     @staticmethod
-    def _load_demo_pins() -> dict[str, str]:
-        """Load device PINs from emulator config.yaml (if available)."""
+    def _load_demo_credentials() -> tuple[dict[str, str], dict[str, str]]:
+        """Load device PINs and tokens from emulator config.yaml (if available)."""
         from pathlib import Path
 
         config_path = Path(__file__).resolve().parents[2] / "emulator" / "config.yaml"
         if not config_path.exists():
-            log.debug("No emulator config.yaml found, no demo PINs loaded")
-            return {}
+            log.debug("No emulator config.yaml found, no demo credentials loaded")
+            return {}, {}
 
         try:
             import yaml
         except ImportError:
-            log.debug("PyYAML not available, no demo PINs loaded")
-            return {}
+            log.debug("PyYAML not available, no demo credentials loaded")
+            return {}, {}
 
         try:
             data = yaml.safe_load(config_path.read_text())
-            pins = {}
+            pins, tokens = {}, {}
             for dev in data.get("devices", []):
                 if dev.get("pin"):
                     pins[dev["id"]] = str(dev["pin"])
-            if pins:
-                log.info(f"Loaded {len(pins)} device PINs from emulator config")
-            return pins
+                if dev.get("token"):
+                    tokens[dev["id"]] = str(dev["token"])
+            if pins or tokens:
+                log.info(f"Loaded {len(pins)} device PINs and {len(tokens)} tokens from emulator config")
+            return pins, tokens
         except Exception as e:
             log.warning(f"Failed to load emulator config: {e}")
-            return {}
+            return {}, {}
 
     # ── Public entry points ──
 
     def run_scan(self, qr_image_path: str) -> None:
-        """Scan a QR image file, connect, and show live data."""
+        """Scan a QR image file, connect, and show live data.
+
+        An image with several QR-Link codes (e.g. a printed sheet for a
+        whole ward) enrolls every device and opens the device list.
+        """
         log.info(f"Scanning QR from: {qr_image_path}")
         self._set_state(AppState.SCANNING)
-        self.display.show(render_scanning_screen())
+        self._show(render_scanning_screen())
+
+        from scouterhud.camera.backend_desktop import DesktopCameraBackend
+        from scouterhud.camera.qr_decoder import scan_qr_all
 
         camera = DesktopCameraBackend(qr_image_path=qr_image_path)
         camera.start()
@@ -178,19 +292,22 @@ class ScouterHUD:
         frame = camera.capture_frame()
         camera.stop()
 
-        raw_qr = scan_qr(frame)
-        if not raw_qr:
+        payloads = scan_qr_all(frame)
+        if not payloads:
             self._show_error("No QR code found in image", AppState.SCANNING)
             self._run_loop()
             return
 
-        link = parse_qrlink_url(raw_qr)
-        if not link:
+        links = [link for link in map(parse_qrlink_url, payloads) if link]
+        if not links:
             self._show_error("Invalid QR-Link URL", AppState.SCANNING)
             self._run_loop()
             return
 
-        self._initiate_connection(link)
+        if len(links) == 1:
+            self._initiate_connection(links[0])
+        else:
+            self._enroll(links)
         self._run_loop()
 
     def run_demo(self, device_id: str, broker: str, topic: str, auth: str = "open") -> None:
@@ -217,11 +334,40 @@ class ScouterHUD:
         self._set_state(AppState.SCANNING)
         self._run_loop()
 
+    def run_webcam(self) -> None:
+        """Scan QR codes continuously from the webcam and connect to them."""
+        from scouterhud.camera.backend_desktop import DesktopCameraBackend
+        from scouterhud.camera.qr_scanner import ContinuousQRScanner
+
+        camera = DesktopCameraBackend(use_webcam=True)
+        camera.start()
+        if not camera.is_available():
+            self._show_error("Webcam not available", AppState.SCANNING)
+            self._run_loop()
+            return
+
+        self._scanner = ContinuousQRScanner(camera, self._on_qr_scanned)
+        self.perf.add_provider("scanner", self._scanner.stats)
+        self._scanner.start()
+        log.info("Webcam scanning — point the camera at a QR-Link code")
+        self._set_state(AppState.SCANNING)
+        try:
+            self._run_loop()
+        finally:
+            self._scanner.stop()
+            camera.stop()
+
     # ── Connection flow ──
 
     def _set_state(self, new_state: AppState) -> None:
         """Transition to a new state and notify connected phones."""
         self._state = new_state
+        if new_state != AppState.STREAMING:
+            self._flash.reset()
+        self._streamed = None
+        if self._scanner:
+            # Webcam decoding runs while a scanned code can be acted on
+            self._scanner.paused = new_state not in (AppState.SCANNING, AppState.STREAMING)
         if self._phone_input:
             kwargs: dict[str, Any] = {}
             if new_state == AppState.STREAMING and self.connection.active_device:
@@ -230,7 +376,7 @@ class ScouterHUD:
                 kwargs["error"] = self._error_msg
             self._phone_input.send_state(new_state.name.lower(), **kwargs)
             if new_state == AppState.DEVICE_LIST:
-                self._send_device_list()
+                self._device_list_dirty = True
 
     def _send_device_list(self) -> None:
         """Send current device list to phone app."""
@@ -251,9 +397,22 @@ class ScouterHUD:
             device_data, self._device_list_index, active_id
         )
 
+    def _enroll(self, links: list[DeviceLink]) -> None:
+        """Add several scanned devices at once and show them in the device list."""
+        self._show(render_connecting_screen(f"{len(links)} devices"))
+        self.connection.enroll(links)
+        self._sync_watcher()
+        self._device_list_index = 0
+        self._set_state(AppState.DEVICE_LIST)
+
     def _initiate_connection(self, link: DeviceLink) -> None:
         """Start connection flow: check auth, then connect."""
-        if self.auth.needs_auth(link):
+        if link.auth == "token":
+            # No user interaction: the stored token is sent as MQTT credentials
+            self._do_connect(link, credentials=self.auth.prewarm(link))
+        elif self.auth.needs_auth(link):
+            from scouterhud.auth.pin_entry import PinEntry
+
             self._pending_link = link
             self._pin_entry = PinEntry(
                 pin_length=4,
@@ -265,10 +424,10 @@ class ScouterHUD:
         else:
             self._do_connect(link)
 
-    def _do_connect(self, link: DeviceLink) -> None:
-        """Actually connect to the device."""
+    def _do_connect(self, link: DeviceLink, credentials=None) -> None:
+        """Actually connect to the device (credentials: see ConnectionManager.connect)."""
         self._set_state(AppState.CONNECTING)
-        self.display.show(render_connecting_screen(link.id))
+        self._show(render_connecting_screen(link.id))
 
         # Clear stale data BEFORE connecting (avoid race with MQTT background thread)
         with self._data_lock:
@@ -278,44 +437,101 @@ class ScouterHUD:
             link,
             on_data=self._on_data,
             on_meta=self._on_meta,
+            credentials=credentials,
         )
 
         if success:
+            self._unlocked.add(link.id)
+            self._sync_watcher()
             self._set_state(AppState.STREAMING)
             log.info(f"Connected! Streaming data from {link.id}")
             with self._data_lock:
                 if self._latest_data is None:
                     log.info("Waiting for first data message from broker...")
         else:
+            self._sync_watcher()
             self._show_error(
                 f"Cannot connect to {link.endpoint}. Is the broker running?",
                 AppState.SCANNING,
             )
 
+    def _sync_watcher(self) -> None:
+        """Watch alerts of every known device except the one on screen."""
+        active = self.connection.active_device
+        self.watcher.watch(
+            [d for d in self.connection.known_devices if d.auth != "pin" or d.id in self._unlocked],
+            exclude=active.id if active else None,
+        )
+        with self._data_lock:
+            if active and self._alert_banner and self._alert_banner[0] == active.id:
+                self._alert_banner = None
+
     # ── Main loop ──
 
     def _run_loop(self) -> None:
-        """Main event + render loop."""
+        """Main event + render loop.
+
+        Blocks on the input bus until the next frame (or animation step) is
+        due, wakes early when input arrives, and handles every pending event
+        before rendering. Animation steps between frames are partial updates.
+        """
         self.input.start()
 
         try:
+            next_frame = time.monotonic()
             while self._running:
-                # Handle input
-                event = self.input.poll()
-                if event:
+                # Handle all pending input (or wait for it until the frame is due)
+                deadline = next_frame
+                flash_at = self._flash.next_toggle()
+                if flash_at is not None:
+                    deadline = min(deadline, flash_at)
+                timeout = max(0.0, deadline - time.monotonic())
+                events = self.input.wait(timeout)
+                if events:
+                    self.power.activity()
+                merged = coalesce(events)
+                if len(merged) < len(events):
+                    self.perf.count("input.coalesced", len(events) - len(merged))
+                for event in merged:
                     self._handle_event(event)
+                    self._tracer.handled(event)
+                    if not self._running:
+                        break
+
+                # Per-frame phone updates (once, however many events changed them)
+                if self._device_list_dirty:
+                    self._device_list_dirty = False
+                    self._send_device_list()
 
-                # Render current state
-                self._render()
+                # Render current state (input always gets a full frame)
+                next_frame = self._frame_step(bool(events), next_frame)
 
-                time.sleep(0.05)  # ~20 FPS
+                if self._perf_log_interval and next_frame - self._last_perf_log >= self._perf_log_interval:
+                    self._last_perf_log = next_frame
+                    self._log_perf_stats()
 
         except KeyboardInterrupt:
             log.info("Shutting down...")
         finally:
             self.input.stop()
+            self.watcher.stop()
             self.connection.disconnect()
             self.display.close()
+            for source, st in self.input.stats().items():
+                log.info(
+                    f"Input {source}: {st['pushed']} events, "
+                    f"max queue depth {st['max_depth']}, dropped {st['dropped']}"
+                )
+            if self._perf_log_interval:
+                self._log_perf_stats()
+
+    def perf_stats(self) -> dict[str, Any]:
+        """Snapshot of all performance stats (latency histograms, queues, ...)."""
+        return self.perf.snapshot()
+
+    def _log_perf_stats(self) -> None:
+        for line in self.perf.summary_lines():
+            log.info(f"perf {line}")
 
     # ── Event handling ──
 
@@ -330,6 +546,10 @@ class ScouterHUD:
             self._handle_ai_chat(event)
             return
 
+        if event.type == EventType.DEVICE_ALERT:
+            self._handle_device_alert(event)
+            return
+
         handler = {
             AppState.SCANNING: self._handle_scanning_event,
             AppState.AUTH: self._handle_auth_event,
@@ -341,16 +561,38 @@ class ScouterHUD:
         if handler:
             handler(event)
 
+    def _handle_device_alert(self, event) -> None:
+        """Critical alert on a background device: switch to it (--auto-switch)."""
+        # Never interrupt PIN entry or a connection in progress
+        if self._state not in (AppState.STREAMING, AppState.DEVICE_LIST, AppState.SCANNING):
+            return
+        active = self.connection.active_device
+        if active and active.id == event.value:
+            return
+        link = next((d for d in self.connection.known_devices if d.id == event.value), None)
+        if link:
+            log.warning(f"Critical alert → switching to {link.id}")
+            self._initiate_connection(link)
+
     def _handle_scanning_event(self, event) -> None:
         """Handle events while waiting for QR scan (phone mode)."""
         if event.type == EventType.QRLINK_RECEIVED:
-            url = event.value
-            link = parse_qrlink_url(url)
-            if link:
-                log.info(f"QR-Link received from {event.source}: {link.id}")
-                self._initiate_connection(link)
-            else:
-                self._show_error("Invalid QR-Link URL", AppState.SCANNING)
+            self._handle_qrlink(event)
+
+    def _handle_qrlink(self, event) -> None:
+        """Connect to a scanned QR-Link, unless it is the device already streaming."""
+        url = event.value
+        link = parse_qrlink_url(url)
+        if not link:
+            self._show_error("Invalid QR-Link URL", AppState.SCANNING)
+            return
+        active = self.connection.active_device
+        if active is not None and active.key == link.key and self.connection.is_connected:
+            log.debug(f"QR-Link for active device {link.id} ignored")
+            self.perf.count("qrlink.duplicate")
+            return
+        log.info(f"QR-Link received from {event.source}: {link.id}")
+        self._initiate_connection(link)
 
     def _handle_auth_event(self, event) -> None:
         """Handle events during PIN entry."""
@@ -391,27 +633,35 @@ class ScouterHUD:
                 self._pin_entry.set_error(result.error)
 
     def _handle_streaming_event(self, event) -> None:
-        """Handle events while streaming data."""
-        if event.type == EventType.NEXT_DEVICE:
-            next_link = self.connection.switch_next()
+        """Handle events while streaming data.
+
+        Coalesced switch events (count > 1) step through the history and
+        connect once, to the final device. A newly scanned QR-Link switches
+        to that device.
+        """
+        if event.type == EventType.QRLINK_RECEIVED:
+            self._handle_qrlink(event)
+
+        elif event.type == EventType.NEXT_DEVICE:
+            next_link = self._switch_device(self.connection.switch_next, event.count)
             if next_link:
                 log.info(f"Switching to next device: {next_link.id}")
                 self._initiate_connection(next_link)
 
         elif event.type == EventType.PREV_DEVICE:
-            prev_link = self.connection.switch_prev()
+            prev_link = self._switch_device(self.connection.switch_prev, event.count)
             if prev_link:
                 log.info(f"Switching to previous device: {prev_link.id}")
                 self._initiate_connection(prev_link)
 
         elif event.type == EventType.NAV_LEFT:
-            prev_link = self.connection.switch_prev()
+            prev_link = self._switch_device(self.connection.switch_prev, event.count)
             if prev_link:
                 log.info(f"D-pad left → switching to previous device: {prev_link.id}")
                 self._initiate_connection(prev_link)
 
         elif event.type == EventType.NAV_RIGHT:
-            next_link = self.connection.switch_next()
+            next_link = self._switch_device(self.connection.switch_next, event.count)
             if next_link:
                 log.info(f"D-pad right → switching to next device: {next_link.id}")
                 self._initiate_connection(next_link)
@@ -423,19 +673,30 @@ class ScouterHUD:
 
         elif event.type == EventType.CANCEL:
             self.connection.disconnect()
+            self._sync_watcher()
             self._set_state(AppState.SCANNING)
 
+    @staticmethod
+    def _switch_device(step, count: int) -> DeviceLink | None:
+        """Call a ConnectionManager switch method count times, return the final link."""
+        link = None
+        for _ in range(count):
+            link = step()
+            if link is None:
+                break
+        return link
+
     def _handle_device_list_event(self, event) -> None:
         """Handle events in device list screen."""
         devices = self.connection.known_devices
 
         if event.type == EventType.NAV_UP:
-            self._device_list_index = max(0, self._device_list_index - 1)
-            self._send_device_list()
+            self._device_list_index = max(0, self._device_list_index - event.count)
+            self._device_list_dirty = True
 
         elif event.type == EventType.NAV_DOWN:
-            self._device_list_index = min(len(devices) - 1, self._device_list_index + 1)
-            self._send_device_list()
+            self._device_list_index = min(len(devices) - 1, self._device_list_index + event.count)
+            self._device_list_dirty = True
 
         elif event.type == EventType.CONFIRM:
             if devices:
@@ -443,7 +704,11 @@ class ScouterHUD:
                 self._initiate_connection(selected)
 
         elif event.type == EventType.CANCEL:
-            self._set_state(AppState.STREAMING)
+            if self.connection.active_device:
+                self._set_state(AppState.STREAMING)
+            else:
+                # Nothing streaming yet (e.g. right after a batch enroll)
+                self._set_state(AppState.SCANNING)
 
     def _handle_error_event(self, event) -> None:
         """Any key press on error screen returns to previous state."""
@@ -464,11 +729,18 @@ class ScouterHUD:
     def _render(self) -> None:
         """Render frame for the current app state."""
         if self._state == AppState.SCANNING:
-            self.display.show(render_scanning_screen())
+            self._show(render_scanning_screen())
 
         elif self._state == AppState.AUTH:
             if self._pin_entry:
-                self.display.show(self._pin_entry.render())
+                # Only the changed digit cells are pushed to the display
+                frame, box = self._pin_entry.render_update()
+                if box is not None:
+                    self._show(frame, box)
+                else:
+                    # Nothing to redraw: the screen already reflects any input
+                    now = time.monotonic()
+                    self._tracer.shown(now, now)
 
         elif self._state == AppState.CONNECTING:
             pass  # already rendered in _do_connect
@@ -478,13 +750,25 @@ class ScouterHUD:
                 data = self._latest_data
 
             if data and self.connection.active_device:
-                frame = render_frame(self.connection.active_device, data)
-                self.display.show(frame)
-
-                # Send sensor data to phone (throttled to 1 Hz)
-                now = time.monotonic()
-                if self._phone_input and now - self._last_sensor_broadcast >= 1.0:
-                    self._last_sensor_broadcast = now
+                banner = self._current_banner()
+                if self._streamed is not None and data is self._streamed[0] and banner is self._streamed[1]:
+                    # Unchanged: the flash animates with partial updates only
+                    now = time.monotonic()
+                    self._tracer.shown(now, now)
+                else:
+                    frame = render_frame(self.connection.active_device, data, self.history, flash=False)
+                    self._flash.set_active(bool(data.get("alerts")))
+                    self.power.data(data, self._flash.active)
+                    if banner is not None:
+                        frame = overlay_alert_banner(frame, banner[1], banner[2])
+                    # Retried next tick if the backend dropped it (preview fps limit)
+                    if self._show(self._flash.apply(frame)):
+                        self._streamed = (data, banner)
+
+                # Offer new data to the phones (pushed on change, rate-limited
+                # per phone to the device's refresh_ms)
+                if self._phone_input and data is not self._sensor_pushed:
+                    self._sensor_pushed = data
                     device = self.connection.active_device
                     self._phone_input.send_sensor_data(
                         device_id=device.id,
@@ -492,10 +776,12 @@ class ScouterHUD:
                         device_type=device.type,
                         data=data,
                         schema=device.schema,
+                        refresh_ms=device.refresh_ms,
+                        levels=device.thresholds.levels(data),
                     )
             elif self.connection.active_device:
                 device_id = self.connection.active_device.id
-                self.display.show(render_connecting_screen(device_id))
+                self._show(render_connecting_screen(device_id))
 
         elif self._state == AppState.DEVICE_LIST:
             active_id = self.connection.active_device.id if self.connection.active_device else ""
@@ -504,20 +790,132 @@ class ScouterHUD:
                 self._device_list_index,
                 active_id,
             )
-            self.display.show(frame)
+            self._show(self._with_alert_banner(frame))
 
         elif self._state == AppState.ERROR:
-            self.display.show(render_error_screen(self._error_msg))
+            self._show(render_error_screen(self._error_msg))
+
+    def _frame_step(self, input_driven: bool, next_frame: float) -> float:
+        """Full render when due (input always gets one), then any animation
+        step; returns the next full-frame deadline."""
+        if input_driven or time.monotonic() >= next_frame:
+            self._render()
+            now = time.monotonic()
+            self.budget.frame_done(None if input_driven else next_frame, now)
+            self.power.update(self._state.name, now)
+            next_frame = now + self._frame_interval()
+            self._flash.set_period(self.budget.flash_period)
+        # Also after a full render: an unchanged STREAMING frame pushes no
+        # border, so a toggle due in the same wake-up would otherwise be lost
+        # (a no-op when apply() already drew the current phase)
+        self._update_animations()
+        return next_frame
+
+    def _frame_interval(self) -> float:
+        """Time until the next idle render, from the render budget."""
+        device = self.connection.active_device
+        refresh_ms = device.refresh_ms if device and self._state == AppState.STREAMING else None
+        return self.budget.next_interval(self._state.name, refresh_ms, self.power.interval_scale)
+
+    def _update_animations(self) -> None:
+        """Push animation steps due between full frames (border strips only)."""
+        if self._state != AppState.STREAMING:
+            return
+        step = self._flash.update()
+        if step is not None:
+            image, boxes = step
+            start = time.monotonic()
+            self.display.show_regions(image, boxes)
+            self.power.frame_sent(screen_share(boxes))
+            self.perf.record("display.show_partial", time.monotonic() - start)
+            self.perf.count("flash.toggles")
+
+    def _current_banner(self) -> tuple[str, str, str, float] | None:
+        """The background-alert banner, or None once it has expired."""
+        with self._data_lock:
+            banner = self._alert_banner
+            if banner and time.monotonic() >= banner[3]:
+                self._alert_banner = banner = None
+        return banner
+
+    def _with_alert_banner(self, frame: "Image.Image") -> "Image.Image":
+        """Overlay the background-alert banner while it is current."""
+        banner = self._current_banner()
+        if banner is None:
+            return frame
+        return overlay_alert_banner(frame, banner[1], banner[2])
+
+    def _show(self, frame: "Image.Image", box: Box | None = None) -> bool:
+        """Send a frame (or only its box region) to the display backend and
+        close pending latency traces.
+
+        Returns False if the backend dropped a full frame without it being
+        on screen (rate-limited preview); a repeat of the frame on screen
+        counts as shown.
+        """
+        rendered_at = time.monotonic()
+        on_screen = True
+        if box is None:
+            sent, repeats = self.display.frames_shown, self.display.frames_skipped
+            self.display.show(frame)
+            if self.display.frames_shown != sent:
+                self.budget.display_time(time.monotonic() - rendered_at)
+                self.power.frame_sent()
+            else:
+                on_screen = self.display.frames_skipped != repeats
+        else:
+            self.display.show_region(frame, box)
+            self.power.frame_sent(screen_share([box]))
+        shown_at = time.monotonic()
+        self.perf.record("display.show", shown_at - rendered_at)
+        self._tracer.shown(rendered_at, shown_at)
+        if self._profiler:
+            self._profiler.first_frame()
+        return on_screen
 
     # ── Callbacks ──
 
     def _on_data(self, data: dict[str, Any]) -> None:
+        device = self.connection.active_device
+        if device is not None:
+            self.history.record(device.id, data)
+            # HUD-side rules: merged into the device's own alerts for display
+            hud_alerts = [a.message for a in self.rules.evaluate(
+                device.id, data, device.schema, device.type)]
+            if hud_alerts:
+                device_alerts = data.get("alerts")
+                device_alerts = device_alerts if isinstance(device_alerts, list) else []
+                extra = [m for m in hud_alerts if m not in device_alerts]
+                if extra:
+                    data = {**data, "alerts": device_alerts + extra}
         with self._data_lock:
             was_none = self._latest_data is None
             self._latest_data = data
         if was_none:
             log.info("First data received — display should update now")
 
+    def _on_background_alert(self, link: DeviceLink, messages: list[str], critical: bool) -> None:
+        """DeviceWatcher callback (MQTT thread): banner, and switch on critical alerts."""
+        title = f"! {link.name or link.id}"
+        with self._data_lock:
+            self._alert_banner = (link.id, title, " ".join(messages), time.monotonic() + ALERT_BANNER_SECONDS)
+        self.perf.count("watcher.banners")
+        self.power.activity()
+        if critical and self._auto_switch:
+            self.input.bus.push(
+                InputEvent(type=EventType.DEVICE_ALERT, value=link.id, source="watcher")
+            )
+
+    def _on_qr_scanned(self, payload: str) -> None:
+        """Webcam scanner callback (scanner thread): hand the code to the main loop."""
+        # Start the token lookup now, while the event waits for the next frame
+        link = parse_qrlink_url(payload)
+        if link:
+            self.auth.prewarm(link)
+        self.input.bus.push(
+            InputEvent(type=EventType.QRLINK_RECEIVED, value=payload, source="camera")
+        )
+
     def _on_meta(self, meta: dict[str, Any]) -> None:
         log.info(f"Device metadata: name={meta.get('name')}, type={meta.get('type')}")
 
@@ -559,6 +957,10 @@ Controls (preview: w/a/s/d, enter, x, q | pygame: arrows, enter, escape):
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--scan", metavar="QR_IMAGE", help="Scan QR from image file")
     mode.add_argument("--demo", metavar="DEVICE_ID", help="Connect directly by device ID")
+    mode.add_argument(
+        "--webcam", action="store_true",
+        help="Scan QR codes continuously from the webcam (requires OpenCV)",
+    )
 
     parser.add_argument("--broker", default="localhost:1883", help="MQTT broker host:port")
     parser.add_argument("--topic", help="MQTT topic (required for --demo)")
@@ -587,14 +989,58 @@ Controls (preview: w/a/s/d, enter, x, q | pygame: arrows, enter, escape):
         "--phone", nargs="?", const=8765, type=int, metavar="PORT",
         help="Enable phone WebSocket control (default port: 8765)",
     )
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Log per-import and per-phase startup timing up to the first frame",
+    )
+    parser.add_argument(
+        "--perf-stats", nargs="?", const=10.0, type=float, metavar="SECONDS",
+        help="Log performance stats (input-to-display latency etc.) every N seconds (default: 10)",
+    )
+
+    parser.add_argument(
+        "--layouts", metavar="DIR",
+        help="Load device layouts (*.yaml / *.json) from a directory, see scouterhud/display/layout.py",
+    )
+    parser.add_argument(
+        "--auto-switch", action="store_true",
+        help="Switch to a background device when one of its rules raises a critical alert",
+    )
+    parser.add_argument(
+        "--rules", metavar="FILE",
+        help="Extra HUD-side alert rules (YAML or JSON list, see scouterhud/telemetry/rules.py)",
+    )
 
     args = parser.parse_args()
 
     if args.preview and args.spi:
         parser.error("--preview and --spi are mutually exclusive")
 
-    if not args.scan and not args.demo and args.phone is None:
-        parser.error("At least one of --scan, --demo, or --phone is required")
+    if not args.scan and not args.demo and not args.webcam and args.phone is None:
+        parser.error("At least one of --scan, --demo, --webcam or --phone is required")
+
+    rules = None
+    if args.rules:
+        from scouterhud.telemetry.rules import load_rules
+
+        try:
+            rules = load_rules(args.rules)
+        except (OSError, ValueError) as e:
+            parser.error(f"--rules: {e}")
+
+    if args.layouts:
+        from scouterhud.display.layout import load_layout_dir
+
+        load_layout_dir(args.layouts)
+
+    profiler = None
+    if args.profile_startup:
+        profiler = _startup_profiler
+        if profiler is None:  # flag not in sys.argv at import (abbreviated)
+            from scouterhud.perf.startup import StartupProfiler
+
+            profiler = StartupProfiler()
+            profiler.install()
 
     hud = ScouterHUD(
         use_preview=args.preview,
@@ -603,6 +1049,10 @@ Controls (preview: w/a/s/d, enter, x, q | pygame: arrows, enter, escape):
         rotation=args.rotation,
         mirror=args.mirror,
         phone_port=args.phone,
+        profiler=profiler,
+        perf_log_interval=args.perf_stats,
+        rules=rules,
+        auto_switch=args.auto_switch,
     )
 
     if args.spi:
@@ -618,6 +1068,8 @@ Controls (preview: w/a/s/d, enter, x, q | pygame: arrows, enter, escape):
         if not args.topic:
             parser.error("--topic is required with --demo")
         hud.run_demo(args.demo, args.broker, args.topic, args.auth)
+    elif args.webcam:
+        hud.run_webcam()
     elif args.phone is not None:
         hud.run_phone()
 
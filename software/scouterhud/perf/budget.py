@@ -0,0 +1,182 @@
+"""Render budget: how often the main loop renders, per state and device.
+
+The loop used to render at a fixed 20 FPS whatever was on screen. The
+budget picks the interval instead:
+
+  - STREAMING polls for new data at a quarter of the device's refresh_ms
+    (so a new value is on screen within a quarter period), capped at
+    MAX_STREAM_INTERVAL. A 2 s thermostat is checked 4x a second, a
+    100 ms OBD-II adapter at the full frame rate.
+  - Screens that only change on input (scanning, error) use IDLE_INTERVAL.
+  - No state renders faster than the display can take: the measured
+    transfer time (DisplayBackend.show) may use at most MAX_DISPLAY_DUTY
+    of every interval.
+  - On a low, discharging battery every interval is doubled.
+
+When the Pi is CPU-bound the loop wakes up late. Frames whose deadline
+already passed are skipped (the next one is scheduled from now, not
+caught up), and if lateness stays high the budget degrades one level at
+a time: each level doubles the interval and the alert flash period.
+Levels are given back after RECOVER_S of punctual frames.
+
+Input still renders immediately; the budget only sets the idle cadence.
+"""
+
+import glob
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+# Fastest cadence (~20 FPS)
+BASE_INTERVAL = 0.05
+# Slowest STREAMING poll, whatever the device's refresh_ms
+MAX_STREAM_INTERVAL = 0.25
+# Static screens
+IDLE_INTERVAL = 0.25
+STATIC_STATES = frozenset({"SCANNING", "ERROR", "CONNECTING"})
+
+# Share of each interval the display transfer may take
+MAX_DISPLAY_DUTY = 0.5
+# Smoothing for transfer time and lateness
+EWMA_ALPHA = 0.2
+
+# Degrade when frames are late by this share of the interval on average...
+LATE_DEGRADE = 0.5
+# ...and recover after RECOVER_S with lateness below LATE_RECOVER
+LATE_RECOVER = 0.1
+RECOVER_S = 5.0
+MAX_DEGRADE = 3
+
+LOW_BATTERY_PCT = 20
+BATTERY_POLL_S = 30.0
+
+# Frame timestamps kept for the achieved FPS
+FPS_WINDOW = 32
+
+
+def read_battery(root: str = "/sys/class/power_supply") -> tuple[int, bool] | None:
+    """(percent, discharging) of the first system battery, None if there is none."""
+    for supply in sorted(glob.glob(f"{root}/*")):
+        path = Path(supply)
+        try:
+            if (path / "type").read_text().strip() != "Battery":
+                continue
+            pct = int((path / "capacity").read_text().strip())
+            status = (path / "status").read_text().strip()
+        except (OSError, ValueError):
+            continue
+        return pct, status == "Discharging"
+    return None
+
+
+class RenderBudget:
+    """Picks the frame interval and tracks target vs achieved frame rate."""
+
+    def __init__(
+        self,
+        base_interval: float = BASE_INTERVAL,
+        flash_period: float = 0.5,
+        battery: Callable[[], tuple[int, bool] | None] | None = read_battery,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._base = base_interval
+        self._flash_period = flash_period
+        self._battery = battery
+        self._clock = clock
+
+        self._show_s = 0.0   # EWMA display transfer time
+        self._late = 0.0     # EWMA lateness / interval
+        self._punctual_since: float | None = None
+        self._battery_at = -BATTERY_POLL_S
+        self._low_battery = False
+        self._frames: deque[float] = deque(maxlen=FPS_WINDOW)
+
+        self.level = 0       # degrade level (0 = full rate)
+        self.interval = base_interval  # last interval handed out
+        self.skipped = 0
+        self.degrades = 0
+
+    # ── Measurements ──
+
+    def display_time(self, seconds: float) -> None:
+        """Record one full-frame transfer to the display."""
+        self._show_s += EWMA_ALPHA * (seconds - self._show_s)
+
+    def frame_done(self, due: float | None, now: float | None = None) -> None:
+        """A full frame was rendered; due is its deadline (None: input-driven)."""
+        now = self._clock() if now is None else now
+        self._frames.append(now)
+        if due is None:
+            return
+        late = max(0.0, now - due)
+        if late >= self.interval:
+            self.skipped += int(late / self.interval)
+        self._late += EWMA_ALPHA * (late / self.interval - self._late)
+
+        if self._late > LATE_DEGRADE and self.level < MAX_DEGRADE:
+            self.level += 1
+            self.degrades += 1
+            self._late = 0.0
+            self._punctual_since = None
+        elif self._late < LATE_RECOVER and self.level:
+            if self._punctual_since is None:
+                self._punctual_since = now
+            elif now - self._punctual_since >= RECOVER_S:
+                self.level -= 1
+                self._punctual_since = now
+        else:
+            self._punctual_since = None
+
+    # ── Decisions ──
+
+    def next_interval(self, state: str, refresh_ms: Any = None, scale: float = 1.0) -> float:
+        """Interval until the next idle full render in state.
+
+        scale stretches it further (PowerGovernor.interval_scale while dimmed).
+        """
+        if state in STATIC_STATES:
+            interval = IDLE_INTERVAL
+        elif state == "STREAMING" and isinstance(refresh_ms, (int, float)) and refresh_ms > 0:
+            interval = min(max(refresh_ms / 4000.0, self._base), MAX_STREAM_INTERVAL)
+        else:
+            interval = self._base
+        interval = max(interval, self._show_s / MAX_DISPLAY_DUTY)
+        if self._on_low_battery():
+            interval *= 2
+        self.interval = interval * scale * (2 ** self.level)
+        return self.interval
+
+    @property
+    def flash_period(self) -> float:
+        """Alert flash period for the current degrade level."""
+        return self._flash_period * (2 ** self.level)
+
+    def _on_low_battery(self) -> bool:
+        if self._battery is None:
+            return False
+        now = self._clock()
+        if now - self._battery_at >= BATTERY_POLL_S:
+            self._battery_at = now
+            state = self._battery()
+            self._low_battery = bool(state and state[1] and state[0] <= LOW_BATTERY_PCT)
+        return self._low_battery
+
+    # ── Reporting ──
+
+    def achieved_fps(self) -> float:
+        frames = self._frames
+        if len(frames) < 2 or frames[-1] <= frames[0]:
+            return 0.0
+        return (len(frames) - 1) / (frames[-1] - frames[0])
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "target_fps": round(1.0 / self.interval, 1),
+            "achieved_fps": round(self.achieved_fps(), 1),
+            "level": self.level,
+            "degrades": self.degrades,
+            "skipped": self.skipped,
+            "display_ms": round(self._show_s * 1000.0, 2),
+            "low_battery": self._low_battery,
+        }
@@ -0,0 +1,64 @@
+"""Input-to-display latency tracing.
+
+Every InputEvent carries its creation time (`timestamp`) and collects
+stage marks in `event.trace` as it moves through the HUD:
+
+    timestamp ── queue ──► dequeued ── dispatch ──► handled
+              ── render ──► rendered ── show ──► shown
+
+The tracer keeps events that have been handled but not yet displayed and,
+when the next frame reaches the display, records each stage per source
+into PerfStats histograms named `latency.<source>.<stage>`. Backends that
+can estimate wire delay (Gauntlet BLE) set `event.transport_latency`,
+recorded as `latency.<source>.transport`.
+"""
+
+import time
+
+from scouterhud.input.events import InputEvent
+from scouterhud.perf.metrics import PerfStats
+
+# Bound on events waiting for a frame (e.g. while in CONNECTING nothing is shown)
+MAX_PENDING = 256
+
+
+class LatencyTracer:
+    """Records per-source, per-stage latency from input to display."""
+
+    def __init__(self, stats: PerfStats):
+        self._stats = stats
+        self._pending: list[InputEvent] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def handled(self, event: InputEvent) -> None:
+        """Mark an event as dispatched by the app state machine."""
+        event.trace["handled"] = time.monotonic()
+        if len(self._pending) < MAX_PENDING:
+            self._pending.append(event)
+
+    def shown(self, rendered_at: float, shown_at: float) -> None:
+        """A frame finished rendering at rendered_at and was on the display at shown_at."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        for event in pending:
+            self._record(event, rendered_at, shown_at)
+
+    def _record(self, event: InputEvent, rendered_at: float, shown_at: float) -> None:
+        source = event.source or "unknown"
+        prefix = f"latency.{source}"
+        trace = event.trace
+        created = event.timestamp
+        dequeued = trace.get("dequeued", created)
+        handled = trace.get("handled", dequeued)
+
+        self._stats.record(f"{prefix}.queue", max(0.0, dequeued - created))
+        self._stats.record(f"{prefix}.dispatch", max(0.0, handled - dequeued))
+        self._stats.record(f"{prefix}.render", max(0.0, rendered_at - handled))
+        self._stats.record(f"{prefix}.show", max(0.0, shown_at - rendered_at))
+        self._stats.record(f"{prefix}.total", max(0.0, shown_at - created))
+        if event.transport_latency is not None:
+            self._stats.record(f"{prefix}.transport", event.transport_latency)
@@ -0,0 +1,139 @@
+"""Runtime performance stats for the HUD.
+
+PerfStats is a small registry of latency histograms, counters and gauges,
+plus "providers" — callables that return a dict of live metrics from other
+components (input bus, phone server, display backend). snapshot() merges
+everything into one JSON-friendly dict; summary_lines() formats it for logs.
+"""
+
+import threading
+from typing import Any, Callable
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (constant memory, O(buckets) record)."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self._bounds = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum_s = 0.0
+        self.min_s = float("inf")
+        self.max_s = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        idx = len(self._bounds)
+        for i, bound in enumerate(self._bounds):
+            if ms <= bound:
+                idx = i
+                break
+        with self._lock:
+            self._counts[idx] += 1
+            self.count += 1
+            self.sum_s += seconds
+            if seconds < self.min_s:
+                self.min_s = seconds
+            if seconds > self.max_s:
+                self.max_s = seconds
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile in ms (upper bound of the matching bucket)."""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            target = pct / 100.0 * self.count
+            seen = 0
+            for i, n in enumerate(self._counts):
+                seen += n
+                if seen >= target and n:
+                    if i < len(self._bounds):
+                        return float(self._bounds[i])
+                    return self.max_s * 1000.0
+            return self.max_s * 1000.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_s / self.count * 1000.0 if self.count else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 2),
+            "min_ms": round(self.min_s * 1000.0, 2) if self.count else 0.0,
+            "max_ms": round(self.max_s * 1000.0, 2),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip([*map(str, self._bounds), "inf"], list(self._counts))),
+        }
+
+
+class PerfStats:
+    """Registry of histograms, counters, gauges and metric providers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+        self._providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, LatencyHistogram())
+        return hist
+
+    def record(self, name: str, seconds: float) -> None:
+        self.histogram(name).record(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def add_provider(self, name: str, provider: Callable[[], dict[str, Any]]) -> None:
+        """Register a callable whose dict is included in snapshot() under name."""
+        self._providers[name] = provider
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+        out: dict[str, Any] = {
+            "latency": {name: h.snapshot() for name, h in sorted(histograms.items())},
+            "counters": counters,
+            "gauges": dict(self._gauges),
+        }
+        for name, provider in self._providers.items():
+            try:
+                out[name] = provider()
+            except Exception as e:
+                out[name] = {"error": str(e)}
+        return out
+
+    def summary_lines(self) -> list[str]:
+        """Compact one-line-per-metric summary for logging."""
+        snap = self.snapshot()
+        lines = []
+        for name, h in snap["latency"].items():
+            if h["count"]:
+                lines.append(
+                    f"{name}: n={h['count']} mean={h['mean_ms']}ms "
+                    f"p50={h['p50_ms']}ms p95={h['p95_ms']}ms max={h['max_ms']}ms"
+                )
+        for name, value in sorted(snap["counters"].items()):
+            lines.append(f"{name}: {value}")
+        for name, value in sorted(snap["gauges"].items()):
+            lines.append(f"{name}: {value:.2f}")
+        for name in self._providers:
+            lines.append(f"{name}: {snap[name]}")
+        return lines
@@ -0,0 +1,189 @@
+"""Power governor: backlight and frame rate by what the wearer needs to see.
+
+The backlight and SPI traffic are the HUD's main battery drains. The
+governor dims the backlight and slows the render budget (perf/budget.py)
+when nothing needs attention:
+
+  - in SCANNING, or
+  - while STREAMING values that have stayed within STABLE_TOLERANCE of
+    each other for STABLE_AFTER_S (unchanged data is the zero case)
+
+but only once there has been no input for IDLE_AFTER_S. Input, an alert
+in the device data or a background-device alert wakes it to full
+brightness and full rate at once; active alerts keep it awake.
+
+It also estimates the power draw from backlight duty (time-weighted
+brightness) and frames sent, using rough EnergyModel constants for the
+Pi Zero 2W + ST7789 module. Partial updates count as the share of the
+screen they cover. The estimate is for comparing settings (see
+benchmarks/power_governor.py), not a fuel gauge.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from scouterhud.display.backend import DISPLAY_HEIGHT, DISPLAY_WIDTH, Box
+
+FULL_BRIGHTNESS = 255
+DIM_BRIGHTNESS = 80
+# Render interval multiplier while dimmed
+DIM_RATE_SCALE = 3.0
+
+IDLE_AFTER_S = 10.0
+STABLE_AFTER_S = 20.0
+# Relative change between readings still counted as stable
+STABLE_TOLERANCE = 0.02
+
+
+@dataclass(frozen=True)
+class EnergyModel:
+    """Rough energy costs from datasheet figures (for comparisons only)."""
+
+    backlight_mw: float = 66.0  # 20 mA at 3.3 V, full brightness
+    frame_mj: float = 9.0       # render + RGB565 conversion + 115 KB SPI write
+
+    def power_mw(self, duty: float, frames_per_s: float) -> float:
+        return self.backlight_mw * duty + self.frame_mj * frames_per_s
+
+
+def screen_share(boxes: list[Box]) -> float:
+    """Share of the screen covered by (non-overlapping) boxes."""
+    area = sum(max(0, x1 - x0) * max(0, y1 - y0) for x0, y0, x1, y1 in boxes)
+    return area / (DISPLAY_WIDTH * DISPLAY_HEIGHT)
+
+
+def _numbers(data: dict[str, Any]) -> dict[str, float]:
+    return {
+        k: float(v) for k, v in data.items()
+        if isinstance(v, (int, float)) and not isinstance(v, bool) and k != "ts"
+    }
+
+
+class PowerGovernor:
+    """Dims the backlight and slows rendering while nothing needs attention."""
+
+    def __init__(
+        self,
+        set_brightness: Callable[[int], None] | None = None,
+        full: int = FULL_BRIGHTNESS,
+        dim: int = DIM_BRIGHTNESS,
+        model: EnergyModel = EnergyModel(),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._set_brightness = set_brightness
+        self._full, self._dim = full, dim
+        self._model = model
+        self._clock = clock
+
+        now = clock()
+        self._started = now
+        self._last_activity = now
+        self._alerting = False
+        # Stable data: values at the start of the stable run, and its start time
+        self._anchor: dict[str, float] = {}
+        self._stable_since: float | None = None
+
+        self.brightness = full
+        self.dimmed = False
+        self.dims = 0
+        self.wakes = 0
+        # Backlight integral (brightness fraction x seconds) and frames sent
+        self._duty_s = 0.0
+        self._duty_at = now
+        self.frames = 0.0
+
+    # ── Inputs ──
+
+    def activity(self, now: float | None = None) -> None:
+        """User input or a background alert: wake and restart the idle timer."""
+        self._last_activity = self._clock() if now is None else now
+
+    def data(self, data: dict[str, Any], alerting: bool, now: float | None = None) -> None:
+        """A new data dict from the active device."""
+        now = self._clock() if now is None else now
+        self._alerting = alerting
+        values = _numbers(data)
+        if self._stable_since is None or not self._within_tolerance(values):
+            self._anchor = values
+            self._stable_since = now
+
+    def _within_tolerance(self, values: dict[str, float]) -> bool:
+        anchor = self._anchor
+        if values.keys() != anchor.keys():
+            return False
+        for k, v in values.items():
+            ref = anchor[k]
+            if abs(v - ref) > STABLE_TOLERANCE * max(abs(ref), 1.0):
+                return False
+        return True
+
+    def frame_sent(self, share: float = 1.0) -> None:
+        """A frame (or share of the screen, for partial updates) went to the display."""
+        self.frames += share
+
+    # ── Decisions ──
+
+    def update(self, state: str, now: float | None = None) -> bool:
+        """Apply the backlight level for state; True while dimmed."""
+        now = self._clock() if now is None else now
+        dim = self._should_dim(state, now)
+        if dim != self.dimmed:
+            self._integrate(now)
+            self.dimmed = dim
+            if dim:
+                self.dims += 1
+            else:
+                self.wakes += 1
+            self.brightness = self._dim if dim else self._full
+            if self._set_brightness is not None:
+                self._set_brightness(self.brightness)
+        if state != "STREAMING":
+            self._stable_since = None
+        return dim
+
+    def _should_dim(self, state: str, now: float) -> bool:
+        if self._alerting and state == "STREAMING":
+            return False
+        if now - self._last_activity < IDLE_AFTER_S:
+            return False
+        if state == "SCANNING":
+            return True
+        if state == "STREAMING" and self._stable_since is not None:
+            return now - self._stable_since >= STABLE_AFTER_S
+        return False
+
+    @property
+    def interval_scale(self) -> float:
+        return DIM_RATE_SCALE if self.dimmed else 1.0
+
+    # ── Energy estimate ──
+
+    def _integrate(self, now: float) -> None:
+        self._duty_s += (now - self._duty_at) * self.brightness / 255.0
+        self._duty_at = now
+
+    def energy(self, now: float | None = None) -> dict[str, float]:
+        """Backlight duty, frame rate and estimated power since start."""
+        now = self._clock() if now is None else now
+        self._integrate(now)
+        elapsed = now - self._started
+        if elapsed <= 0:
+            return {"backlight_duty": self.brightness / 255.0, "frames_per_s": 0.0, "mwh_per_hour": 0.0}
+        duty = self._duty_s / elapsed
+        fps = self.frames / elapsed
+        return {
+            "backlight_duty": round(duty, 3),
+            "frames_per_s": round(fps, 2),
+            # Average mW over the run = mWh per hour of use
+            "mwh_per_hour": round(self._model.power_mw(duty, fps), 1),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "brightness": self.brightness,
+            "dimmed": self.dimmed,
+            "dims": self.dims,
+            "wakes": self.wakes,
+            **self.energy(),
+        }
@@ -0,0 +1,122 @@
+"""Boot-time profiler for the HUD entry point.
+
+Enabled with `--profile-startup`. Records:
+  - per-import time for every module loaded while profiling is active
+    (inclusive of its own sub-imports, like `python -X importtime`)
+  - per-phase wall time (display init, input init, first frame, ...)
+  - time from profiler start to the first frame sent to the display
+
+The report is logged once the first frame is on the display.
+"""
+
+import builtins
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+log = logging.getLogger("scouterhud.perf.startup")
+
+# Target on the Pi Zero 2W: first rendered frame in under one second
+FIRST_FRAME_TARGET_S = 1.0
+
+
+class StartupProfiler:
+    """Collects import and phase timings until the first rendered frame."""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self._phases: list[tuple[str, float]] = []
+        self._imports: list[tuple[str, float, int]] = []  # (module, seconds, depth)
+        self._first_frame: float | None = None
+        self._orig_import = None
+        self._local = threading.local()
+
+    # ── Import hook ──
+
+    def install(self) -> None:
+        """Start timing imports (wraps builtins.__import__)."""
+        if self._orig_import is not None:
+            return
+        self._orig_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """Stop timing imports and restore the original __import__."""
+        if self._orig_import is None:
+            return
+        builtins.__import__ = self._orig_import
+        self._orig_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import or builtins.__import__
+        # Fast path: already imported or relative import
+        if level != 0 or name in sys.modules:
+            return orig(name, globals, locals, fromlist, level)
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.depth = depth
+            if name in sys.modules:
+                self._imports.append((name, elapsed, depth))
+
+    # ── Phases ──
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def first_frame(self) -> None:
+        """Mark the first frame as displayed, stop profiling and log the report."""
+        if self._first_frame is not None:
+            return
+        self._first_frame = time.perf_counter() - self._t0
+        self.uninstall()
+        for line in self.report():
+            log.info(line)
+
+    @property
+    def first_frame_seconds(self) -> float | None:
+        """Seconds from profiler start to the first frame, or None if not yet shown."""
+        return self._first_frame
+
+    def report(self, top: int = 15) -> list[str]:
+        """Build the human-readable startup report."""
+        lines = ["Startup profile:"]
+
+        for name, seconds in self._phases:
+            lines.append(f"  phase  {seconds * 1000:8.1f} ms  {name}")
+
+        # Top-level imports only (depth 0) — nested ones are included in their parent
+        top_level = sorted(
+            (i for i in self._imports if i[2] == 0),
+            key=lambda i: i[1],
+            reverse=True,
+        )
+        for name, seconds, _depth in top_level[:top]:
+            lines.append(f"  import {seconds * 1000:8.1f} ms  {name}")
+        total_imports = sum(i[1] for i in self._imports if i[2] == 0)
+        lines.append(
+            f"  imports total {total_imports * 1000:.1f} ms "
+            f"({len(self._imports)} modules)"
+        )
+
+        if self._first_frame is not None:
+            verdict = "OK" if self._first_frame < FIRST_FRAME_TARGET_S else "SLOW"
+            lines.append(
+                f"  first frame after {self._first_frame * 1000:.1f} ms "
+                f"(target < {FIRST_FRAME_TARGET_S * 1000:.0f} ms: {verdict})"
+            )
+        return lines
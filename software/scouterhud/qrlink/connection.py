@@ -6,6 +6,7 @@ Currently supports: MQTT. Future: HTTP/SSE, WebSocket, BLE.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable
 
 from scouterhud.qrlink.protocol import DeviceLink
@@ -16,6 +17,9 @@ log = logging.getLogger(__name__)
 DataCallback = Callable[[dict[str, Any]], None]
 MetaCallback = Callable[[dict[str, Any]], None]
 
+# Parallel $meta fetches when enrolling many devices at once
+MAX_ENROLL_WORKERS = 8
+
 
 class ConnectionManager:
     """Manages active connection and device history for multi-device switching."""
@@ -35,8 +39,13 @@ class ConnectionManager:
         link: DeviceLink,
         on_data: DataCallback,
         on_meta: MetaCallback | None = None,
+        credentials: "tuple[str, str] | Future | None" = None,
     ) -> bool:
-        """Connect to a device. Disconnects any previous connection first."""
+        """Connect to a device. Disconnects any previous connection first.
+
+        credentials: MQTT (username, password), or a Future resolving to
+        them (see AuthManager.prewarm), for token-auth devices.
+        """
         self._on_data = on_data
         self._on_meta = on_meta
 
@@ -44,7 +53,7 @@ class ConnectionManager:
         self.disconnect()
 
         if link.proto == "mqtt":
-            transport = MQTTTransport(link)
+            transport = MQTTTransport(link, credentials=credentials)
             if transport.connect(on_data, on_meta):
                 self._transport = transport
                 self._active_link = link
@@ -84,6 +93,49 @@ class ConnectionManager:
             return False
         return self.connect(link, self._on_data, self._on_meta)
 
+    def enroll(
+        self,
+        links: list[DeviceLink],
+        fetch_metadata: bool = True,
+        timeout: float = 3.0,
+    ) -> list[DeviceLink]:
+        """Add devices to history without connecting to them.
+
+        Devices already known (by id) are skipped. Metadata for the new
+        devices is fetched concurrently, so enrolling a ward's worth of QR
+        codes takes about one fetch timeout instead of one per device.
+        Returns the newly enrolled links.
+        """
+        known = {d.id for d in self._known_devices}
+        new: list[DeviceLink] = []
+        for link in links:
+            if link.id not in known:
+                known.add(link.id)
+                new.append(link)
+
+        if fetch_metadata and new:
+            mqtt_links = [link for link in new if link.proto == "mqtt"]
+            if mqtt_links:
+                workers = min(MAX_ENROLL_WORKERS, len(mqtt_links))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enroll") as pool:
+                    results = list(pool.map(
+                        lambda link: self._fetch_metadata(link, timeout), mqtt_links
+                    ))
+                log.info(f"Metadata fetched for {sum(results)}/{len(mqtt_links)} devices")
+
+        # Appended after existing entries, so the active index stays valid
+        self._known_devices.extend(new)
+        log.info(f"Enrolled {len(new)} devices ({len(links) - len(new)} already known)")
+        return new
+
+    @staticmethod
+    def _fetch_metadata(link: DeviceLink, timeout: float) -> bool:
+        try:
+            return MQTTTransport(link).fetch_metadata(timeout=timeout)
+        except Exception as e:
+            log.warning(f"Metadata fetch failed for {link.id}: {e}")
+            return False
+
     def _add_to_history(self, link: DeviceLink) -> None:
         """Add device to history, avoiding duplicates."""
         # Remove if already exists (will re-add at end)
@@ -4,13 +4,20 @@ Parses the compact URL format:
     qrlink://v1/{id}/{proto}/{endpoint}[?auth={auth}&t={topic}]
 
 And validates the result into a DeviceLink dataclass.
+
+Parsing is memoized per URL string (a QR that stays in front of the
+camera, or is re-sent by the phone, is parsed once). Callers still get a
+fresh DeviceLink each time because DeviceLink is mutated by metadata.
 """
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+from scouterhud.telemetry.thresholds import ThresholdTable
+
 log = logging.getLogger(__name__)
 
 SUPPORTED_PROTOS = {"mqtt", "http", "ws", "ble", "mdns"}
@@ -34,14 +41,30 @@ class DeviceLink:
     type: str | None = None
     icon: str | None = None
     refresh_ms: int = 2000
-    layout: str = "auto"
+    layout: str | dict[str, Any] = "auto"  # name, or an inline layout (display/layout.py)
     auth_hint: str | None = None
     schema: dict[str, Any] = field(default_factory=dict)
 
+    # Compiled from schema (see thresholds); rebuilt when schema is replaced
+    _thresholds: ThresholdTable | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def endpoint(self) -> str:
         return f"{self.host}:{self.port}"
 
+    @property
+    def key(self) -> tuple:
+        """Identity of the device endpoint (same QR-Link → same key)."""
+        return (self.id, self.proto, self.host, self.port, self.topic)
+
+    @property
+    def thresholds(self) -> ThresholdTable:
+        """Alert/warning bands per schema field, compiled once per schema."""
+        table = self._thresholds
+        if table is None or table.schema is not self.schema:
+            table = self._thresholds = ThresholdTable(self.schema)
+        return table
+
     @property
     def meta_topic(self) -> str | None:
         """MQTT topic for metadata (retained)."""
@@ -58,6 +81,8 @@ class DeviceLink:
         self.layout = meta.get("layout", self.layout)
         self.auth_hint = meta.get("auth_hint", self.auth_hint)
         self.schema = meta.get("schema", self.schema)
+        if "schema" in meta:
+            self._thresholds = ThresholdTable(self.schema)
 
 
 def parse_qrlink_url(raw: str) -> DeviceLink | None:
@@ -67,6 +92,15 @@ def parse_qrlink_url(raw: str) -> DeviceLink | None:
 
     Returns None if the URL is invalid or not a qrlink URL.
     """
+    template = _parse_qrlink_url_cached(raw)
+    if template is None:
+        return None
+    # Fresh copy: metadata updates must not leak into the cached template
+    return replace(template, schema={})
+
+
+@lru_cache(maxsize=64)
+def _parse_qrlink_url_cached(raw: str) -> DeviceLink | None:
     if not raw.startswith("qrlink://"):
         log.debug(f"Not a qrlink URL: {raw[:40]}")
         return None
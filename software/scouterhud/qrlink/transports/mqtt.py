@@ -2,29 +2,43 @@
 
 Handles connecting to MQTT broker, fetching $meta, subscribing to data topic,
 and streaming data back via a callback.
+
+Token-auth devices get their credentials as a Future (see
+AuthManager.prewarm). It is only awaited once the client is set up, right
+before the CONNECT packet that carries the username/password is sent, so
+the lookup runs alongside everything that precedes the connect.
 """
 
 import json
 import logging
 import threading
-from typing import Any, Callable
-
-import paho.mqtt.client as mqtt
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Callable
 
 from scouterhud.qrlink.protocol import DeviceLink
 
+if TYPE_CHECKING:
+    import paho.mqtt.client as mqtt
+
 log = logging.getLogger(__name__)
 
 DataCallback = Callable[[dict[str, Any]], None]
 MetaCallback = Callable[[dict[str, Any]], None]
+Credentials = tuple[str, str]  # (username, password)
 
 
 class MQTTTransport:
     """Manages MQTT connection for a single QR-Link device."""
 
-    def __init__(self, link: DeviceLink):
+    def __init__(
+        self,
+        link: DeviceLink,
+        credentials: "Credentials | Future[Credentials | None] | None" = None,
+    ):
         self.link = link
-        self._client: mqtt.Client | None = None
+        self._credentials = credentials
+        self._client: "mqtt.Client | None" = None
         self._data_callback: DataCallback | None = None
         self._meta_callback: MetaCallback | None = None
         self._connected = threading.Event()
@@ -43,15 +57,59 @@ class MQTTTransport:
         self._data_callback = on_data
         self._meta_callback = on_meta
 
+        if not self._open(timeout):
+            return False
+
+        # Subscribe to $meta first (retained), then data topic
+        if self.link.meta_topic:
+            self._client.subscribe(self.link.meta_topic, qos=1)
+
+        if self.link.topic:
+            self._client.subscribe(self.link.topic, qos=0)
+
+        # Wait for metadata (retained message should arrive quickly)
+        if self.link.meta_topic:
+            self._meta_received.wait(timeout=3.0)
+
+        return True
+
+    def fetch_metadata(self, timeout: float = 3.0) -> bool:
+        """Connect, read the retained $meta into self.link, and disconnect.
+
+        Used to enroll devices without streaming from them. Returns True if
+        metadata arrived within timeout.
+        """
+        if not self.link.meta_topic:
+            return False
+        if not self._open(timeout):
+            return False
+        try:
+            self._client.subscribe(self.link.meta_topic, qos=1)
+            return self._meta_received.wait(timeout=timeout)
+        finally:
+            self.disconnect()
+
+    def _open(self, timeout: float) -> bool:
+        """Create the client, connect to the broker and wait for CONNACK."""
+        # Imported here so paho is only loaded once a connection is made
+        import paho.mqtt.client as mqtt
+
         self._client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
         self._client.on_connect = self._on_connect
         self._client.on_message = self._on_message
         self._client.on_disconnect = self._on_disconnect
 
+        credentials = self._resolve_credentials(timeout)
+        if credentials:
+            self._client.username_pw_set(*credentials)
+        elif self.link.auth == "token":
+            log.warning(f"No token for {self.link.id}, connecting without credentials")
+
         try:
             self._client.connect(self.link.host, self.link.port, keepalive=60)
         except (ConnectionRefusedError, OSError) as e:
             log.error(f"MQTT connect failed: {e}")
+            self._client = None
             return False
 
         self._client.loop_start()
@@ -61,20 +119,21 @@ class MQTTTransport:
             log.error("MQTT connection timed out")
             self.disconnect()
             return False
-
-        # Subscribe to $meta first (retained), then data topic
-        if self.link.meta_topic:
-            self._client.subscribe(self.link.meta_topic, qos=1)
-
-        if self.link.topic:
-            self._client.subscribe(self.link.topic, qos=0)
-
-        # Wait for metadata (retained message should arrive quickly)
-        if self.link.meta_topic:
-            self._meta_received.wait(timeout=3.0)
-
         return True
 
+    def _resolve_credentials(self, timeout: float) -> Credentials | None:
+        creds = self._credentials
+        if isinstance(creds, Future):
+            try:
+                creds = creds.result(timeout=timeout)
+            except FutureTimeoutError:
+                log.error(f"Credential lookup for {self.link.id} timed out")
+                return None
+            except Exception as e:
+                log.error(f"Credential lookup for {self.link.id} failed: {e}")
+                return None
+        return creds
+
     def disconnect(self) -> None:
         if self._client:
             self._client.loop_stop()
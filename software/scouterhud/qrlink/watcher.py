@@ -0,0 +1,279 @@
+"""Background alert monitoring for known devices that are not on screen.
+
+While the HUD streams one device, the others in the ConnectionManager
+history keep publishing. DeviceWatcher subscribes to their data topics and
+only checks alerts: the device's own `alerts` list / `active_alerts` count
+and the HUD-side rules (see telemetry/rules.py). Nothing is rendered or
+recorded for them.
+
+Devices are grouped by broker: all devices on one broker share a single
+MQTT client (one TCP connection, one network thread), so watching 50 beds
+on the ward broker costs about as much as streaming one. Token devices
+authenticate with their own credentials and get a client each.
+
+on_alert(link, messages, critical) is called from the MQTT network thread
+when a device raises alerts it did not have on its previous message.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Callable
+
+from scouterhud.qrlink.protocol import DeviceLink
+
+if TYPE_CHECKING:
+    import paho.mqtt.client as mqtt
+
+    from scouterhud.telemetry.rules import RuleEngine
+
+log = logging.getLogger(__name__)
+
+AlertCallback = Callable[[DeviceLink, list[str], bool], None]
+CredentialsFor = Callable[[DeviceLink], "tuple[str, str] | Future | None"]
+
+# Upper bound on watched devices (oldest history entries are dropped first)
+MAX_WATCHED = 64
+
+BrokerKey = tuple[str, int, str | None]  # (host, port, username or None)
+
+
+def device_alerts(data: dict[str, Any]) -> list[str]:
+    """Alerts reported by the device itself (alerts list or active_alerts count)."""
+    alerts = data.get("alerts")
+    if isinstance(alerts, list) and alerts:
+        return [str(a) for a in alerts]
+    count = data.get("active_alerts")
+    if isinstance(count, int) and not isinstance(count, bool) and count > 0:
+        return [f"{count} ALERTS"]
+    return []
+
+
+class _BrokerClient:
+    """One MQTT client carrying the data topics of several devices."""
+
+    def __init__(self, key: BrokerKey, on_message: Callable[[DeviceLink, dict[str, Any]], None]):
+        self.key = key
+        self.links: dict[str, DeviceLink] = {}  # data topic → link
+        self._on_data = on_message
+        self._client: "mqtt.Client | None" = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self.connected = False
+
+    def open(self, credentials: "tuple[str, str] | Future | None", timeout: float = 5.0) -> None:
+        """Connect in the background (paho reconnects by itself afterwards)."""
+        import paho.mqtt.client as mqtt
+
+        if isinstance(credentials, Future):
+            try:
+                credentials = credentials.result(timeout=timeout)
+            except FutureTimeoutError:
+                log.warning(f"Credential lookup for watched broker {self.key[0]} timed out")
+                credentials = None
+            except Exception as e:
+                log.warning(f"No credentials for watched broker {self.key[0]}: {e}")
+                credentials = None
+
+        client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        client.on_connect = self._on_connect
+        client.on_disconnect = self._on_disconnect
+        client.on_message = self._on_message
+        if credentials:
+            client.username_pw_set(*credentials)
+        with self._lock:
+            if self._closed:
+                return  # closed before the background open got to run
+            self._client = client
+        client.connect_async(self.key[0], self.key[1], keepalive=60)
+        client.loop_start()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.loop_stop()
+            client.disconnect()
+        self.connected = False
+
+    def add(self, link: DeviceLink) -> None:
+        with self._lock:
+            self.links[link.topic] = link
+            if self.connected and self._client is not None:
+                self._client.subscribe(link.topic, qos=0)
+
+    def remove(self, topic: str) -> None:
+        with self._lock:
+            self.links.pop(topic, None)
+            if self.connected and self._client is not None:
+                self._client.unsubscribe(topic)
+
+    def _on_connect(self, client, userdata, flags, rc, properties=None):
+        if rc != 0:
+            log.warning(f"Watcher connect error on {self.key[0]}:{self.key[1]}: rc={rc}")
+            return
+        with self._lock:
+            self.connected = True
+            topics = list(self.links)
+        # (Re)subscribe everything, also after an automatic reconnect
+        if topics:
+            client.subscribe([(topic, 0) for topic in topics])
+
+    def _on_disconnect(self, client, userdata, flags, rc, properties=None):
+        self.connected = False
+
+    def _on_message(self, client, userdata, msg):
+        link = self.links.get(msg.topic)
+        if link is None:
+            return
+        try:
+            payload = json.loads(msg.payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if isinstance(payload, dict):
+            self._on_data(link, payload)
+
+
+class DeviceWatcher:
+    """Watches alerts of known devices in the background."""
+
+    def __init__(
+        self,
+        rules: "RuleEngine",
+        on_alert: AlertCallback,
+        credentials_for: CredentialsFor | None = None,
+        max_devices: int = MAX_WATCHED,
+    ):
+        """
+        Args:
+            rules: shared rule engine (rule state is per device, so the same
+                engine also serves the streamed device).
+            on_alert: called as (link, new alert messages, critical).
+            credentials_for: MQTT credentials for token devices
+                (e.g. AuthManager.prewarm).
+            max_devices: watched device cap.
+        """
+        self._rules = rules
+        self._on_alert = on_alert
+        self._credentials_for = credentials_for
+        self._max_devices = max_devices
+        self._brokers: dict[BrokerKey, _BrokerClient] = {}
+        self._watched: dict[str, tuple[BrokerKey, str]] = {}  # device id → (broker, topic)
+        self._alerting: dict[str, frozenset[str]] = {}  # device id → last alert messages
+        self._lock = threading.Lock()
+        self._opener: ThreadPoolExecutor | None = None
+        self.messages = 0
+        self.alerts_raised = 0
+
+    @staticmethod
+    def _broker_key(link: DeviceLink) -> BrokerKey:
+        return (link.host, link.port, link.id if link.auth == "token" else None)
+
+    def watch(self, links: list[DeviceLink], exclude: str | None = None) -> None:
+        """Watch exactly these devices (minus exclude, usually the active one).
+
+        Subscriptions are reconciled incrementally: unchanged devices keep
+        their subscription and rule state.
+        """
+        wanted = [
+            link for link in links
+            if link.proto == "mqtt" and link.topic and link.id != exclude
+        ][-self._max_devices:]
+
+        closing: list[_BrokerClient] = []
+        with self._lock:
+            wanted_ids = {link.id for link in wanted}
+            for device_id in [d for d in self._watched if d not in wanted_ids]:
+                key, topic = self._watched.pop(device_id)
+                self._alerting.pop(device_id, None)
+                broker = self._brokers[key]
+                broker.remove(topic)
+                if not broker.links:
+                    del self._brokers[key]
+                    closing.append(broker)
+
+            for link in wanted:
+                key = self._broker_key(link)
+                current = self._watched.get(link.id)
+                if current == (key, link.topic):
+                    # Same subscription; keep the newest link (fresh schema)
+                    self._brokers[key].links[link.topic] = link
+                    continue
+                broker = self._brokers.get(key)
+                if broker is None:
+                    broker = _BrokerClient(key, self._check)
+                    self._brokers[key] = broker
+                    credentials = self._credentials_for(link) if key[2] and self._credentials_for else None
+                    self._open(broker, credentials)
+                broker.add(link)
+                self._watched[link.id] = (key, link.topic)
+
+        # Outside the lock: close() joins the network thread, which may be
+        # waiting for the lock in _check
+        for broker in closing:
+            broker.close()
+
+    def _open(self, broker: _BrokerClient, credentials) -> None:
+        # Opens run on one worker thread: never block the main loop on a
+        # credential lookup or DNS
+        if self._opener is None:
+            self._opener = ThreadPoolExecutor(max_workers=1, thread_name_prefix="watcher")
+        self._opener.submit(self._safe_open, broker, credentials)
+
+    @staticmethod
+    def _safe_open(broker: _BrokerClient, credentials) -> None:
+        try:
+            broker.open(credentials)
+        except Exception as e:
+            log.warning(f"Watcher could not open {broker.key[0]}:{broker.key[1]}: {e}")
+
+    def _check(self, link: DeviceLink, data: dict[str, Any]) -> None:
+        """Alert check for one background message (MQTT network thread)."""
+        fired = self._rules.evaluate(link.id, data, link.schema, link.type or "")
+        messages = device_alerts(data) + [a.message for a in fired]
+        current = frozenset(messages)
+
+        with self._lock:
+            self.messages += 1
+            if link.id not in self._watched:
+                return  # unwatched while the message was in flight
+            previous = self._alerting.get(link.id, frozenset())
+            self._alerting[link.id] = current
+            new = [m for m in messages if m not in previous]
+            if new:
+                self.alerts_raised += 1
+
+        if new:
+            critical = any(a.severity == "critical" and a.message in new for a in fired)
+            log.warning(f"Background alert on {link.id}: {' '.join(new)}")
+            self._on_alert(link, new, critical)
+
+    def alerting(self) -> dict[str, list[str]]:
+        """Current alerts of watched devices (device id → messages)."""
+        with self._lock:
+            return {d: sorted(m) for d, m in self._alerting.items() if m}
+
+    def stop(self) -> None:
+        with self._lock:
+            brokers = list(self._brokers.values())
+            self._brokers.clear()
+            self._watched.clear()
+            self._alerting.clear()
+        if self._opener is not None:
+            self._opener.shutdown(wait=True)
+            self._opener = None
+        for broker in brokers:
+            broker.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "devices": len(self._watched),
+                "brokers": len(self._brokers),
+                "alerting": sum(1 for m in self._alerting.values() if m),
+                "messages": self.messages,
+                "alerts_raised": self.alerts_raised,
+            }
@@ -0,0 +1,217 @@
+"""Per-device, per-field time-series history for trend widgets.
+
+The HUD only shows the latest sample of the active device, which hides
+slow trends (e.g. SpO2 sliding 0.1 %/min). HistoryStore keeps a short
+history of every numeric field, downsampled into fixed-size tiers:
+
+    1 s  x 300   → last 5 minutes
+    10 s x 360   → last hour
+    60 s x 1440  → last day
+
+Each tier is a preallocated float32 ring buffer of bucket means (NaN for
+buckets with no samples), so memory per field is fixed (~8.4 KB) and the
+whole store is capped by MAX_DEVICES x MAX_FIELDS (~4.3 MB worst case).
+The least recently updated device is evicted beyond MAX_DEVICES.
+
+record() is called from the transport thread, series() from the render
+loop; both take a lock. numpy is imported when the first buffer is
+created, so importing this module doesn't slow down startup.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (bucket seconds, number of buckets)
+DEFAULT_TIERS: tuple[tuple[float, int], ...] = ((1.0, 300), (10.0, 360), (60.0, 1440))
+
+MAX_DEVICES = 16
+MAX_FIELDS = 32
+
+
+class _Tier:
+    """Ring buffer of bucket means at one resolution."""
+
+    __slots__ = ("step", "values", "bucket", "_sum", "_count")
+
+    def __init__(self, step: float, capacity: int):
+        import numpy as np
+
+        self.step = step
+        self.values = np.full(capacity, np.nan, dtype=np.float32)
+        self.bucket: int | None = None  # bucket currently accumulating
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, t: float, value: float) -> None:
+        bucket = int(t // self.step)
+        if self.bucket is None:
+            self.bucket = bucket
+        elif bucket > self.bucket:
+            self._advance(bucket)
+        elif bucket < self.bucket:
+            return  # out-of-order sample for a closed bucket
+        self._sum += value
+        self._count += 1
+
+    def _advance(self, bucket: int) -> None:
+        """Close the current bucket and NaN-fill any skipped ones."""
+        import numpy as np
+
+        cap = len(self.values)
+        self.values[self.bucket % cap] = self._sum / self._count if self._count else np.nan
+        gap = bucket - self.bucket - 1
+        if gap >= cap:
+            self.values.fill(np.nan)
+        elif gap > 0:
+            idx = np.arange(self.bucket + 1, bucket) % cap
+            self.values[idx] = np.nan
+        self.bucket = bucket
+        self._sum = 0.0
+        self._count = 0
+
+    def series(self, now: float, points: int) -> "np.ndarray":
+        """Last `points` buckets up to now, oldest first (current one partial)."""
+        import numpy as np
+
+        cap = len(self.values)
+        points = min(points, cap)
+        out = np.full(points, np.nan, dtype=np.float32)
+        if self.bucket is None:
+            return out
+        now_bucket = max(int(now // self.step), self.bucket)
+        # Buckets between the last sample and now have no data
+        age = now_bucket - self.bucket
+        if age >= points:
+            return out
+        if self._count:
+            out[points - 1 - age] = self._sum / self._count
+        # Closed buckets before the current one
+        n_closed = points - 1 - age
+        if n_closed > 0:
+            idx = np.arange(self.bucket - n_closed, self.bucket) % cap
+            out[:n_closed] = self.values[idx]
+        return out
+
+
+class FieldHistory:
+    """All tiers for one numeric field."""
+
+    __slots__ = ("tiers",)
+
+    def __init__(self, tiers: tuple[tuple[float, int], ...] = DEFAULT_TIERS):
+        self.tiers = [_Tier(step, capacity) for step, capacity in tiers]
+
+    def add(self, t: float, value: float) -> None:
+        for tier in self.tiers:
+            tier.add(t, value)
+
+    def series(self, step: float, now: float, points: int) -> "np.ndarray":
+        for tier in self.tiers:
+            if tier.step == step:
+                return tier.series(now, points)
+        raise ValueError(f"No history tier with a {step} s step")
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tier.values.nbytes for tier in self.tiers)
+
+
+class HistoryStore:
+    """Bounded history of numeric fields for recently seen devices."""
+
+    def __init__(
+        self,
+        tiers: tuple[tuple[float, int], ...] = DEFAULT_TIERS,
+        max_devices: int = MAX_DEVICES,
+        max_fields: int = MAX_FIELDS,
+    ):
+        self._tiers = tiers
+        self._max_devices = max_devices
+        self._max_fields = max_fields
+        self._devices: OrderedDict[str, dict[str, FieldHistory]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.evicted = 0
+
+    @property
+    def steps(self) -> tuple[float, ...]:
+        return tuple(step for step, _ in self._tiers)
+
+    def record(self, device_id: str, data: dict[str, Any], now: float | None = None) -> None:
+        """Add the numeric fields of one data message."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            fields = self._devices.get(device_id)
+            if fields is None:
+                if len(self._devices) >= self._max_devices:
+                    self._devices.popitem(last=False)
+                    self.evicted += 1
+                fields = {}
+                self._devices[device_id] = fields
+            else:
+                self._devices.move_to_end(device_id)
+
+            for key, value in data.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or key in ("ts", "timestamp"):
+                    continue
+                history = fields.get(key)
+                if history is None:
+                    if len(fields) >= self._max_fields:
+                        continue
+                    history = FieldHistory(self._tiers)
+                    fields[key] = history
+                history.add(now, float(value))
+                self.samples += 1
+
+    def series(
+        self,
+        device_id: str,
+        field: str,
+        step: float = 1.0,
+        points: int = 60,
+        now: float | None = None,
+    ) -> "np.ndarray":
+        """Last `points` bucket means at the given resolution, oldest first.
+
+        Buckets without samples (and unknown devices/fields) are NaN.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            history = self._devices.get(device_id, {}).get(field)
+            if history is None:
+                import numpy as np
+
+                return np.full(points, np.nan, dtype=np.float32)
+            return history.series(step, now, points)
+
+    def fields(self, device_id: str) -> list[str]:
+        with self._lock:
+            return list(self._devices.get(device_id, {}))
+
+    def forget(self, device_id: str) -> None:
+        with self._lock:
+            self._devices.pop(device_id, None)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return self._nbytes()
+
+    def _nbytes(self) -> int:
+        return sum(h.nbytes for fields in self._devices.values() for h in fields.values())
+
+    def stats(self) -> dict[str, int]:
+        """Devices, fields and buffer memory held."""
+        with self._lock:
+            return {
+                "devices": len(self._devices),
+                "fields": sum(len(fields) for fields in self._devices.values()),
+                "bytes": self._nbytes(),
+                "samples": self.samples,
+                "evicted": self.evicted,
+            }
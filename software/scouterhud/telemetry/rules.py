@@ -0,0 +1,365 @@
+"""HUD-side streaming alert rules.
+
+Devices report their own `alerts`, but the HUD can also evaluate rules on
+every data message it receives:
+
+  - schema rules: one per alert_above / alert_below in the device schema
+  - user rules:   loaded from a JSON/YAML file (--rules), e.g.
+
+        - id: spo2_falling
+          type: "medical.*"              # fnmatch on device type (optional)
+          when: {field: spo2, rate_below: -0.5, window_s: 120}   # per minute
+          message: SPO2_FALLING
+        - id: spo2_sustained_low
+          when: {field: spo2, below: 93}
+          for_s: 30                      # must hold continuously for 30 s
+        - id: hypoxia_compensation
+          when:                          # cross-field: all must hold
+            - {field: spo2, below: 92}
+            - {field: heart_rate, above: 110}
+          severity: critical
+
+Rules are compiled once per device (and again only when its schema object
+changes) into closures that keep their own state: the sample window for
+rate-of-change, the breach start time for sustained rules. Evaluating a
+message is then one call per rule. The per-message cost is recorded as the
+"rules.eval" histogram.
+
+Rule state is per device, so the engine can be fed messages from any
+number of devices, not only the one on screen.
+"""
+
+import fnmatch
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from scouterhud.perf.metrics import PerfStats
+
+log = logging.getLogger("scouterhud.telemetry.rules")
+
+# (data, now) → condition holds
+Check = Callable[[dict[str, Any], float], bool]
+
+SEVERITIES = ("warning", "critical")
+DEFAULT_RATE_WINDOW_S = 60.0
+
+# Shared "no schema" so schema-less devices are not recompiled every message
+_NO_SCHEMA: dict[str, Any] = {}
+
+
+@dataclass
+class Alert:
+    """An active alert raised by a HUD-side rule."""
+
+    rule_id: str
+    device_id: str
+    message: str
+    severity: str
+    since: float  # time.monotonic() when it fired
+
+
+@dataclass
+class _CompiledRule:
+    rule_id: str
+    message: str
+    severity: str
+    check: Check
+
+
+# ── Compilation ──
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _threshold(cond: dict[str, Any], key: str) -> float | None:
+    """A numeric threshold from a condition (None if absent)."""
+    value = cond.get(key)
+    if value is not None and not _is_number(value):
+        raise ValueError(f"Condition on {cond.get('field')!r}: {key} must be a number, got {value!r}")
+    return value
+
+
+def _compile_condition(cond: dict[str, Any]) -> Check:
+    """One field condition → closure."""
+    if not isinstance(cond, dict):
+        raise ValueError(f"Condition must be a mapping: {cond!r}")
+    field = cond.get("field")
+    if not field:
+        raise ValueError(f"Condition without a field: {cond}")
+
+    if "rate_above" in cond or "rate_below" in cond:
+        return _compile_rate(field, cond)
+
+    above = _threshold(cond, "above")
+    below = _threshold(cond, "below")
+    if above is None and below is None:
+        raise ValueError(f"Condition on {field!r} needs above/below/rate_above/rate_below")
+
+    if above is not None and below is not None:
+        def check(data, now, field=field, above=above, below=below):
+            v = data.get(field)
+            return _is_number(v) and (v >= above or v <= below)
+    elif above is not None:
+        def check(data, now, field=field, above=above):
+            v = data.get(field)
+            return _is_number(v) and v >= above
+    else:
+        def check(data, now, field=field, below=below):
+            v = data.get(field)
+            return _is_number(v) and v <= below
+    return check
+
+
+def _compile_rate(field: str, cond: dict[str, Any]) -> Check:
+    """Rate of change (units per minute) over a sliding window."""
+    window = cond.get("window_s", DEFAULT_RATE_WINDOW_S)
+    if not _is_number(window) or window <= 0:
+        raise ValueError(f"Condition on {field!r}: window_s must be a positive number, got {window!r}")
+    window = float(window)
+    rate_above = _threshold(cond, "rate_above")
+    rate_below = _threshold(cond, "rate_below")
+    samples: deque[tuple[float, float]] = deque()
+
+    def check(data, now):
+        v = data.get(field)
+        if not _is_number(v):
+            return False
+        samples.append((now, float(v)))
+        while samples[0][0] < now - window:
+            samples.popleft()
+        t0, v0 = samples[0]
+        # Need at least half a window of data before judging a trend
+        if now - t0 < window / 2:
+            return False
+        rate = (v - v0) / (now - t0) * 60.0
+        return ((rate_above is not None and rate >= rate_above)
+                or (rate_below is not None and rate <= rate_below))
+
+    return check
+
+
+def _all_of(checks: list[Check]) -> Check:
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(data, now):
+        # Every condition sees every message (rate windows must stay fed)
+        results = [c(data, now) for c in checks]
+        return all(results)
+
+    return check
+
+
+def _sustained(inner: Check, for_s: float) -> Check:
+    since: float | None = None
+
+    def check(data, now):
+        nonlocal since
+        if not inner(data, now):
+            since = None
+            return False
+        if since is None:
+            since = now
+        return now - since >= for_s
+
+    return check
+
+
+def compile_rule(spec: dict[str, Any]) -> _CompiledRule:
+    """Rule spec (see module docstring) → compiled rule with fresh state."""
+    when = spec.get("when")
+    if when is None:
+        when = {k: v for k, v in spec.items()
+                if k in ("field", "above", "below", "rate_above", "rate_below", "window_s")}
+    conditions = when if isinstance(when, list) else [when]
+    if not conditions:
+        raise ValueError(f"Rule without conditions: {spec}")
+
+    check = _all_of([_compile_condition(c) for c in conditions])
+    for_s = spec.get("for_s", 0)
+    if not _is_number(for_s):
+        raise ValueError(f"Rule {spec.get('id')}: for_s must be a number, got {for_s!r}")
+    if for_s > 0:
+        check = _sustained(check, for_s)
+
+    rule_id = spec.get("id") or "_".join(str(c.get("field")) for c in conditions)
+    severity = spec.get("severity", "warning")
+    if severity not in SEVERITIES:
+        raise ValueError(f"Rule {rule_id}: unknown severity {severity!r}")
+    return _CompiledRule(rule_id, spec.get("message") or rule_id.upper(), severity, check)
+
+
+def schema_rules(schema: dict[str, Any]) -> list[dict[str, Any]]:
+    """Threshold rule specs from a device schema's alert_above/alert_below."""
+    specs = []
+    for field, info in schema.items():
+        if not isinstance(info, dict):
+            continue
+        if _is_number(info.get("alert_above")):
+            specs.append({"id": f"{field}_high", "message": f"HIGH_{field.upper()}",
+                          "field": field, "above": info["alert_above"]})
+        if _is_number(info.get("alert_below")):
+            specs.append({"id": f"{field}_low", "message": f"LOW_{field.upper()}",
+                          "field": field, "below": info["alert_below"]})
+    return specs
+
+
+def load_rules(path: str | Path) -> list[dict[str, Any]]:
+    """User rule specs from a JSON or YAML file (a list, or {"rules": [...]})."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}") from None
+    else:
+        import json
+
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("rules", [])
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of rules")
+    for spec in data:
+        compile_rule(spec)  # validate early
+    return data
+
+
+# ── Engine ──
+
+class _DeviceRules:
+    """Compiled rules and active alerts for one device."""
+
+    __slots__ = ("schema", "rules", "active")
+
+    def __init__(self, schema: dict[str, Any], rules: list[_CompiledRule]):
+        self.schema = schema
+        self.rules = rules
+        self.active: dict[str, Alert] = {}
+
+
+class RuleEngine:
+    """Evaluates schema and user rules on each data message, per device."""
+
+    def __init__(
+        self,
+        user_rules: list[dict[str, Any]] | None = None,
+        perf: "PerfStats | None" = None,
+        on_change: Callable[[str, list[Alert], list[Alert]], None] | None = None,
+    ):
+        """
+        Args:
+            user_rules: rule specs (see load_rules), applied to matching devices.
+            perf: records the "rules.eval" per-message cost and fired counters.
+            on_change: called as (device_id, fired, cleared) when alerts change.
+        """
+        self._user_rules = list(user_rules or [])
+        self._perf = perf
+        self._on_change = on_change
+        self._devices: dict[str, _DeviceRules] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    def _rules_for(self, device_id: str, device_type: str, schema: dict[str, Any]) -> _DeviceRules:
+        entry = self._devices.get(device_id)
+        if entry is not None and entry.schema is schema:
+            return entry
+
+        specs = schema_rules(schema)
+        for spec in self._user_rules:
+            if fnmatch.fnmatch(device_id, spec.get("device", "*")) and \
+                    fnmatch.fnmatch(device_type or "", spec.get("type", "*")):
+                specs.append(spec)
+        rules = []
+        for spec in specs:
+            try:
+                rules.append(compile_rule(spec))
+            except ValueError as e:
+                log.warning(f"Skipping rule for {device_id}: {e}")
+
+        new_entry = _DeviceRules(schema, rules)
+        if entry is not None:
+            # Keep alerts that are still defined; they re-clear on the next message
+            ids = {r.rule_id for r in rules}
+            new_entry.active = {k: a for k, a in entry.active.items() if k in ids}
+        self._devices[device_id] = new_entry
+        self.compiles += 1
+        return new_entry
+
+    def evaluate(
+        self,
+        device_id: str,
+        data: dict[str, Any],
+        schema: dict[str, Any] | None = None,
+        device_type: str = "",
+        now: float | None = None,
+    ) -> list[Alert]:
+        """Feed one data message; returns the device's active alerts."""
+        start = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        fired: list[Alert] = []
+        cleared: list[Alert] = []
+
+        with self._lock:
+            entry = self._rules_for(device_id, device_type, schema if schema is not None else _NO_SCHEMA)
+            active = entry.active
+            for rule in entry.rules:
+                try:
+                    holds = rule.check(data, now)
+                except Exception:
+                    # Runs on the MQTT network thread: one bad rule must not stop it
+                    log.exception(f"Rule {rule.rule_id} failed on {device_id}; skipped")
+                    continue
+                if holds:
+                    if rule.rule_id not in active:
+                        alert = Alert(rule.rule_id, device_id, rule.message, rule.severity, now)
+                        active[rule.rule_id] = alert
+                        fired.append(alert)
+                elif rule.rule_id in active:
+                    cleared.append(active.pop(rule.rule_id))
+            result = list(active.values())
+
+        if self._perf is not None:
+            self._perf.record("rules.eval", time.perf_counter() - start)
+            if fired:
+                self._perf.count("rules.fired", len(fired))
+        for alert in fired:
+            log.warning(f"Alert {alert.message} on {device_id} ({alert.severity})")
+        if (fired or cleared) and self._on_change is not None:
+            self._on_change(device_id, fired, cleared)
+        return result
+
+    def active(self, device_id: str | None = None) -> list[Alert]:
+        """Active alerts for one device, or for all devices."""
+        with self._lock:
+            if device_id is not None:
+                entry = self._devices.get(device_id)
+                return list(entry.active.values()) if entry else []
+            return [a for entry in self._devices.values() for a in entry.active.values()]
+
+    def messages(self, device_id: str) -> list[str]:
+        return [a.message for a in self.active(device_id)]
+
+    def forget(self, device_id: str) -> None:
+        """Drop a device's rule state and alerts."""
+        with self._lock:
+            self._devices.pop(device_id, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "devices": len(self._devices),
+                "rules": sum(len(e.rules) for e in self._devices.values()),
+                "active": sum(len(e.active) for e in self._devices.values()),
+                "compiles": self.compiles,
+            }
@@ -0,0 +1,112 @@
+"""Schema alert thresholds compiled into per-field bands.
+
+A schema field such as {"alert_below": 90, "hysteresis": 1} becomes a
+FieldBands tuple with the alert and warning limits precomputed (warning
+zone: within 10% of the alert threshold, as value_color always did).
+Classifying a value is then a few float comparisons, with no dict lookups
+or multiplications per frame.
+
+Levels: OK (green), WARN (yellow), ALERT (red). Thresholds are inclusive
+(value >= alert_above, value <= alert_below).
+
+Hysteresis (optional, in the field's units): once a value has reached a
+level, it has to move back past that level's limit by `hysteresis` before
+a lower level is shown again. A value hovering at the limit then stops
+flickering between colors. ThresholdTable.display_level keeps the last
+shown level per field for that.
+"""
+
+import math
+from typing import Any, NamedTuple
+
+OK, WARN, ALERT = 0, 1, 2
+LEVEL_NAMES = ("ok", "warn", "alert")
+
+# Warning zone relative to the alert threshold
+WARN_MARGIN = 0.1
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+class FieldBands(NamedTuple):
+    """Precomputed limits for one field (±inf where the schema has none)."""
+
+    alert_above: float = math.inf
+    warn_above: float = math.inf
+    alert_below: float = -math.inf
+    warn_below: float = -math.inf
+    hysteresis: float = 0.0
+
+    @classmethod
+    def from_schema(cls, info: dict[str, Any] | None) -> "FieldBands":
+        if not info:
+            return cls()
+        above = _number(info.get("alert_above"))
+        below = _number(info.get("alert_below"))
+        return cls(
+            alert_above=above if above is not None else math.inf,
+            warn_above=above * (1 - WARN_MARGIN) if above is not None else math.inf,
+            alert_below=below if below is not None else -math.inf,
+            warn_below=below * (1 + WARN_MARGIN) if below is not None else -math.inf,
+            hysteresis=abs(_number(info.get("hysteresis")) or 0.0),
+        )
+
+    def level(self, value: float, previous: int = OK) -> int:
+        """OK / WARN / ALERT for value (previous: level shown before, for hysteresis)."""
+        h = self.hysteresis
+        ha = h if previous >= ALERT else 0.0
+        if value >= self.alert_above - ha or value <= self.alert_below + ha:
+            return ALERT
+        hw = h if previous >= WARN else 0.0
+        if value >= self.warn_above - hw or value <= self.warn_below + hw:
+            return WARN
+        return OK
+
+
+class ThresholdTable:
+    """FieldBands for every field of a device schema."""
+
+    __slots__ = ("schema", "bands", "_shown")
+
+    def __init__(self, schema: dict[str, Any] | None):
+        self.schema = schema if schema is not None else {}
+        self.bands: dict[str, FieldBands] = {
+            name: FieldBands.from_schema(info)
+            for name, info in self.schema.items()
+            if isinstance(info, dict)
+        }
+        # Last displayed level per field (hysteresis state)
+        self._shown: dict[str, int] = {}
+
+    def level(self, field: str, value: Any) -> int | None:
+        """Level without hysteresis. None: field not in schema or not a number."""
+        bands = self.bands.get(field)
+        v = _number(value)
+        if bands is None or v is None:
+            return None
+        return bands.level(v)
+
+    def display_level(self, field: str, value: Any) -> int | None:
+        """Level with hysteresis, remembering what was shown for field."""
+        bands = self.bands.get(field)
+        v = _number(value)
+        if bands is None or v is None:
+            return None
+        if not bands.hysteresis:
+            return bands.level(v)
+        level = bands.level(v, self._shown.get(field, OK))
+        self._shown[field] = level
+        return level
+
+    def levels(self, data: dict[str, Any]) -> dict[str, str]:
+        """Level names for the schema fields present in data (for the phones)."""
+        out = {}
+        for field, bands in self.bands.items():
+            v = _number(data.get(field))
+            if v is not None:
+                out[field] = LEVEL_NAMES[bands.level(v, self._shown.get(field, OK))]
+        return out
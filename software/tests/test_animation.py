@@ -0,0 +1,96 @@
+"""Tests for the blinking alert border (partial display updates)."""
+
+from PIL import Image
+
+from scouterhud.display.animation import BORDER_WIDTH, BorderFlash, border_strips
+from scouterhud.display.widgets import BLACK, RED
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+def _frame():
+    return Image.new("RGB", (240, 240), BLACK)
+
+
+class TestBorderStrips:
+
+    def test_strips_cover_border_once(self):
+        strips = border_strips(240, 240, 3)
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in strips)
+        assert area == 240 * 240 - 234 * 234
+
+
+class TestBorderFlash:
+
+    def test_inactive_passes_frame_through(self):
+        flash = BorderFlash(clock=FakeClock())
+        frame = _frame()
+        assert flash.apply(frame) is frame
+        assert flash.next_toggle() is None
+        assert flash.update() is None
+
+    def test_phase_follows_clock(self):
+        clock = FakeClock()
+        flash = BorderFlash(period=0.5, clock=clock)
+        flash.set_active(True)
+        assert flash.is_on()
+        clock.t += 0.3
+        assert not flash.is_on()
+        clock.t += 0.25
+        assert flash.is_on()
+
+    def test_next_toggle(self):
+        clock = FakeClock()
+        flash = BorderFlash(period=0.5, clock=clock)
+        flash.set_active(True)
+        clock.t += 0.1
+        assert flash.next_toggle() == 100.25
+
+    def test_apply_draws_border_when_on(self):
+        flash = BorderFlash(clock=FakeClock())
+        flash.set_active(True)
+        frame = _frame()
+        out = flash.apply(frame)
+        assert out is not frame
+        assert out.getpixel((0, 0)) == RED
+        assert out.getpixel((BORDER_WIDTH, BORDER_WIDTH)) == BLACK
+        assert frame.getpixel((0, 0)) == BLACK  # base untouched
+
+    def test_update_only_on_phase_change(self):
+        clock = FakeClock()
+        flash = BorderFlash(period=0.5, clock=clock)
+        flash.set_active(True)
+        flash.apply(_frame())
+        assert flash.update() is None
+        clock.t += 0.3
+        image, strips = flash.update()
+        assert image.getpixel((0, 0)) == BLACK
+        assert strips == flash.strips
+        assert flash.update() is None
+        clock.t += 0.25
+        image, _ = flash.update()
+        assert image.getpixel((0, 0)) == RED
+        assert flash.toggles == 2
+
+    def test_stop_clears_border_on_next_update(self):
+        clock = FakeClock()
+        flash = BorderFlash(clock=clock)
+        flash.set_active(True)
+        flash.apply(_frame())
+        flash.set_active(False)
+        image, _ = flash.update()
+        assert image.getpixel((0, 0)) == BLACK
+
+    def test_reset_forgets_frame(self):
+        flash = BorderFlash(clock=FakeClock())
+        flash.set_active(True)
+        flash.apply(_frame())
+        flash.reset()
+        assert not flash.active
+        assert flash.update() is None
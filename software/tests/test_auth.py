@@ -7,6 +7,7 @@ import pytest
 from scouterhud.auth.auth_manager import (
     AuthManager, AuthResult, LOCKOUT_SECONDS, MAX_PIN_ATTEMPTS,
 )
+from scouterhud.auth.credential_store import CredentialHash, CredentialStore, hash_secret
 from scouterhud.auth.pin_entry import PinEntry
 from scouterhud.input.events import EventType, InputEvent
 from scouterhud.qrlink.protocol import DeviceLink
@@ -191,6 +192,153 @@ class TestPinRateLimiting:
         assert am.get_lockout_remaining("dev-1") == 0
 
 
+class TestCredentialStore:
+    """Tests for hashed credentials and persisted lockouts."""
+
+    def test_pins_not_kept_in_plaintext(self, tmp_path):
+        path = tmp_path / "creds.json"
+        am = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        am.store_pin("dev-2", "9876")
+        assert "9876" not in path.read_text()
+        assert "1234" not in path.read_text()  # config PINs aren't written at all
+
+    def test_hash_roundtrip(self):
+        cred = hash_secret("1234", iterations=1000)
+        assert CredentialHash.decode(cred.encode()) == cred
+
+    def test_same_secret_different_salt(self):
+        assert hash_secret("1234", 1000).key != hash_secret("1234", 1000).key
+
+    def test_invalid_hash_rejected(self):
+        with pytest.raises(ValueError):
+            CredentialHash.decode("md5$abc")
+
+    def test_verify_unknown_returns_none(self):
+        store = CredentialStore(iterations=1000)
+        assert store.verify_pin("nope", "1234") is None
+
+    def test_prehashed_credential(self):
+        store = CredentialStore()
+        store.set_pin_hash("dev-1", hash_secret("4321", 1000).encode())
+        assert store.verify_pin("dev-1", "4321") is True
+        assert store.verify_pin("dev-1", "1234") is False
+
+    def test_derived_key_cached(self):
+        store = CredentialStore(iterations=1000)
+        store.set_pin("dev-1", "1234")
+        for _ in range(3):
+            assert store.verify_pin("dev-1", "1234") is True
+        assert store.derivations == 1
+        assert store.verify_pin("dev-1", "0000") is False
+        assert store.derivations == 2
+
+    def test_config_credentials_hashed_on_first_use(self):
+        am = AuthManager(pins={"dev-1": "1234", "dev-2": "5678"}, tokens={"srv-01": "tok"})
+        assert am.stats()["derivations"] == 0
+        assert am.validate_pin(_make_link(id="dev-1", auth="pin"), "1234").success is True
+        assert am.stats()["derivations"] == 1
+
+    def test_stored_pin_survives_restart(self, tmp_path):
+        path = tmp_path / "creds.json"
+        AuthManager(state_path=path).store_pin("dev-1", "2468")
+        am = AuthManager(state_path=path)
+        link = _make_link(id="dev-1", auth="pin")
+        assert am.validate_pin(link, "2468").success is True
+
+    def test_lockout_survives_restart(self, tmp_path):
+        path = tmp_path / "creds.json"
+        am = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        link = _make_link(id="dev-1", auth="pin")
+        for _ in range(MAX_PIN_ATTEMPTS):
+            am.validate_pin(link, "0000")
+
+        restarted = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        assert restarted.is_locked_out("dev-1") is True
+        assert 0 < restarted.get_lockout_remaining("dev-1") <= LOCKOUT_SECONDS
+        assert restarted.validate_pin(link, "1234").success is False
+
+    def test_failed_attempts_survive_restart(self, tmp_path):
+        path = tmp_path / "creds.json"
+        am = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        link = _make_link(id="dev-1", auth="pin")
+        am.validate_pin(link, "0000")
+        am.validate_pin(link, "0000")
+
+        restarted = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        result = restarted.validate_pin(link, "0000")
+        assert f"{MAX_PIN_ATTEMPTS - 3} attempts left" in result.error
+
+    def test_corrupt_state_file_ignored(self, tmp_path):
+        path = tmp_path / "creds.json"
+        path.write_text("{not json")
+        am = AuthManager(pins={"dev-1": "1234"}, state_path=path)
+        assert am.validate_pin(_make_link(id="dev-1", auth="pin"), "1234").success is True
+
+    def test_stored_token_survives_restart(self, tmp_path):
+        path = tmp_path / "creds.json"
+        AuthManager(state_path=path).store_token("srv-01", "abc123")
+        assert path.stat().st_mode & 0o777 == 0o600
+        am = AuthManager(state_path=path)
+        future = am.prewarm(_make_link(id="srv-01", auth="token"))
+        assert future.result(timeout=5) == ("srv-01", "abc123")
+
+    def test_legacy_token_hash_skipped(self, tmp_path):
+        path = tmp_path / "creds.json"
+        path.write_text('{"tokens": {"srv-01": "%s"}}' % hash_secret("abc", 1000).encode())
+        am = AuthManager(state_path=path)
+        assert am.validate_token(_make_link(id="srv-01", auth="token")).success is False
+
+    def test_token_checked(self):
+        am = AuthManager()
+        am.store_token("srv-01", "abc123")
+        link = _make_link(id="srv-01", auth="token")
+        assert am.validate_token(link, "abc123").success is True
+        assert am.validate_token(link, "wrong").success is False
+
+
+class TestTokenPrewarm:
+    """Tests for background token credential lookup."""
+
+    def test_prewarm_resolves_credentials(self):
+        am = AuthManager(tokens={"srv-01": "tok_abc"})
+        future = am.prewarm(_make_link(id="srv-01", auth="token"))
+        assert future.result(timeout=5) == ("srv-01", "tok_abc")
+
+    def test_prewarm_needs_no_key_derivation(self):
+        am = AuthManager(tokens={"srv-01": "tok_abc"})
+        before = am.stats()["derivations"]
+        am.prewarm(_make_link(id="srv-01", auth="token")).result(timeout=5)
+        assert am.stats()["derivations"] == before
+
+    def test_prewarm_ignores_non_token_devices(self):
+        am = AuthManager(tokens={"srv-01": "tok_abc"})
+        assert am.prewarm(_make_link(id="srv-01", auth="pin")) is None
+        assert am.prewarm(_make_link(id="srv-01", auth="open")) is None
+
+    def test_prewarm_reuses_future(self):
+        am = AuthManager(tokens={"srv-01": "tok_abc"})
+        link = _make_link(id="srv-01", auth="token")
+        assert am.prewarm(link) is am.prewarm(link)
+
+    def test_prewarm_unknown_device(self):
+        am = AuthManager()
+        future = am.prewarm(_make_link(id="srv-01", auth="token"))
+        assert future.result(timeout=5) is None
+
+    def test_store_token_invalidates_prewarm(self):
+        am = AuthManager(tokens={"srv-01": "old"})
+        link = _make_link(id="srv-01", auth="token")
+        am.prewarm(link).result(timeout=5)
+        am.store_token("srv-01", "new")
+        assert am.prewarm(link).result(timeout=5) == ("srv-01", "new")
+
+    def test_config_tokens_validate(self):
+        am = AuthManager(tokens={"srv-01": "tok_abc"})
+        link = _make_link(id="srv-01", auth="token")
+        assert am.validate_token(link).credential == "tok_abc"
+        assert am.validate_token(link, "tok_abc").success is True
+
+
 class TestPinEntry:
     """Tests for PinEntry UI logic."""
 
@@ -247,6 +395,21 @@ class TestPinEntry:
         pe.handle_event(_event(EventType.NAV_DOWN))
         assert pe.pin_value == "1900"
 
+    def test_coalesced_digit_up_applies_count(self):
+        pe = PinEntry()
+        event = _event(EventType.DIGIT_UP)
+        event.count = 13
+        pe.handle_event(event)
+        assert pe.pin_value == "3000"
+
+    def test_coalesced_cursor_move_clamps(self):
+        pe = PinEntry(pin_length=4)
+        event = _event(EventType.DIGIT_NEXT)
+        event.count = 10
+        pe.handle_event(event)
+        pe.handle_event(_event(EventType.DIGIT_UP))
+        assert pe.pin_value == "0001"
+
     def test_cursor_clamps_at_boundaries(self):
         pe = PinEntry(pin_length=4)
         # Move left past 0 — should stay at 0
@@ -306,3 +469,58 @@ class TestPinEntry:
         pe.set_error("Nope")
         pe.handle_event(_event(EventType.CONFIRM))
         assert pe._attempts == 2
+
+    def test_first_render_update_is_full_screen(self):
+        pe = PinEntry()
+        _frame, box = pe.render_update()
+        assert box == (0, 0, 240, 240)
+
+    def test_no_change_no_redraw(self):
+        pe = PinEntry()
+        pe.render_update()
+        assert pe.render_update()[1] is None
+        pe.handle_event(_event(EventType.DIGIT_PREV))  # cursor already at 0
+        assert pe.render_update()[1] is None
+
+    def test_digit_change_redraws_one_cell(self):
+        pe = PinEntry()
+        pe.render_update()
+        pe.handle_event(_event(EventType.DIGIT_UP))
+        _frame, box = pe.render_update()
+        assert box == pe._cell_box(0)
+        assert box[2] - box[0] < 50
+
+    def test_cursor_move_redraws_two_cells(self):
+        pe = PinEntry()
+        pe.render_update()
+        pe.handle_event(_event(EventType.DIGIT_NEXT))
+        _frame, box = pe.render_update()
+        assert box[0] == pe._cell_box(0)[0]
+        assert box[2] == pe._cell_box(1)[2]
+
+    def test_incremental_matches_full_render(self):
+        from PIL import ImageChops
+
+        pe = PinEntry(device_name="Bed 12")
+        pe.render_update()
+        for etype in (EventType.DIGIT_UP, EventType.DIGIT_NEXT, EventType.DIGIT_UP,
+                      EventType.DIGIT_UP, EventType.DIGIT_NEXT, EventType.DIGIT_DOWN,
+                      EventType.CONFIRM):
+            pe.handle_event(_event(etype))
+            pe.render_update()
+        pe.set_error("Invalid PIN")
+        frame, _box = pe.render_update()
+
+        fresh = PinEntry(device_name="Bed 12")
+        fresh._attempts = pe._attempts
+        fresh._error_msg = pe._error_msg
+        assert ImageChops.difference(frame, fresh.render()).getbbox() is None
+
+    def test_error_redraws_status_line(self):
+        from scouterhud.auth.pin_entry import STATUS_BOX
+
+        pe = PinEntry()
+        pe.render_update()
+        pe._error_msg = "Wrong PIN"
+        assert pe.render_update()[1] == STATUS_BOX
+
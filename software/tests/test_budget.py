@@ -0,0 +1,127 @@
+"""Tests for the render budget (frame interval per state and device)."""
+
+import pytest
+
+from scouterhud.perf.budget import (
+    IDLE_INTERVAL,
+    MAX_DEGRADE,
+    MAX_STREAM_INTERVAL,
+    RECOVER_S,
+    RenderBudget,
+    read_battery,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _budget(battery=None, clock=None):
+    return RenderBudget(base_interval=0.05, flash_period=0.5, battery=battery, clock=clock or FakeClock())
+
+
+def _late_frames(budget, clock, n, late):
+    for _ in range(n):
+        due = clock.t
+        clock.t += late
+        budget.frame_done(due, clock.t)
+
+
+class TestIntervals:
+
+    @pytest.mark.parametrize("refresh_ms,interval", [(100, 0.05), (500, 0.125), (2000, MAX_STREAM_INTERVAL)])
+    def test_streaming_follows_refresh_ms(self, refresh_ms, interval):
+        assert _budget().next_interval("STREAMING", refresh_ms) == pytest.approx(interval)
+
+    def test_streaming_without_refresh_uses_base(self):
+        assert _budget().next_interval("STREAMING", None) == 0.05
+        assert _budget().next_interval("STREAMING", "fast") == 0.05
+
+    def test_static_screens_idle(self):
+        assert _budget().next_interval("SCANNING") == IDLE_INTERVAL
+        assert _budget().next_interval("DEVICE_LIST") == 0.05
+
+    def test_slow_display_raises_floor(self):
+        budget = _budget()
+        for _ in range(50):
+            budget.display_time(0.04)
+        assert budget.next_interval("STREAMING", 100) == pytest.approx(0.08, rel=0.01)
+
+    def test_low_battery_halves_rate(self):
+        budget = _budget(battery=lambda: (15, True))
+        assert budget.next_interval("STREAMING", 100) == 0.1
+        assert budget.stats()["low_battery"] is True
+
+    def test_power_scale(self):
+        assert _budget().next_interval("STREAMING", 100, scale=3.0) == pytest.approx(0.15)
+
+    def test_charging_battery_is_not_low(self):
+        assert _budget(battery=lambda: (15, False)).next_interval("STREAMING", 100) == 0.05
+
+
+class TestDegrade:
+
+    def test_late_frames_degrade_and_skip(self):
+        clock = FakeClock()
+        budget = _budget(clock=clock)
+        budget.next_interval("STREAMING", 100)
+        _late_frames(budget, clock, 10, 0.12)
+        assert budget.level >= 1
+        assert budget.skipped > 0
+        assert budget.flash_period == 0.5 * 2 ** budget.level
+        assert budget.next_interval("STREAMING", 100) == 0.05 * 2 ** budget.level
+
+    def test_level_capped(self):
+        clock = FakeClock()
+        budget = _budget(clock=clock)
+        budget.next_interval("STREAMING", 100)
+        _late_frames(budget, clock, 200, 10.0)
+        assert budget.level == MAX_DEGRADE
+
+    def test_recovers_when_punctual(self):
+        clock = FakeClock()
+        budget = _budget(clock=clock)
+        budget.next_interval("STREAMING", 100)
+        _late_frames(budget, clock, 10, 0.12)
+        level = budget.level
+        for _ in range(int(RECOVER_S / 0.05) + 50):
+            clock.t += 0.05
+            budget.frame_done(clock.t, clock.t)
+        assert budget.level < level
+
+    def test_input_frames_not_late(self):
+        clock = FakeClock()
+        budget = _budget(clock=clock)
+        for _ in range(20):
+            clock.t += 1.0
+            budget.frame_done(None, clock.t)
+        assert budget.level == 0
+
+
+class TestReporting:
+
+    def test_target_and_achieved_fps(self):
+        clock = FakeClock()
+        budget = _budget(clock=clock)
+        budget.next_interval("STREAMING", 100)
+        for _ in range(11):
+            budget.frame_done(clock.t, clock.t)
+            clock.t += 0.1
+        stats = budget.stats()
+        assert stats["target_fps"] == 20.0
+        assert stats["achieved_fps"] == pytest.approx(10.0)
+
+    def test_read_battery(self, tmp_path):
+        (tmp_path / "AC").mkdir()
+        (tmp_path / "AC" / "type").write_text("Mains\n")
+        bat = tmp_path / "BAT0"
+        bat.mkdir()
+        (bat / "type").write_text("Battery\n")
+        (bat / "capacity").write_text("42\n")
+        (bat / "status").write_text("Discharging\n")
+        assert read_battery(str(tmp_path)) == (42, True)
+        assert read_battery(str(tmp_path / "none")) is None
@@ -151,3 +151,127 @@ class TestDeviceSwitching:
         assert cm.active_device is None
         # History is preserved
         assert cm.device_count == 1
+
+
+class TestEnroll:
+    """Batch enrollment of devices scanned from one image."""
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_enroll_adds_all_without_connecting(self, MockTransport):
+        MockTransport.return_value.fetch_metadata.return_value = True
+        cm = ConnectionManager()
+        links = [_make_link(f"bed-{i}") for i in range(6)]
+
+        new = cm.enroll(links)
+
+        assert [d.id for d in new] == [f"bed-{i}" for i in range(6)]
+        assert cm.device_count == 6
+        assert cm.active_device is None
+        MockTransport.return_value.connect.assert_not_called()
+        assert MockTransport.return_value.fetch_metadata.call_count == 6
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_enroll_skips_known_and_duplicate_ids(self, MockTransport):
+        MockTransport.return_value.fetch_metadata.return_value = True
+        cm = ConnectionManager()
+        cm._known_devices = [_make_link("bed-1")]
+
+        new = cm.enroll([_make_link("bed-1"), _make_link("bed-2"), _make_link("bed-2")])
+
+        assert [d.id for d in new] == ["bed-2"]
+        assert [d.id for d in cm.known_devices] == ["bed-1", "bed-2"]
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_enroll_keeps_active_index(self, MockTransport):
+        MockTransport.return_value.connect.return_value = True
+        MockTransport.return_value.fetch_metadata.return_value = True
+        cm = ConnectionManager()
+        cm.connect(_make_link("a"), on_data=_noop_data)
+
+        cm.enroll([_make_link("b"), _make_link("c")])
+
+        assert cm.active_device.id == "a"
+        assert cm.switch_next().id == "b"
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_metadata_fetched_concurrently(self, MockTransport):
+        import time
+
+        def slow_fetch(timeout):
+            time.sleep(0.2)
+            return True
+
+        MockTransport.return_value.fetch_metadata.side_effect = slow_fetch
+        cm = ConnectionManager()
+
+        start = time.monotonic()
+        cm.enroll([_make_link(f"bed-{i}") for i in range(6)])
+        assert time.monotonic() - start < 0.6
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_metadata_failure_still_enrolls(self, MockTransport):
+        MockTransport.return_value.fetch_metadata.side_effect = OSError("unreachable")
+        cm = ConnectionManager()
+
+        cm.enroll([_make_link("bed-1")])
+
+        assert cm.device_count == 1
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_enroll_without_metadata(self, MockTransport):
+        cm = ConnectionManager()
+        cm.enroll([_make_link("bed-1")], fetch_metadata=False)
+        MockTransport.assert_not_called()
+
+
+class TestTokenCredentials:
+    """MQTT credentials for token-auth devices."""
+
+    @patch("scouterhud.qrlink.connection.MQTTTransport")
+    def test_connect_passes_credentials_to_transport(self, MockTransport):
+        MockTransport.return_value.connect.return_value = True
+        cm = ConnectionManager()
+        link = _make_link("srv-1", auth="token")
+
+        cm.connect(link, on_data=_noop_data, credentials=("srv-1", "tok"))
+
+        MockTransport.assert_called_once_with(link, credentials=("srv-1", "tok"))
+
+    def _open_with(self, credentials, auth="token"):
+        from scouterhud.qrlink.transports.mqtt import MQTTTransport
+
+        transport = MQTTTransport(_make_link("srv-1", auth=auth), credentials=credentials)
+        transport._connected.set()
+        with patch("paho.mqtt.client.Client") as MockClient:
+            assert transport._open(timeout=1.0) is True
+        return MockClient.return_value
+
+    def test_future_credentials_set_before_connect(self):
+        from concurrent.futures import Future
+
+        future = Future()
+        future.set_result(("srv-1", "tok_abc"))
+        client = self._open_with(future)
+
+        client.username_pw_set.assert_called_once_with("srv-1", "tok_abc")
+        names = [c[0] for c in client.method_calls]
+        assert names.index("username_pw_set") < names.index("connect")
+
+    def test_missing_token_connects_without_credentials(self):
+        from concurrent.futures import Future
+
+        future = Future()
+        future.set_result(None)
+        client = self._open_with(future)
+
+        client.username_pw_set.assert_not_called()
+        client.connect.assert_called_once()
+
+    def test_failed_lookup_connects_without_credentials(self):
+        from concurrent.futures import Future
+
+        future = Future()
+        future.set_exception(RuntimeError("store unavailable"))
+        client = self._open_with(future)
+
+        client.username_pw_set.assert_not_called()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from scouterhud.input.gauntlet_input import GauntletInput, PadEvent
+from scouterhud.input.gauntlet_input import GauntletInput, PadEvent, WireClock
 from scouterhud.input.events import EventType
 
 
@@ -155,3 +155,36 @@ class TestGauntletProperties:
     def test_poll_empty(self):
         gi = GauntletInput()
         assert gi.poll() is None
+
+
+class TestWireClock:
+    """Test BLE transport latency estimation from the wire timestamp."""
+
+    def test_first_sample_is_baseline(self):
+        clock = WireClock()
+        assert clock.estimate(1000, 50.0) == 0.0
+
+    def test_late_delivery_measured_against_fastest(self):
+        clock = WireClock()
+        clock.estimate(1000, 50.000)            # baseline
+        est = clock.estimate(1100, 50.130)      # 30 ms later than baseline
+        assert est == pytest.approx(0.030)
+
+    def test_faster_delivery_resets_baseline(self):
+        clock = WireClock()
+        clock.estimate(1000, 50.020)
+        assert clock.estimate(2000, 51.010) == 0.0
+        assert clock.estimate(3000, 52.015) == pytest.approx(0.005)
+
+    def test_handles_uint16_wraparound(self):
+        clock = WireClock()
+        clock.estimate(65530, 100.000)
+        est = clock.estimate(10, 100.016 + 0.010)  # 16 ms device time across wrap
+        assert est == pytest.approx(0.010, abs=0.002)
+
+    def test_notification_sets_transport_latency(self):
+        gi = GauntletInput()
+        gi._on_input_notification(None, bytearray([PadEvent.TAP, 0b00010, 0x10, 0x00]))
+        event = gi.poll()
+        assert event is not None
+        assert event.transport_latency == 0.0
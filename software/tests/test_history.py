@@ -0,0 +1,94 @@
+"""Tests for the per-device time-series history store."""
+
+import numpy as np
+import pytest
+
+from scouterhud.telemetry.history import FieldHistory, HistoryStore
+
+
+class TestTiers:
+    """Bucketing and downsampling."""
+
+    def test_one_second_tier_keeps_samples(self):
+        store = HistoryStore()
+        for t in range(10):
+            store.record("dev", {"v": float(t)}, now=float(t))
+        series = store.series("dev", "v", step=1.0, points=5, now=9.5)
+        assert series.tolist() == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_coarser_tier_averages(self):
+        store = HistoryStore()
+        for t in range(30):
+            store.record("dev", {"v": float(t)}, now=float(t))
+        series = store.series("dev", "v", step=10.0, points=3, now=29.0)
+        assert series.tolist() == [4.5, 14.5, 24.5]
+
+    def test_missing_buckets_are_nan(self):
+        store = HistoryStore()
+        store.record("dev", {"v": 1.0}, now=0.0)
+        store.record("dev", {"v": 2.0}, now=3.0)
+        series = store.series("dev", "v", step=1.0, points=4, now=3.0)
+        assert series[0] == 1.0 and series[3] == 2.0
+        assert np.isnan(series[1:3]).all()
+
+    def test_stale_series_trails_with_nan(self):
+        store = HistoryStore()
+        store.record("dev", {"v": 1.0}, now=0.0)
+        series = store.series("dev", "v", step=1.0, points=3, now=2.0)
+        assert series[0] == 1.0
+        assert np.isnan(series[1:]).all()
+
+    def test_gap_longer_than_buffer_clears(self):
+        store = HistoryStore(tiers=((1.0, 5),))
+        for t in range(5):
+            store.record("dev", {"v": 1.0}, now=float(t))
+        store.record("dev", {"v": 2.0}, now=100.0)
+        series = store.series("dev", "v", step=1.0, points=5, now=100.0)
+        assert series[-1] == 2.0
+        assert np.isnan(series[:-1]).all()
+
+    def test_ring_wraps(self):
+        store = HistoryStore(tiers=((1.0, 4),))
+        for t in range(10):
+            store.record("dev", {"v": float(t)}, now=float(t))
+        assert store.series("dev", "v", step=1.0, points=4, now=9.0).tolist() == [6.0, 7.0, 8.0, 9.0]
+
+    def test_unknown_step_rejected(self):
+        with pytest.raises(ValueError):
+            FieldHistory().series(5.0, now=0.0, points=3)
+
+
+class TestHistoryStore:
+    """Field selection and memory bounds."""
+
+    def test_only_numeric_fields_recorded(self):
+        store = HistoryStore()
+        store.record("dev", {"spo2": 97, "ok": True, "status": "stable", "ts": 1, "t": 36.5})
+        assert sorted(store.fields("dev")) == ["spo2", "t"]
+
+    def test_unknown_series_is_nan(self):
+        series = HistoryStore().series("nope", "spo2", points=8)
+        assert len(series) == 8 and np.isnan(series).all()
+
+    def test_fixed_memory_per_field(self):
+        store = HistoryStore()
+        store.record("dev", {"v": 1.0}, now=0.0)
+        before = store.nbytes
+        for t in range(1, 5000):
+            store.record("dev", {"v": 1.0}, now=float(t))
+        assert store.nbytes == before == (300 + 360 + 1440) * 4
+
+    def test_device_limit_evicts_oldest(self):
+        store = HistoryStore(max_devices=2)
+        store.record("a", {"v": 1})
+        store.record("b", {"v": 1})
+        store.record("a", {"v": 2})  # a is now most recent
+        store.record("c", {"v": 1})
+        assert store.fields("b") == []
+        assert store.fields("a") == ["v"]
+        assert store.stats()["evicted"] == 1
+
+    def test_field_limit(self):
+        store = HistoryStore(max_fields=3)
+        store.record("dev", {f"f{i}": i for i in range(10)})
+        assert len(store.fields("dev")) == 3
@@ -1,8 +1,13 @@
 """Tests for input system (events, backend, manager)."""
 
+import threading
+import time
+
 import pytest
 
 from scouterhud.input.backend import InputBackend
+from scouterhud.input.coalesce import coalesce
+from scouterhud.input.event_bus import EventBus
 from scouterhud.input.events import EventType, InputEvent
 from scouterhud.input.input_manager import InputManager
 
@@ -147,3 +152,189 @@ class TestInputManager:
         assert backend.numeric_mode is True
         mgr.set_numeric_mode(False)
         assert backend.numeric_mode is False
+
+    def test_poll_round_robin_across_backends(self):
+        b1 = MockBackend(name="first", events=[
+            InputEvent(type=EventType.NAV_UP, source="first") for _ in range(3)
+        ])
+        b2 = MockBackend(name="second", events=[
+            InputEvent(type=EventType.CANCEL, source="second")
+        ])
+        mgr = InputManager(backends=[b1, b2])
+        mgr.start()
+
+        sources = [mgr.poll().source for _ in range(4)]
+        # The second backend is served before the first one is exhausted
+        assert sources.index("second") < 3
+
+    def test_wait_drains_all_pending_events(self):
+        events = [InputEvent(type=EventType.NAV_DOWN, source="mock") for _ in range(5)]
+        backend = MockBackend(events=events)
+        mgr = InputManager(backends=[backend])
+        mgr.start()
+
+        drained = mgr.wait(timeout=0)
+        assert len(drained) == 5
+        assert mgr.wait(timeout=0) == []
+
+    def test_wait_returns_pushed_event_from_thread(self):
+        backend = MockBackend(name="threaded")
+        mgr = InputManager(backends=[backend])
+        mgr.start()
+
+        def push_later():
+            time.sleep(0.02)
+            backend._emit(InputEvent(type=EventType.CONFIRM, source="threaded"))
+
+        threading.Thread(target=push_later).start()
+        start = time.monotonic()
+        drained = mgr.wait(timeout=2.0)
+        assert [e.type for e in drained] == [EventType.CONFIRM]
+        assert time.monotonic() - start < 1.0  # woke early, not at timeout
+
+    def test_wait_times_out_when_idle(self):
+        mgr = InputManager(backends=[MockBackend()])
+        start = time.monotonic()
+        assert mgr.wait(timeout=0.05) == []
+        assert time.monotonic() - start >= 0.04
+
+    def test_stats_reports_sources(self):
+        backend = MockBackend(name="kbd", events=[
+            InputEvent(type=EventType.CONFIRM, source="kbd"),
+        ])
+        mgr = InputManager(backends=[backend])
+        mgr.wait(timeout=0)
+        stats = mgr.stats()
+        assert stats["kbd"]["pushed"] == 1
+        assert stats["kbd"]["drained"] == 1
+
+
+class TestEventBus:
+    """Tests for the thread-safe EventBus."""
+
+    def test_push_and_pop(self):
+        bus = EventBus()
+        bus.push(InputEvent(type=EventType.CONFIRM, source="phone"))
+        assert len(bus) == 1
+        assert bus.pop().type == EventType.CONFIRM
+        assert bus.pop() is None
+
+    def test_source_defaults_to_event_source(self):
+        bus = EventBus()
+        bus.push(InputEvent(type=EventType.CONFIRM, source="gauntlet"))
+        assert "gauntlet" in bus.stats()
+
+    def test_fifo_within_source(self):
+        bus = EventBus()
+        for i in range(3):
+            bus.push(InputEvent(type=EventType.NAV_UP, value=i), source="phone")
+        assert [e.value for e in bus.drain()] == [0, 1, 2]
+
+    def test_drain_interleaves_sources(self):
+        bus = EventBus()
+        for i in range(4):
+            bus.push(InputEvent(type=EventType.NAV_UP, value=f"p{i}"), source="phone")
+        bus.push(InputEvent(type=EventType.CONFIRM, value="g0"), source="gauntlet")
+        values = [e.value for e in bus.drain()]
+        assert values[:2] == ["p0", "g0"]
+        assert len(values) == 5
+
+    def test_drain_respects_max_events(self):
+        bus = EventBus()
+        for _ in range(10):
+            bus.push(InputEvent(type=EventType.NAV_UP), source="phone")
+        assert len(bus.drain(max_events=4)) == 4
+        assert len(bus) == 6
+
+    def test_per_source_limit_drops_oldest(self):
+        bus = EventBus(max_per_source=4)
+        for i in range(6):
+            bus.push(InputEvent(type=EventType.NAV_UP, value=i), source="phone")
+        bus.push(InputEvent(type=EventType.CONFIRM, value="k"), source="keyboard")
+        stats = bus.stats()
+        assert stats["phone"]["dropped"] == 2
+        assert stats["phone"]["max_depth"] == 4
+        values = [e.value for e in bus.drain()]
+        assert 0 not in values and 1 not in values
+        assert "k" in values  # other sources unaffected
+
+    def test_wait_returns_false_on_timeout(self):
+        bus = EventBus()
+        assert bus.wait(timeout=0.01) is False
+
+    def test_wait_returns_immediately_when_pending(self):
+        bus = EventBus()
+        bus.push(InputEvent(type=EventType.CONFIRM), source="x")
+        assert bus.wait(timeout=5.0) is True
+
+    def test_concurrent_producers(self):
+        bus = EventBus(max_per_source=1000)
+
+        def produce(name):
+            for _ in range(200):
+                bus.push(InputEvent(type=EventType.NAV_UP), source=name)
+
+        threads = [threading.Thread(target=produce, args=(f"s{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        total = 0
+        while len(bus):
+            total += len(bus.drain())
+        assert total == 800
+
+    def test_backend_emit_without_bus_uses_local_queue(self):
+        backend = MockBackend()
+        backend._queue = []
+        backend._emit(InputEvent(type=EventType.CONFIRM))
+        assert len(backend._queue) == 1
+
+
+class TestCoalesce:
+
+    def _ev(self, t, source="phone"):
+        return InputEvent(type=t, source=source)
+
+    def test_run_of_same_nav_merged(self):
+        events = [self._ev(EventType.NAV_DOWN) for _ in range(5)]
+        out = coalesce(events)
+        assert len(out) == 1
+        assert out[0].type == EventType.NAV_DOWN
+        assert out[0].count == 5
+
+    def test_merged_event_keeps_first_timestamp(self):
+        events = [self._ev(EventType.NAV_UP) for _ in range(3)]
+        first_ts = events[0].timestamp
+        assert coalesce(events)[0].timestamp == first_ts
+
+    def test_opposite_directions_not_cancelled(self):
+        events = [self._ev(EventType.NAV_UP), self._ev(EventType.NAV_UP),
+                  self._ev(EventType.NAV_DOWN)]
+        out = coalesce(events)
+        assert [(e.type, e.count) for e in out] == [
+            (EventType.NAV_UP, 2), (EventType.NAV_DOWN, 1),
+        ]
+
+    def test_confirm_never_merged(self):
+        events = [self._ev(EventType.CONFIRM), self._ev(EventType.CONFIRM)]
+        assert len(coalesce(events)) == 2
+
+    def test_direct_digits_never_merged(self):
+        events = [self._ev(EventType.DIGIT_1), self._ev(EventType.DIGIT_1)]
+        assert len(coalesce(events)) == 2
+
+    def test_different_sources_not_merged(self):
+        events = [self._ev(EventType.NAV_DOWN, "phone"),
+                  self._ev(EventType.NAV_DOWN, "gauntlet")]
+        assert len(coalesce(events)) == 2
+
+    def test_order_preserved_around_barrier(self):
+        events = [self._ev(EventType.NAV_DOWN), self._ev(EventType.NAV_DOWN),
+                  self._ev(EventType.CONFIRM), self._ev(EventType.NAV_DOWN)]
+        out = coalesce(events)
+        assert [e.type for e in out] == [
+            EventType.NAV_DOWN, EventType.CONFIRM, EventType.NAV_DOWN,
+        ]
+        assert out[0].count == 2
@@ -0,0 +1,153 @@
+"""Tests for declarative device layouts and render plans."""
+
+import json
+
+import pytest
+
+from scouterhud.display import layout
+from scouterhud.display.layout import (
+    GENERIC_LAYOUT,
+    auto_layout,
+    compile_layout,
+    load_layout_dir,
+    plan_for,
+    register_layouts,
+    validate_layout,
+)
+from scouterhud.display.renderer import render_frame
+from scouterhud.display.widgets import CYAN, RED
+from scouterhud.qrlink.protocol import DeviceLink
+
+GAUGE_LAYOUT = {
+    "name": "gauge",
+    "match": "bridge.gauge*",
+    "widgets": [
+        {"kind": "big", "field": "level", "label": "Level", "unit": "m", "x": 4, "y": 34, "color": "cyan"},
+        {"kind": "status"},
+    ],
+}
+
+
+def _make_link(**kwargs):
+    defaults = dict(version=1, id="dev-1", proto="mqtt", host="localhost", port=1883, name="Dev")
+    defaults.update(kwargs)
+    return DeviceLink(**defaults)
+
+
+def _colors(img, box):
+    return {c for _, c in img.crop(box).getcolors(maxcolors=10_000)}
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    layout._registered.clear()
+    layout._plans.clear()
+    layout._stats.update(compiles=0, errors=0)
+    yield
+    layout._registered.clear()
+    layout._plans.clear()
+
+
+class TestLayoutSelection:
+    """Which layout a device gets."""
+
+    def test_builtin_by_type(self):
+        assert plan_for(_make_link(type="medical.patient_monitor")).name == "medical"
+        assert plan_for(_make_link(type="vehicle.obd2")).name == "vehicle"
+
+    def test_generic_without_schema(self):
+        assert plan_for(_make_link(type="bridge.new")).name == "generic"
+
+    def test_auto_from_schema(self):
+        link = _make_link(type="bridge.new", schema={"flow": {"unit": "l/s", "alert_above": 10}})
+        assert plan_for(link).name == "auto"
+
+    def test_inline_meta_layout(self):
+        link = _make_link(type="medical.patient_monitor")
+        link.update_from_metadata({"layout": GAUGE_LAYOUT})
+        assert plan_for(link).name == "gauge"
+
+    def test_named_layout(self):
+        register_layouts([GAUGE_LAYOUT])
+        assert plan_for(_make_link(type="x", layout="gauge")).name == "gauge"
+
+    def test_registered_match_before_builtin(self):
+        register_layouts([{**GAUGE_LAYOUT, "name": "my-medical", "match": "medical.*"}])
+        assert plan_for(_make_link(type="medical.patient_monitor")).name == "my-medical"
+
+    def test_unknown_name_falls_back_to_auto(self):
+        assert plan_for(_make_link(type="home.thermostat", layout="nope")).name == "home"
+
+    def test_invalid_inline_layout_falls_back(self):
+        link = _make_link(layout={"widgets": [{"kind": "hologram"}]})
+        assert plan_for(link).name == "generic"
+        assert layout.stats()["errors"] == 1
+
+
+class TestRenderPlan:
+    """Compilation and rendering."""
+
+    def test_plan_compiled_once(self):
+        link = _make_link(type="medical.patient_monitor")
+        plan = plan_for(link)
+        render_frame(link, {"spo2": 97})
+        render_frame(link, {"spo2": 96})
+        assert plan_for(link) is plan
+        assert layout.stats()["compiles"] == 1
+
+    def test_new_plan_when_name_changes(self):
+        link = _make_link(type="medical.patient_monitor")
+        plan = plan_for(link)
+        link.name = "Bed 14"
+        assert plan_for(link) is not plan
+
+    def test_static_layer_not_modified(self):
+        link = _make_link(type="vehicle.obd2")
+        plan = plan_for(link)
+        before = plan.static.tobytes()
+        render_frame(link, {"rpm": 3000, "dtc_codes": ["P0300"]})
+        assert plan.static.tobytes() == before
+
+    def test_custom_layout_renders_value(self):
+        link = _make_link(type="x", layout=GAUGE_LAYOUT)
+        img = render_frame(link, {"level": 3.2})
+        assert CYAN in _colors(img, (4, 46, 120, 80))
+
+    def test_threshold_color(self):
+        link = _make_link(type="bridge.new", schema={"flow": {"alert_above": 10}})
+        img = render_frame(link, {"flow": 12})
+        assert RED in _colors(img, (4, 46, 120, 80))
+
+    def test_auto_layout_places_fields(self):
+        spec = auto_layout({
+            "a": {"unit": "x"}, "b": {}, "mode": {"values": ["on", "off"]}, "c": {}, "status": {},
+        })
+        kinds = [(w["kind"], w.get("field")) for w in spec["widgets"]]
+        assert kinds == [("big", "a"), ("big", "b"), ("small", "mode"), ("small", "c"), ("status", None)]
+
+    def test_generic_lists_fields(self):
+        plan = compile_layout(GENERIC_LAYOUT, "Dev", "")
+        img = plan.render(_make_link(), {"k": 1, "ts": 0})
+        assert img.crop((4, 34, 120, 64)).getbbox() is not None
+
+
+class TestLayoutFiles:
+    """Validation and loading of local layout files."""
+
+    def test_validate_rejects_bad_specs(self):
+        with pytest.raises(ValueError):
+            validate_layout({"widgets": [{"kind": "big"}]})  # no field
+        with pytest.raises(ValueError):
+            validate_layout({"widgets": [{"kind": "small", "field": "a", "x": 0, "y": 0, "color": "mauve"}]})
+        with pytest.raises(ValueError):
+            validate_layout({"name": "x"})
+
+    def test_load_dir(self, tmp_path):
+        (tmp_path / "gauge.json").write_text(json.dumps({k: v for k, v in GAUGE_LAYOUT.items() if k != "name"}))
+        (tmp_path / "tank.yaml").write_text(
+            "match: bridge.tank*\nwidgets:\n  - {kind: small, field: vol, x: 4, y: 34}\n"
+        )
+        (tmp_path / "broken.json").write_text("{")
+        assert load_layout_dir(tmp_path) == 2
+        assert plan_for(_make_link(type="bridge.gauge-2")).name == "gauge"
+        assert plan_for(_make_link(type="bridge.tank")).name == "tank"
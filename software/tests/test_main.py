@@ -0,0 +1,51 @@
+"""Tests for the main loop's frame scheduling."""
+
+import time
+
+from scouterhud.display.animation import BorderFlash
+from scouterhud.display.backend_preview import PreviewBackend
+from scouterhud.main import AppState, ScouterHUD
+from scouterhud.qrlink.protocol import DeviceLink
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+def _streaming_hud(tmp_path, clock):
+    hud = ScouterHUD(use_preview=True)
+    hud.display = PreviewBackend(output_path=str(tmp_path / "live.png"), fps_limit=1000.0)
+    hud._flash = BorderFlash(clock=clock)
+    hud.connection._active_link = DeviceLink(version=1, id="bed-1", proto="mqtt", host="localhost", port=1883)
+    hud._state = AppState.STREAMING
+    hud._latest_data = {"spo2": 85, "alerts": ["LOW_SPO2"]}
+    return hud
+
+
+class TestFrameStep:
+
+    def test_flash_toggle_not_lost_on_unchanged_render(self, tmp_path):
+        clock = FakeClock()
+        hud = _streaming_hud(tmp_path, clock)
+        hud._frame_step(False, time.monotonic())
+        assert hud._flash.active and hud._flash.toggles == 0
+
+        # Input at a phase boundary: the full render takes the unchanged path
+        clock.t += 0.3
+        hud._frame_step(True, float("inf"))
+        assert hud._flash.toggles == 1
+        assert not hud._flash.is_on()
+
+    def test_no_extra_toggle_after_full_frame(self, tmp_path):
+        clock = FakeClock()
+        hud = _streaming_hud(tmp_path, clock)
+        hud._frame_step(False, time.monotonic())
+        clock.t += 0.3
+        hud._latest_data = {"spo2": 84, "alerts": ["LOW_SPO2"]}
+        hud._frame_step(True, float("inf"))
+        # apply() drew the new phase; the animation step has nothing to push
+        assert hud._flash.toggles == 0
@@ -0,0 +1,123 @@
+"""Tests for performance stats and input-to-display latency tracing."""
+
+import pytest
+
+from scouterhud.input.event_bus import EventBus
+from scouterhud.input.events import EventType, InputEvent
+from scouterhud.perf.latency import MAX_PENDING, LatencyTracer
+from scouterhud.perf.metrics import LatencyHistogram, PerfStats
+
+
+class TestLatencyHistogram:
+
+    def test_empty(self):
+        h = LatencyHistogram()
+        assert h.count == 0
+        assert h.percentile(50) == 0.0
+        assert h.snapshot()["mean_ms"] == 0.0
+
+    def test_record_updates_stats(self):
+        h = LatencyHistogram()
+        for ms in (1, 3, 8):
+            h.record(ms / 1000)
+        snap = h.snapshot()
+        assert snap["count"] == 3
+        assert snap["min_ms"] == 1.0
+        assert snap["max_ms"] == 8.0
+        assert snap["mean_ms"] == 4.0
+
+    def test_percentile_uses_bucket_bounds(self):
+        h = LatencyHistogram(buckets_ms=(10, 100))
+        for _ in range(90):
+            h.record(0.005)
+        for _ in range(10):
+            h.record(0.050)
+        assert h.percentile(50) == 10.0
+        assert h.percentile(95) == 100.0
+
+    def test_overflow_bucket(self):
+        h = LatencyHistogram(buckets_ms=(10,))
+        h.record(2.0)
+        assert h.snapshot()["buckets"]["inf"] == 1
+        assert h.percentile(99) == 2000.0
+
+
+class TestPerfStats:
+
+    def test_histogram_is_reused(self):
+        stats = PerfStats()
+        assert stats.histogram("a") is stats.histogram("a")
+
+    def test_snapshot_contains_everything(self):
+        stats = PerfStats()
+        stats.record("latency.phone.total", 0.02)
+        stats.count("frames")
+        stats.set_gauge("fps", 19.5)
+        stats.add_provider("input", lambda: {"phone": {"depth": 0}})
+        snap = stats.snapshot()
+        assert snap["latency"]["latency.phone.total"]["count"] == 1
+        assert snap["counters"]["frames"] == 1
+        assert snap["gauges"]["fps"] == 19.5
+        assert snap["input"] == {"phone": {"depth": 0}}
+
+    def test_failing_provider_does_not_break_snapshot(self):
+        stats = PerfStats()
+        stats.add_provider("broken", lambda: 1 / 0)
+        assert "error" in stats.snapshot()["broken"]
+
+    def test_summary_lines(self):
+        stats = PerfStats()
+        stats.record("latency.keyboard.total", 0.01)
+        lines = stats.summary_lines()
+        assert any(line.startswith("latency.keyboard.total") for line in lines)
+
+
+class TestLatencyTracer:
+
+    def _traced_event(self, source="phone", created=10.0):
+        event = InputEvent(type=EventType.NAV_UP, source=source, timestamp=created)
+        event.trace["dequeued"] = created + 0.004
+        return event
+
+    def test_records_all_stages_per_source(self):
+        stats = PerfStats()
+        tracer = LatencyTracer(stats)
+        event = self._traced_event()
+        tracer.handled(event)
+        event.trace["handled"] = 10.006  # deterministic
+
+        tracer.shown(rendered_at=10.016, shown_at=10.036)
+
+        lat = stats.snapshot()["latency"]
+        assert lat["latency.phone.queue"]["mean_ms"] == pytest.approx(4.0)
+        assert lat["latency.phone.dispatch"]["mean_ms"] == pytest.approx(2.0)
+        assert lat["latency.phone.render"]["mean_ms"] == pytest.approx(10.0)
+        assert lat["latency.phone.show"]["mean_ms"] == pytest.approx(20.0)
+        assert lat["latency.phone.total"]["mean_ms"] == pytest.approx(36.0)
+        assert tracer.pending == 0
+
+    def test_transport_latency_recorded(self):
+        stats = PerfStats()
+        tracer = LatencyTracer(stats)
+        event = self._traced_event(source="gauntlet")
+        event.transport_latency = 0.015
+        tracer.handled(event)
+        tracer.shown(rendered_at=event.timestamp + 0.1, shown_at=event.timestamp + 0.11)
+        assert stats.snapshot()["latency"]["latency.gauntlet.transport"]["count"] == 1
+
+    def test_shown_without_pending_is_noop(self):
+        stats = PerfStats()
+        LatencyTracer(stats).shown(1.0, 2.0)
+        assert stats.snapshot()["latency"] == {}
+
+    def test_pending_is_bounded(self):
+        tracer = LatencyTracer(PerfStats())
+        for _ in range(MAX_PENDING + 10):
+            tracer.handled(self._traced_event())
+        assert tracer.pending == MAX_PENDING
+
+    def test_bus_stamps_dequeue_time(self):
+        bus = EventBus()
+        bus.push(InputEvent(type=EventType.CONFIRM, source="keyboard"))
+        event = bus.drain()[0]
+        assert event.trace["dequeued"] >= event.timestamp
@@ -1,11 +1,15 @@
 """Tests for PhoneInput WebSocket backend."""
 
+import asyncio
+import gzip
 import json
 
 import pytest
 
 from scouterhud.input.events import EventType, InputEvent
-from scouterhud.input.phone_input import PhoneInput, _EVENT_MAP
+from scouterhud.input.phone_channel import ClientChannel
+from scouterhud.input.phone_input import PhoneInput, _EVENT_MAP, _requested_role
+from scouterhud.input.web_assets import AssetStore, StaticAsset
 
 
 class TestPhoneInputProperties:
@@ -360,7 +364,7 @@ class TestStateSerialization:
     def test_send_sensor_data(self):
         pi = PhoneInput()
         captured = []
-        pi._broadcast = lambda msg: captured.append(msg)
+        pi._broadcast_sensor = lambda msg, schema_msg, interval: captured.append(msg)
 
         pi.send_sensor_data(
             device_id="monitor-bed-12",
@@ -376,12 +380,13 @@ class TestStateSerialization:
         assert msg["device_name"] == "Monitor Cama 12"
         assert msg["device_type"] == "medical.respiratory_monitor"
         assert msg["data"]["spo2"] == 97
-        assert msg["schema"]["spo2"]["unit"] == "%"
+        assert "schema" not in msg
+        assert len(msg["schema_hash"]) == 12
 
     def test_send_sensor_data_minimal(self):
         pi = PhoneInput()
         captured = []
-        pi._broadcast = lambda msg: captured.append(msg)
+        pi._broadcast_sensor = lambda msg, schema_msg, interval: captured.append(msg)
 
         pi.send_sensor_data(
             device_id="test",
@@ -393,3 +398,465 @@ class TestStateSerialization:
         msg = captured[0]
         assert msg["device_name"] == "test"  # falls back to device_id
         assert msg["device_type"] == "unknown"
+        assert "levels" not in msg
+
+    def test_send_sensor_data_levels(self):
+        pi = PhoneInput()
+        captured = []
+        pi._broadcast_sensor = lambda msg, schema_msg, interval: captured.append(msg)
+
+        pi.send_sensor_data("bed", None, None, {"spo2": 88}, {}, levels={"spo2": "alert"})
+        assert captured[0]["levels"] == {"spo2": "alert"}
+
+
+class FakeWebSocket:
+    """Records sent text; send() blocks while `gate` is cleared."""
+
+    remote_address = ("10.0.0.2", 5555)
+
+    def __init__(self):
+        self.sent: list[str] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def send(self, text):
+        await self.gate.wait()
+        self.sent.append(text)
+
+
+class TestClientChannel:
+    """Per-client outbound queue: conflation, bounds, stats."""
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_sends_in_order(self):
+        async def scenario():
+            ws = FakeWebSocket()
+            ch = ClientChannel(ws)
+            task = asyncio.ensure_future(ch.run())
+            ch.put("state", "s1")
+            ch.put("ai_response", "a1")
+            await asyncio.sleep(0.01)
+            ch.close()
+            await task
+            return ws.sent
+
+        assert self._run(scenario()) == ["s1", "a1"]
+
+    def test_conflates_latest_per_type_for_slow_client(self):
+        async def scenario():
+            ws = FakeWebSocket()
+            ws.gate.clear()
+            ch = ClientChannel(ws)
+            task = asyncio.ensure_future(ch.run())
+            ch.put("sensor_data", "d0")
+            await asyncio.sleep(0)  # sender takes d0 and blocks on send
+            for i in range(1, 50):
+                ch.put("sensor_data", f"d{i}")
+            assert ch.pending == 1
+            ws.gate.set()
+            await asyncio.sleep(0.01)
+            ch.close()
+            await task
+            return ws.sent, ch
+
+        sent, ch = self._run(scenario())
+        assert sent == ["d0", "d49"]
+        assert ch.conflated == 48
+
+    def test_newest_conflated_value_sent_last(self):
+        async def scenario():
+            ws = FakeWebSocket()
+            ws.gate.clear()
+            ch = ClientChannel(ws)
+            ch.put("state", "streaming")
+            ch.put("device_list", "list")
+            ch.put("state", "device_list")
+            ws.gate.set()
+            task = asyncio.ensure_future(ch.run())
+            await asyncio.sleep(0.01)
+            ch.close()
+            await task
+            return ws.sent
+
+        assert self._run(scenario()) == ["list", "device_list"]
+
+    def test_fifo_bounded_drops_oldest(self):
+        async def scenario():
+            ch = ClientChannel(FakeWebSocket(), max_fifo=3)
+            for i in range(5):
+                ch.put("ai_response", f"m{i}")
+            return ch
+
+        ch = self._run(scenario())
+        assert ch.pending == 3
+        assert ch.dropped == 2
+
+    def test_stats_count_bytes_and_messages(self):
+        async def scenario():
+            ch = ClientChannel(FakeWebSocket())
+            task = asyncio.ensure_future(ch.run())
+            ch.put("state", "12345")
+            ch.put("ai_response", "123")
+            await asyncio.sleep(0.01)
+            ch.close()
+            await task
+            return ch.stats()
+
+        stats = self._run(scenario())
+        assert stats["sent_msgs"] == 2
+        assert stats["sent_bytes"] == 8
+        assert stats["msgs_per_s"] > 0
+        assert stats["bytes_per_s"] > 0
+
+    def test_closed_channel_ignores_put(self):
+        async def scenario():
+            ch = ClientChannel(FakeWebSocket())
+            ch.close()
+            ch.put("state", "x")
+            return ch.pending
+
+        assert self._run(scenario()) == 0
+
+
+class TestBroadcastFanOut:
+
+    def test_fan_out_queues_same_text_on_every_client(self):
+        async def scenario():
+            pi = PhoneInput()
+            channels = [ClientChannel(FakeWebSocket()) for _ in range(3)]
+            pi._clients = {i: ch for i, ch in enumerate(channels)}
+            pi._fan_out("state", '{"type": "state"}')
+            return channels
+
+        channels = asyncio.run(scenario())
+        assert all(ch.pending == 1 for ch in channels)
+
+    def test_broadcast_without_clients_is_noop(self):
+        pi = PhoneInput()
+        pi._broadcast({"type": "state", "state": "scanning"})  # no loop, no error
+
+    def test_stats_without_clients(self):
+        stats = PhoneInput().stats()
+        assert stats["clients"] == 0
+        assert stats["observers"] == 0
+
+
+class TestSensorStreaming:
+    """Push-on-change, schema-once and per-phone rate limiting."""
+
+    SCHEMA = {"spo2": {"unit": "%"}}
+
+    def _pi(self):
+        pi = PhoneInput()
+        captured = []
+        pi._broadcast_sensor = lambda msg, schema_msg, interval: captured.append(
+            (msg, schema_msg, interval)
+        )
+        return pi, captured
+
+    def _send(self, pi, data, device_id="dev-1", refresh_ms=500):
+        return pi.send_sensor_data(device_id, None, None, data, self.SCHEMA, refresh_ms)
+
+    def test_unchanged_data_not_pushed(self):
+        pi, captured = self._pi()
+        assert self._send(pi, {"spo2": 97, "ts": 1}) is True
+        assert self._send(pi, {"spo2": 97, "ts": 2}) is False
+        assert self._send(pi, {"spo2": 96, "ts": 3}) is True
+        assert len(captured) == 2
+
+    def test_same_data_other_device_pushed(self):
+        pi, captured = self._pi()
+        self._send(pi, {"spo2": 97})
+        self._send(pi, {"spo2": 97}, device_id="dev-2")
+        assert len(captured) == 2
+
+    def test_refresh_ms_becomes_interval(self):
+        pi, captured = self._pi()
+        self._send(pi, {"spo2": 97}, refresh_ms=500)
+        assert captured[0][2] == pytest.approx(0.5)
+        assert captured[0][1]["schema"] == self.SCHEMA
+        assert captured[0][1]["schema_hash"] == captured[0][0]["schema_hash"]
+
+    def test_schema_hash_stable_across_equal_schemas(self):
+        pi = PhoneInput()
+        assert pi._schema_hash({"a": 1, "b": 2}) == pi._schema_hash({"b": 2, "a": 1})
+        assert pi._schema_hash({"a": 1}) != pi._schema_hash({"a": 2})
+
+    def test_schema_sent_once_per_phone(self):
+        async def scenario():
+            pi = PhoneInput()
+            ws = FakeWebSocket()
+            ch = ClientChannel(ws)
+            pi._clients = {1: ch}
+            task = asyncio.ensure_future(ch.run())
+            pi._fan_out_sensor("d1", "h1", "schema", None)
+            await asyncio.sleep(0.01)
+            pi._fan_out_sensor("d2", "h1", "schema", None)
+            await asyncio.sleep(0.01)
+            ch.close()
+            await task
+            return ws.sent
+
+        assert asyncio.run(scenario()) == ["schema", "d1", "d2"]
+
+    def test_rate_limit_keeps_latest_value(self):
+        async def scenario():
+            pi = PhoneInput()
+            ws = FakeWebSocket()
+            ch = ClientChannel(ws)
+            pi._clients = {1: ch}
+            task = asyncio.ensure_future(ch.run())
+            for i in range(5):
+                pi._fan_out_sensor(f"d{i}", "h1", "schema", 0.05)
+                await asyncio.sleep(0.005)
+            await asyncio.sleep(0.1)
+            ch.close()
+            await task
+            return ws.sent
+
+        sent = asyncio.run(scenario())
+        assert sent[0] == "schema"
+        assert sent[1] == "d0"
+        assert sent[-1] == "d4"
+        assert len(sent) < 6
+
+    def test_sensor_rate_request_clamped(self):
+        async def scenario():
+            pi = PhoneInput()
+            ch = ClientChannel(FakeWebSocket())
+            pi._parse_message(json.dumps({"type": "sensor_rate", "interval_ms": 5}), ch)
+            fast = ch.rate("sensor_data")
+            pi._parse_message(json.dumps({"type": "sensor_rate", "interval_ms": 2000}), ch)
+            slow = ch.rate("sensor_data")
+            pi._parse_message(json.dumps({"type": "sensor_rate", "interval_ms": None}), ch)
+            return fast, slow, ch.rate("sensor_data")
+
+        fast, slow, reset = asyncio.run(scenario())
+        assert fast == pytest.approx(0.1)
+        assert slow == pytest.approx(2.0)
+        assert reset is None
+
+    def test_requested_rate_overrides_device_rate(self):
+        async def scenario():
+            pi = PhoneInput()
+            ch = ClientChannel(FakeWebSocket())
+            pi._clients = {1: ch}
+            pi._set_sensor_rate(ch, 250)
+            pi._fan_out_sensor("d", "h", "schema", 2.0)
+            return ch.rate("sensor_data")
+
+        assert asyncio.run(scenario()) == pytest.approx(0.25)
+
+    def test_sensor_rate_is_not_an_input_event(self):
+        pi = PhoneInput()
+        assert pi._parse_message(json.dumps({"type": "sensor_rate", "interval_ms": 500})) is None
+
+
+class TestStaticAsset:
+
+    BODY = b"<html>" + b"hello scouter " * 200 + b"</html>"
+
+    def test_gzip_precompressed(self):
+        asset = StaticAsset(self.BODY, "text/html; charset=utf-8")
+        assert gzip.decompress(asset.encoded["gzip"]) == self.BODY
+        assert len(asset.encoded["gzip"]) < len(self.BODY)
+
+    def test_select_honours_accept_encoding(self):
+        asset = StaticAsset(self.BODY, "text/html")
+        coding, body = asset.select("gzip, deflate")
+        assert coding == "gzip"
+        assert body == asset.encoded["gzip"]
+        assert asset.select("") == (None, self.BODY)
+        assert asset.select("gzip;q=0, identity") == (None, self.BODY)
+
+    def test_small_or_binary_not_compressed(self):
+        assert StaticAsset(b"tiny", "text/html").encoded == {}
+        assert StaticAsset(self.BODY, "image/png").encoded == {}
+
+    def test_etag_strong_and_content_based(self):
+        a = StaticAsset(self.BODY, "text/html")
+        b = StaticAsset(self.BODY, "text/html")
+        assert a.etag == b.etag
+        assert a.etag.startswith('"') and not a.etag.startswith("W/")
+        assert StaticAsset(b"other", "text/html").etag != a.etag
+
+    def test_if_none_match(self):
+        asset = StaticAsset(self.BODY, "text/html")
+        assert asset.matches(asset.etag)
+        assert asset.matches(f'"nope", {asset.etag}')
+        assert asset.matches("W/" + asset.etag)
+        assert asset.matches("*")
+        assert not asset.matches('"nope"')
+        assert not asset.matches("")
+
+
+class TestAssetStore:
+
+    def test_serves_file_under_root(self, tmp_path):
+        (tmp_path / "app.js").write_text("console.log('hi');")
+        asset = AssetStore(tmp_path).get("/app.js?v=2")
+        assert asset is not None
+        assert asset.body == b"console.log('hi');"
+        assert "javascript" in asset.content_type
+
+    def test_cached_after_first_load(self, tmp_path):
+        f = tmp_path / "a.css"
+        f.write_text("body{}")
+        store = AssetStore(tmp_path)
+        first = store.get("/a.css")
+        f.write_text("changed")
+        assert store.get("/a.css") is first
+
+    def test_path_variants_share_one_entry(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "index.html").write_text("<html></html>")
+        store = AssetStore(tmp_path)
+        first = store.get("/index.html")
+        for path in ("//index.html", "/./index.html", "/sub/../index.html"):
+            assert store.get(path) is first
+        assert len(store._assets) == 1
+
+    def test_path_traversal_rejected(self, tmp_path):
+        root = tmp_path / "web"
+        root.mkdir()
+        (tmp_path / "secret.txt").write_text("x")
+        store = AssetStore(root)
+        assert store.get("/../secret.txt") is None
+        assert store.get("/%2e%2e/secret.txt") is None
+
+    def test_missing_and_directory(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        store = AssetStore(tmp_path)
+        assert store.get("/nope.js") is None
+        assert store.get("/sub") is None
+        assert store.get("/") is None
+
+
+class TestHttpServing:
+    """_process_request: compression, ETag revalidation, static files."""
+
+    def _request(self, path, **headers):
+        from websockets.datastructures import Headers
+        from websockets.http11 import Request
+
+        h = Headers()
+        for k, v in headers.items():
+            h[k.replace("_", "-")] = v
+        return Request(path, h)
+
+    def _pi(self, tmp_path):
+        html = tmp_path / "index.html"
+        html.write_bytes(b"<html>" + b"control page " * 300 + b"</html>")
+        pi = PhoneInput(html_path=str(html))
+        pi._load_html()
+        return pi
+
+    def test_index_gzip(self, tmp_path):
+        pi = self._pi(tmp_path)
+        resp = pi._process_request(None, self._request("/", Accept_Encoding="gzip"))
+        assert resp.status_code == 200
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(resp.body) == pi._html_bytes
+        assert resp.headers["Content-Length"] == str(len(resp.body))
+        assert resp.headers["X-Frame-Options"] == "DENY"
+
+    def test_index_identity_without_accept_encoding(self, tmp_path):
+        pi = self._pi(tmp_path)
+        resp = pi._process_request(None, self._request("/index.html"))
+        assert "Content-Encoding" not in resp.headers
+        assert resp.body == pi._html_bytes
+
+    def test_revalidation_returns_304(self, tmp_path):
+        pi = self._pi(tmp_path)
+        first = pi._process_request(None, self._request("/"))
+        etag = first.headers["ETag"]
+        resp = pi._process_request(None, self._request("/", If_None_Match=etag))
+        assert resp.status_code == 304
+        assert resp.body == b""
+        assert resp.headers["ETag"] == etag
+
+    def test_static_asset_served_with_cache_headers(self, tmp_path):
+        pi = self._pi(tmp_path)
+        (tmp_path / "icon.svg").write_text("<svg/>")
+        resp = pi._process_request(None, self._request("/icon.svg"))
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"] == "image/svg+xml"
+        assert "max-age" in resp.headers["Cache-Control"]
+
+    def test_unknown_path_falls_through(self, tmp_path):
+        pi = self._pi(tmp_path)
+        assert pi._process_request(None, self._request("/missing")) is None
+
+    def test_websocket_upgrade_passes_through(self, tmp_path):
+        pi = self._pi(tmp_path)
+        assert pi._process_request(None, self._request("/", Upgrade="websocket")) is None
+
+
+class ScriptedWebSocket(FakeWebSocket):
+    """Fake client connection that sends `incoming` then closes."""
+
+    class _Request:
+        def __init__(self, path):
+            self.path = path
+
+    def __init__(self, path, incoming):
+        super().__init__()
+        self.request = self._Request(path)
+        self._incoming = list(incoming)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if not self._incoming:
+            raise StopAsyncIteration
+        return self._incoming.pop(0)
+
+
+class TestClientRoles:
+    """Controller vs read-only observer phones."""
+
+    NAV = json.dumps({"type": "input", "event": "nav_down"})
+
+    def test_requested_role(self):
+        assert _requested_role("/?role=observer") == "observer"
+        assert _requested_role("/?role=controller") == "controller"
+        assert _requested_role("/?role=admin") == "controller"
+        assert _requested_role("/") == "controller"
+        assert _requested_role("") == "controller"
+
+    def test_controller_input_emitted(self):
+        pi = PhoneInput()
+        asyncio.run(pi._handler(ScriptedWebSocket("/", [self.NAV])))
+        event = pi.poll()
+        assert event is not None
+        assert event.type == EventType.NAV_DOWN
+
+    def test_observer_input_ignored(self):
+        pi = PhoneInput()
+        asyncio.run(pi._handler(ScriptedWebSocket("/?role=observer", [self.NAV, self.NAV])))
+        assert pi.poll() is None
+
+    def test_observer_receives_broadcasts(self):
+        async def scenario():
+            pi = PhoneInput()
+            observer = ClientChannel(FakeWebSocket(), role="observer")
+            controller = ClientChannel(FakeWebSocket())
+            pi._clients = {1: observer, 2: controller}
+            pi._fan_out("state", "s")
+            return pi, observer, controller
+
+        pi, observer, controller = asyncio.run(scenario())
+        assert observer.pending == controller.pending == 1
+        stats = pi.stats()
+        assert stats["clients"] == 2
+        assert stats["observers"] == 1
+
+    def test_client_removed_on_disconnect(self):
+        pi = PhoneInput()
+        asyncio.run(pi._handler(ScriptedWebSocket("/", [])))
+        assert pi._clients == {}
@@ -0,0 +1,112 @@
+"""Tests for the power governor (backlight dimming and energy estimate)."""
+
+import pytest
+
+from scouterhud.perf.power import (
+    DIM_BRIGHTNESS,
+    DIM_RATE_SCALE,
+    FULL_BRIGHTNESS,
+    IDLE_AFTER_S,
+    STABLE_AFTER_S,
+    EnergyModel,
+    PowerGovernor,
+    screen_share,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def levels():
+    return []
+
+
+@pytest.fixture
+def gov(clock, levels):
+    return PowerGovernor(levels.append, clock=clock)
+
+
+def _stream(gov, clock, seconds, spo2=97.0, alerting=False):
+    end = clock.t + seconds
+    while clock.t < end:
+        clock.t += 1.0
+        gov.data({"spo2": spo2, "ts": clock.t}, alerting)
+        gov.update("STREAMING")
+
+
+class TestDimming:
+
+    def test_scanning_dims_after_idle(self, gov, clock, levels):
+        gov.update("SCANNING")
+        assert not gov.dimmed
+        clock.t = IDLE_AFTER_S
+        assert gov.update("SCANNING")
+        assert levels == [DIM_BRIGHTNESS]
+        assert gov.interval_scale == DIM_RATE_SCALE
+
+    def test_input_wakes(self, gov, clock, levels):
+        clock.t = IDLE_AFTER_S
+        gov.update("SCANNING")
+        gov.activity()
+        assert not gov.update("SCANNING")
+        assert levels == [DIM_BRIGHTNESS, FULL_BRIGHTNESS]
+        assert gov.interval_scale == 1.0
+
+    def test_stable_vitals_dim(self, gov, clock):
+        _stream(gov, clock, STABLE_AFTER_S + 1)
+        assert gov.dimmed
+
+    def test_changing_vitals_stay_bright(self, gov, clock):
+        for i in range(int(STABLE_AFTER_S) * 2):
+            clock.t += 1.0
+            gov.data({"spo2": 90.0 + (i % 2) * 5}, False)
+            gov.update("STREAMING")
+        assert not gov.dimmed
+
+    def test_small_noise_is_stable(self, gov, clock):
+        for i in range(int(STABLE_AFTER_S) + 2):
+            clock.t += 1.0
+            gov.data({"spo2": 97.0 + (i % 2) * 0.5}, False)
+            gov.update("STREAMING")
+        assert gov.dimmed
+
+    def test_alert_wakes(self, gov, clock):
+        _stream(gov, clock, STABLE_AFTER_S + 1)
+        _stream(gov, clock, 1, alerting=True)
+        assert not gov.dimmed
+        _stream(gov, clock, STABLE_AFTER_S * 2, alerting=True)
+        assert not gov.dimmed
+
+    def test_device_list_never_dims(self, gov, clock):
+        clock.t = 1000.0
+        assert not gov.update("DEVICE_LIST")
+
+
+class TestEnergy:
+
+    def test_duty_and_estimate(self, gov, clock):
+        clock.t = IDLE_AFTER_S
+        gov.update("SCANNING")
+        clock.t = 2 * IDLE_AFTER_S
+        for _ in range(20):
+            gov.frame_sent()
+        energy = gov.energy()
+        duty = (1.0 + DIM_BRIGHTNESS / 255.0) / 2
+        assert energy["backlight_duty"] == pytest.approx(duty, abs=1e-3)
+        assert energy["frames_per_s"] == 1.0
+        assert energy["mwh_per_hour"] == pytest.approx(EnergyModel().power_mw(duty, 1.0), abs=0.1)
+
+    def test_partial_updates_count_by_area(self):
+        assert screen_share([(0, 0, 240, 3), (0, 237, 240, 240)]) == pytest.approx(6 / 240)
+        assert screen_share([(0, 0, 240, 240)]) == 1.0
@@ -102,6 +102,25 @@ class TestParseQrlinkUrl:
         url = "qrlink://v1/dev/mqtt/host:abc"
         assert parse_qrlink_url(url) is None
 
+    def test_repeated_parse_returns_independent_links(self):
+        url = "qrlink://v1/cache-dev/mqtt/10.0.0.5:1883?auth=open&t=a/b"
+        first = parse_qrlink_url(url)
+        first.update_from_metadata({"name": "Renamed", "schema": {"x": {"unit": "C"}}})
+        second = parse_qrlink_url(url)
+        assert second is not first
+        assert second.name is None
+        assert second.schema == {}
+        assert second.key == first.key
+
+    def test_parse_is_memoized(self):
+        from scouterhud.qrlink.protocol import _parse_qrlink_url_cached
+
+        url = "qrlink://v1/memo-dev/mqtt/10.0.0.6:1883"
+        parse_qrlink_url(url)
+        hits = _parse_qrlink_url_cached.cache_info().hits
+        parse_qrlink_url(url)
+        assert _parse_qrlink_url_cached.cache_info().hits == hits + 1
+
 
 class TestDeviceLink:
     """Tests for DeviceLink dataclass."""
@@ -163,3 +182,10 @@ class TestDeviceLink:
         link = self._make_link(name="Original")
         link.update_from_metadata({})
         assert link.name == "Original"  # unchanged
+
+    def test_key_identifies_endpoint(self):
+        a = DeviceLink(version=1, id="d", proto="mqtt", host="h", port=1, topic="t")
+        b = DeviceLink(version=1, id="d", proto="mqtt", host="h", port=1, topic="t", name="x")
+        c = DeviceLink(version=1, id="d", proto="mqtt", host="h", port=2, topic="t")
+        assert a.key == b.key
+        assert a.key != c.key
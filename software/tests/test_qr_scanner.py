@@ -0,0 +1,246 @@
+"""Tests for continuous QR scanning (candidate detection, scanner thread)."""
+
+import threading
+import time
+
+import numpy as np
+
+from scouterhud.camera.backend import CameraBackend
+from scouterhud.camera.qr_scanner import (
+    ContinuousQRScanner,
+    DecodeCache,
+    find_qr_candidates,
+    region_hash,
+)
+
+
+def synthetic_qr(modules=25, px=6, size=(480, 640), at=(100, 200), seed=0):
+    """Grayscale frame with a QR-like symbol (random modules + 3 finder patterns)."""
+    rng = np.random.default_rng(seed)
+    grid = rng.integers(0, 2, (modules, modules)).astype(bool)
+    finder = np.ones((7, 7), bool)
+    finder[1:6, 1:6] = False
+    finder[2:5, 2:5] = True
+    for r, c in ((0, 0), (0, modules - 7), (modules - 7, 0)):
+        grid[r:r + 7, c:c + 7] = finder
+    frame = np.full(size, 200, np.uint8)
+    symbol = np.where(np.kron(grid, np.ones((px, px), bool)), 20, 235).astype(np.uint8)
+    y, x = at
+    frame[y:y + symbol.shape[0], x:x + symbol.shape[1]] = symbol
+    return frame
+
+
+class FakeCamera(CameraBackend):
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.captures = 0
+
+    def capture_frame(self):
+        raise NotImplementedError
+
+    def capture_gray(self):
+        self.captures += 1
+        return self.frame
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def is_available(self):
+        return True
+
+
+class TestFindCandidates:
+
+    def test_finds_symbol_region(self):
+        frame = synthetic_qr(at=(100, 200))
+        boxes = find_qr_candidates(frame)
+        assert boxes
+        left, top, right, bottom = boxes[0]
+        # Box covers the whole 150x150 symbol
+        assert left <= 200 and top <= 100
+        assert right >= 350 and bottom >= 250
+
+    def test_flat_frame_has_no_candidates(self):
+        assert find_qr_candidates(np.full((480, 640), 128, np.uint8)) == []
+
+    def test_low_contrast_noise_rejected(self):
+        rng = np.random.default_rng(1)
+        noise = rng.normal(128, 5, (480, 640)).clip(0, 255).astype(np.uint8)
+        assert find_qr_candidates(noise) == []
+
+    def test_symbol_ranked_above_stripes(self):
+        frame = synthetic_qr(at=(250, 350))
+        frame[20:120, 20:200:4] = 30  # vertical stripes (one-axis transitions only)
+        boxes = find_qr_candidates(frame)
+        assert boxes
+        left, top, _right, _bottom = boxes[0]
+        assert left >= 300 and top >= 200
+
+    def test_tiny_frame(self):
+        assert find_qr_candidates(np.zeros((4, 4), np.uint8)) == []
+
+
+class TestContinuousScanner:
+
+    def _wait_for(self, cond, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not cond() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return cond()
+
+    def test_decodes_candidate_region_only(self):
+        frame = synthetic_qr()
+        shapes = []
+
+        def decoder(region):
+            shapes.append(region.shape)
+            return "qrlink://v1?id=x"
+
+        results = []
+        scanner = ContinuousQRScanner(FakeCamera(frame), results.append, decoder=decoder)
+        scanner.start()
+        try:
+            assert self._wait_for(lambda: results)
+        finally:
+            scanner.stop()
+        assert results[0] == "qrlink://v1?id=x"
+        assert shapes[0][0] < frame.shape[0] and shapes[0][1] < frame.shape[1]
+
+    def test_same_payload_reported_once(self):
+        results = []
+        scanner = ContinuousQRScanner(
+            FakeCamera(synthetic_qr()), results.append,
+            decoder=lambda region: "qrlink://same", max_fps=100,
+        )
+        scanner.start()
+        try:
+            assert self._wait_for(lambda: scanner.scans >= 5)
+        finally:
+            scanner.stop()
+        assert results == ["qrlink://same"]
+
+    def test_frames_skipped_while_decoding(self):
+        release = threading.Event()
+
+        def slow_decoder(region):
+            release.wait(1.0)
+            return None
+
+        scanner = ContinuousQRScanner(
+            FakeCamera(synthetic_qr()), lambda p: None, decoder=slow_decoder, max_fps=200,
+        )
+        scanner.start()
+        try:
+            assert self._wait_for(lambda: scanner.skipped >= 3)
+        finally:
+            release.set()
+            scanner.stop()
+        assert scanner.scans < scanner.frames
+
+    def test_full_frame_fallback(self):
+        blank = np.full((240, 320), 128, np.uint8)
+        seen = []
+        scanner = ContinuousQRScanner(FakeCamera(blank), lambda p: None,
+                                      decoder=lambda g: seen.append(g.shape))
+        for _ in range(15):
+            scanner._scan(blank)
+        assert seen == [(240, 320)]
+
+    def test_paused_scanner_does_not_capture(self):
+        camera = FakeCamera(synthetic_qr())
+        scanner = ContinuousQRScanner(camera, lambda p: None, decoder=lambda g: None)
+        scanner.paused = True
+        scanner.start()
+        time.sleep(0.15)
+        scanner.stop()
+        assert camera.captures == 0
+
+    def test_stats(self):
+        scanner = ContinuousQRScanner(
+            FakeCamera(synthetic_qr()), lambda p: None, decoder=lambda g: None, max_fps=100,
+        )
+        scanner.start()
+        try:
+            self._wait_for(lambda: scanner.scans >= 3)
+        finally:
+            scanner.stop()
+        stats = scanner.stats()
+        for key in ("scans_per_s", "frames_per_s", "cpu_pct", "skipped", "regions"):
+            assert key in stats
+        assert stats["scans_per_s"] > 0
+        assert stats["regions"] >= 3
+
+
+class TestDecodeCache:
+
+    def test_region_hash_stable_under_noise(self):
+        region = synthetic_qr()[100:250, 200:350]
+        rng = np.random.default_rng(3)
+        noisy = (region.astype(int) + rng.normal(0, 6, region.shape)).clip(0, 255)
+        other = synthetic_qr(seed=5)[100:250, 200:350]
+        a, b, c = region_hash(region), region_hash(noisy.astype(np.uint8)), region_hash(other)
+        assert (a ^ b).bit_count() <= 4
+        assert (a ^ c).bit_count() > 8
+
+    def test_region_hash_too_small(self):
+        assert region_hash(np.zeros((4, 4), np.uint8)) == -1
+
+    def test_hit_within_ttl(self):
+        cache = DecodeCache(ttl=2.0)
+        cache.put(0b1010, "qrlink://a", now=10.0)
+        assert cache.get(0b1010, now=11.0) == "qrlink://a"
+        assert cache.hits == 1
+
+    def test_expired_entry_dropped(self):
+        cache = DecodeCache(ttl=2.0)
+        cache.put(0b1010, "qrlink://a", now=10.0)
+        assert cache.get(0b1010, now=12.5) is None
+        assert len(cache) == 0
+
+    def test_near_hash_matches(self):
+        cache = DecodeCache(max_distance=2)
+        cache.put(0b1111_0000, "qrlink://a", now=0.0)
+        assert cache.get(0b1111_0011, now=0.1) == "qrlink://a"
+        assert cache.get(0b0000_1111, now=0.1) is None
+
+    def test_lru_eviction(self):
+        cache = DecodeCache(max_entries=2, max_distance=0)
+        cache.put(1, "a", now=0.0)
+        cache.put(2, "b", now=0.0)
+        cache.get(1, now=0.0)
+        cache.put(4, "c", now=0.0)
+        assert cache.get(2, now=0.0) is None
+        assert cache.get(1, now=0.0) == "a"
+
+    def test_scanner_reuses_cached_decode(self):
+        calls = []
+
+        def decoder(region):
+            calls.append(region.shape)
+            return "qrlink://v1/x/mqtt/h:1"
+
+        scanner = ContinuousQRScanner(FakeCamera(None), lambda p: None, decoder=decoder)
+        frame = synthetic_qr()
+        for _ in range(5):
+            assert scanner._scan(frame) == "qrlink://v1/x/mqtt/h:1"
+        assert len(calls) == 1
+        assert scanner.stats()["cache_hits"] == 4
+
+
+class TestCameraBackendGray:
+
+    def test_default_capture_gray_converts_frame(self):
+        from PIL import Image
+
+        class RGBCamera(FakeCamera):
+            def capture_frame(self):
+                return Image.new("RGB", (8, 4), (255, 255, 255))
+
+        gray = CameraBackend.capture_gray(RGBCamera(None))
+        assert gray.shape == (4, 8)
+        assert gray.dtype == np.uint8
+        assert int(gray[0, 0]) == 255
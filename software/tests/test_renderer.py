@@ -163,3 +163,62 @@ class TestRenderFrame:
         link = _make_link(name="Bed 12", type="medical.patient_monitor")
         data = {}  # no fields at all
         _assert_valid_frame(render_frame(link, data))
+
+    def test_medical_with_history_draws_trends(self):
+        from scouterhud.telemetry.history import HistoryStore
+
+        link = _make_link(
+            name="Bed 12",
+            type="medical.patient_monitor",
+            schema={"spo2": {"alert_below": 90}},
+        )
+        history = HistoryStore()
+        for t in range(0, 600, 5):
+            history.record(link.id, {"spo2": 98 - t / 600, "heart_rate": 72}, now=float(t))
+
+        data = {"spo2": 97, "heart_rate": 72, "status": "stable", "alerts": []}
+        plain = render_frame(link, data)
+        with_trends = render_frame(link, data, history)
+        _assert_valid_frame(with_trends)
+        # Chart area is only drawn with history
+        assert plain.crop((0, 130, 240, 210)).getbbox() is None
+        assert with_trends.crop((0, 130, 240, 210)).getbbox() is not None
+
+
+class TestSparkline:
+    """Tests for the trend widgets."""
+
+    def test_segments_split_at_gaps(self):
+        import numpy as np
+        from scouterhud.display.widgets import sparkline_segments
+
+        values = np.array([1, 2, np.nan, np.nan, 3, 4, 5], dtype=np.float32)
+        segments = sparkline_segments(values, 0, 0, 7, 11)
+        assert [len(s) for s in segments] == [2, 3]
+
+    def test_segments_scaled_into_box(self):
+        from scouterhud.display.widgets import sparkline_segments
+
+        (segment,) = sparkline_segments([0, 5, 10], 10, 20, 101, 11)
+        assert segment[0] == (10.0, 30.0)   # min → bottom-left
+        assert segment[-1] == (110.0, 20.0)  # max → top-right
+
+    def test_flat_series_mid_height(self):
+        from scouterhud.display.widgets import sparkline_segments
+
+        (segment,) = sparkline_segments([5, 5, 5], 0, 0, 10, 11)
+        assert {y for _, y in segment} == {5.0}
+
+    def test_no_data(self):
+        from scouterhud.display.widgets import sparkline_segments
+
+        assert sparkline_segments([float("nan")] * 4, 0, 0, 10, 10) == []
+        assert sparkline_segments([], 0, 0, 10, 10) == []
+
+    def test_mini_chart_without_data(self):
+        from PIL import ImageDraw
+        from scouterhud.display.widgets import draw_mini_chart
+
+        img = Image.new("RGB", (240, 240))
+        draw_mini_chart(ImageDraw.Draw(img), 4, 4, 112, 60, [float("nan")] * 10, "SpO2")
+        assert img.getbbox() is not None
@@ -0,0 +1,162 @@
+"""Tests for the HUD-side streaming rule engine."""
+
+import json
+
+import pytest
+
+from scouterhud.perf.metrics import PerfStats
+from scouterhud.telemetry.rules import (
+    RuleEngine,
+    _CompiledRule,
+    compile_rule,
+    load_rules,
+    schema_rules,
+)
+
+VITALS_SCHEMA = {
+    "spo2": {"unit": "%", "range": [0, 100], "alert_below": 90},
+    "heart_rate": {"unit": "bpm", "range": [30, 200], "alert_above": 120},
+}
+
+
+class TestSchemaRules:
+    """Thresholds taken from the device schema."""
+
+    def test_rules_from_schema(self):
+        ids = [s["id"] for s in schema_rules(VITALS_SCHEMA)]
+        assert ids == ["spo2_low", "heart_rate_high"]
+
+    def test_threshold_is_inclusive_like_value_color(self):
+        engine = RuleEngine()
+        alerts = engine.evaluate("bed-1", {"spo2": 90, "heart_rate": 80}, VITALS_SCHEMA, now=0.0)
+        assert [a.message for a in alerts] == ["LOW_SPO2"]
+
+    def test_alert_clears(self):
+        engine = RuleEngine()
+        engine.evaluate("bed-1", {"spo2": 85}, VITALS_SCHEMA, now=0.0)
+        assert engine.evaluate("bed-1", {"spo2": 97}, VITALS_SCHEMA, now=1.0) == []
+
+    def test_non_numeric_values_ignored(self):
+        engine = RuleEngine()
+        assert engine.evaluate("bed-1", {"spo2": "n/a", "heart_rate": None}, VITALS_SCHEMA) == []
+
+    def test_compiled_once_per_schema(self):
+        engine = RuleEngine()
+        for t in range(5):
+            engine.evaluate("bed-1", {"spo2": 97}, VITALS_SCHEMA, now=float(t))
+        assert engine.compiles == 1
+        engine.evaluate("bed-1", {"spo2": 97}, dict(VITALS_SCHEMA), now=5.0)
+        assert engine.compiles == 2
+
+
+class TestUserRules:
+    """Sustained, rate-of-change and cross-field rules."""
+
+    def test_sustained_breach(self):
+        engine = RuleEngine([{"id": "low", "field": "spo2", "below": 93, "for_s": 10}])
+        assert engine.evaluate("bed-1", {"spo2": 92}, now=0.0) == []
+        assert engine.evaluate("bed-1", {"spo2": 92}, now=9.0) == []
+        assert [a.rule_id for a in engine.evaluate("bed-1", {"spo2": 92}, now=10.0)] == ["low"]
+
+    def test_sustained_resets_on_recovery(self):
+        engine = RuleEngine([{"id": "low", "field": "spo2", "below": 93, "for_s": 10}])
+        engine.evaluate("bed-1", {"spo2": 92}, now=0.0)
+        engine.evaluate("bed-1", {"spo2": 96}, now=5.0)
+        assert engine.evaluate("bed-1", {"spo2": 92}, now=12.0) == []
+
+    def test_rate_of_change_per_minute(self):
+        rule = {"id": "falling", "when": {"field": "spo2", "rate_below": -2, "window_s": 60}}
+        engine = RuleEngine([rule])
+        alerts = []
+        for t in range(0, 61, 5):
+            alerts = engine.evaluate("bed-1", {"spo2": 98 - t * 0.05}, now=float(t))  # -3/min
+        assert [a.rule_id for a in alerts] == ["falling"]
+
+    def test_rate_needs_half_a_window(self):
+        rule = {"when": {"field": "spo2", "rate_below": -2, "window_s": 60}}
+        engine = RuleEngine([rule])
+        engine.evaluate("bed-1", {"spo2": 98}, now=0.0)
+        assert engine.evaluate("bed-1", {"spo2": 90}, now=10.0) == []
+
+    def test_cross_field(self):
+        rule = {"id": "hypoxia", "severity": "critical", "when": [
+            {"field": "spo2", "below": 92}, {"field": "heart_rate", "above": 110},
+        ]}
+        engine = RuleEngine([rule])
+        assert engine.evaluate("bed-1", {"spo2": 91, "heart_rate": 100}, now=0.0) == []
+        alerts = engine.evaluate("bed-1", {"spo2": 91, "heart_rate": 115}, now=1.0)
+        assert [(a.rule_id, a.severity) for a in alerts] == [("hypoxia", "critical")]
+
+    def test_type_scope(self):
+        engine = RuleEngine([{"id": "hot", "type": "medical.*", "field": "temp", "above": 38}])
+        assert engine.evaluate("a", {"temp": 39}, device_type="vehicle.obd2") == []
+        assert len(engine.evaluate("b", {"temp": 39}, device_type="medical.monitor")) == 1
+
+    def test_state_is_per_device(self):
+        engine = RuleEngine([{"id": "low", "field": "spo2", "below": 93, "for_s": 10}])
+        engine.evaluate("bed-1", {"spo2": 92}, now=0.0)
+        engine.evaluate("bed-2", {"spo2": 92}, now=8.0)
+        assert len(engine.evaluate("bed-1", {"spo2": 92}, now=10.0)) == 1
+        assert engine.evaluate("bed-2", {"spo2": 92}, now=10.0) == []
+        assert [a.device_id for a in engine.active()] == ["bed-1"]
+
+    def test_invalid_rule_rejected(self):
+        with pytest.raises(ValueError):
+            compile_rule({"id": "bad", "field": "spo2"})
+        with pytest.raises(ValueError):
+            compile_rule({"field": "spo2", "above": 1, "severity": "panic"})
+
+    @pytest.mark.parametrize("cond", [
+        {"field": "spo2", "rate_below": -1, "window_s": 0},
+        {"field": "spo2", "rate_below": -1, "window_s": -30},
+        {"field": "spo2", "below": "93"},
+        {"field": "spo2", "rate_above": "1"},
+    ])
+    def test_bad_thresholds_rejected_at_compile(self, cond, tmp_path):
+        with pytest.raises(ValueError):
+            compile_rule({"when": cond})
+        (tmp_path / "r.json").write_text(json.dumps([{"when": cond}]))
+        with pytest.raises(ValueError):
+            load_rules(tmp_path / "r.json")
+        # Skipped with a warning when it reaches the engine anyway
+        engine = RuleEngine([{"when": cond}])
+        assert engine.evaluate("bed-1", {"spo2": 90}, now=0.0) == []
+        assert engine.evaluate("bed-1", {"spo2": 80}, now=60.0) == []
+
+    def test_failing_rule_does_not_stop_the_others(self):
+        engine = RuleEngine([{"id": "hot", "field": "temp", "above": 38}])
+        engine.evaluate("bed-1", {"temp": 36}, now=0.0)
+        engine._devices["bed-1"].rules.insert(0, _CompiledRule("boom", "BOOM", "warning", lambda d, n: 1 / 0))
+        assert [a.rule_id for a in engine.evaluate("bed-1", {"temp": 39}, now=1.0)] == ["hot"]
+
+
+class TestEngineHooks:
+    """Callbacks, perf metrics and rule files."""
+
+    def test_on_change_fired_and_cleared(self):
+        events = []
+        engine = RuleEngine(on_change=lambda d, f, c: events.append((d, len(f), len(c))))
+        engine.evaluate("bed-1", {"spo2": 85}, VITALS_SCHEMA, now=0.0)
+        engine.evaluate("bed-1", {"spo2": 85}, VITALS_SCHEMA, now=1.0)
+        engine.evaluate("bed-1", {"spo2": 97}, VITALS_SCHEMA, now=2.0)
+        assert events == [("bed-1", 1, 0), ("bed-1", 0, 1)]
+
+    def test_eval_cost_recorded(self):
+        perf = PerfStats()
+        engine = RuleEngine(perf=perf)
+        engine.evaluate("bed-1", {"spo2": 85}, VITALS_SCHEMA)
+        snap = perf.snapshot()
+        assert snap["latency"]["rules.eval"]["count"] == 1
+        assert snap["counters"]["rules.fired"] == 1
+
+    def test_load_rules_json_and_yaml(self, tmp_path):
+        spec = [{"id": "hot", "field": "temp", "above": 38}]
+        (tmp_path / "r.json").write_text(json.dumps({"rules": spec}))
+        (tmp_path / "r.yaml").write_text("- id: hot\n  field: temp\n  above: 38\n")
+        assert load_rules(tmp_path / "r.json") == spec
+        assert load_rules(tmp_path / "r.yaml") == spec
+
+    def test_load_rules_validates(self, tmp_path):
+        (tmp_path / "r.json").write_text(json.dumps([{"field": "temp"}]))
+        with pytest.raises(ValueError):
+            load_rules(tmp_path / "r.json")
@@ -265,6 +265,215 @@ class TestSPIBackendShow:
         assert pixel_data[1] == 0x1F
 
 
+class TestSPIBackendShowRegion:
+
+    def _window(self, spi):
+        return [c[0][0][0] for c in spi.writebytes.call_args_list]
+
+    def test_region_sends_only_box_pixels(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes.reset_mock()
+        spi.writebytes2.reset_mock()
+
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show_region(img, (10, 20, 50, 40))
+
+        pixel_bytes = sum(len(c[0][0]) for c in spi.writebytes2.call_args_list)
+        assert pixel_bytes == 40 * 20 * 2
+        # CASET 10..49, RASET 20..39, RAMWR
+        assert self._window(spi) == [0x2A, 0, 10, 0, 49, 0x2B, 0, 20, 0, 39, 0x2C]
+
+    def test_region_sends_box_content(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes2.reset_mock()
+
+        img = Image.new("RGB", (240, 240), (0, 0, 0))
+        img.paste((0, 0, 255), (100, 100, 110, 110))
+        backend.show_region(img, (100, 100, 110, 110))
+
+        data = b"".join(bytes(c[0][0]) for c in spi.writebytes2.call_args_list)
+        assert data == b"\x00\x1f" * 100
+
+    def test_region_mirrored_window(self, mock_hardware):
+        backend = _make_backend(mock_hardware, mirror=True)
+        spi = mock_hardware["spi"]
+        spi.writebytes.reset_mock()
+
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show_region(img, (10, 20, 50, 40))
+
+        assert self._window(spi)[:5] == [0x2A, 0, 190, 0, 229]
+
+    def test_region_clipped_to_screen(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes2.reset_mock()
+
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show_region(img, (230, 230, 260, 260))
+
+        pixel_bytes = sum(len(c[0][0]) for c in spi.writebytes2.call_args_list)
+        assert pixel_bytes == 10 * 10 * 2
+
+    def test_empty_region_sends_nothing(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes2.reset_mock()
+
+        backend.show_region(Image.new("RGB", (240, 240)), (50, 50, 50, 60))
+
+        spi.writebytes2.assert_not_called()
+
+    def test_regions_send_only_boxes(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes2.reset_mock()
+
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show_regions(img, [(0, 0, 240, 3), (0, 237, 240, 240)])
+
+        pixel_bytes = sum(len(c[0][0]) for c in spi.writebytes2.call_args_list)
+        assert pixel_bytes == 2 * 240 * 3 * 2
+
+
+class TestSPIBackendBlackBands:
+
+    def _pixel_bytes(self, spi):
+        return sum(len(c[0][0]) for c in spi.writebytes2.call_args_list)
+
+    def test_first_frame_sent_in_full(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        spi.writebytes2.reset_mock()
+
+        backend.show(Image.new("RGB", (240, 240)))
+
+        assert self._pixel_bytes(spi) == 240 * 240 * 2
+
+    def test_black_bands_skipped_on_second_frame(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        img = Image.new("RGB", (240, 240))
+        img.paste((255, 255, 255), (10, 20, 50, 30))  # rows 20..29 → bands 2, 3
+        backend.show(img)
+        spi.writebytes2.reset_mock()
+
+        img.paste((255, 0, 0), (10, 20, 50, 30))
+        backend.show(img)
+
+        assert self._pixel_bytes(spi) == 16 * 240 * 2
+        assert backend.stats()["bands_skipped"] == 28
+
+    def test_band_cleared_when_content_leaves(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        img = Image.new("RGB", (240, 240))
+        img.paste((255, 255, 255), (0, 0, 240, 8))
+        backend.show(img)
+        spi.writebytes2.reset_mock()
+
+        backend.show(Image.new("RGB", (240, 240)))
+
+        # Band 0 was lit: it has to be blanked once
+        assert self._pixel_bytes(spi) == 8 * 240 * 2
+
+    def test_nothing_sent_after_clear(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        backend.clear()
+        spi.writebytes2.reset_mock()
+        spi.writebytes.reset_mock()
+
+        backend.show(Image.new("RGB", (240, 240)))
+
+        spi.writebytes2.assert_not_called()
+        spi.writebytes.assert_not_called()
+
+    def test_adjacent_bands_one_window(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        backend.clear()
+        spi.writebytes.reset_mock()
+        img = Image.new("RGB", (240, 240))
+        img.paste((255, 0, 0), (0, 8, 240, 24))  # bands 1, 2
+
+        backend.show(img)
+
+        cmds = [c[0][0][0] for c in spi.writebytes.call_args_list]
+        assert cmds.count(0x2C) == 1
+        # RASET rows 8..23
+        i = cmds.index(0x2B)
+        assert cmds[i : i + 5] == [0x2B, 0, 8, 0, 23]
+
+    def test_region_write_invalidates_band(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        backend.clear()
+        img = Image.new("RGB", (240, 240))
+        img.paste((255, 0, 0), (0, 0, 240, 3))
+        backend.show_region(img, (0, 0, 240, 3))
+        spi.writebytes2.reset_mock()
+
+        backend.show(Image.new("RGB", (240, 240)))
+
+        assert self._pixel_bytes(spi) == 8 * 240 * 2
+
+
+class TestSPIBackendRepeatFrames:
+
+    def test_identical_frame_not_sent(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        backend.show(Image.new("RGB", (240, 240), (255, 0, 0)))
+        spi.writebytes2.reset_mock()
+        spi.writebytes.reset_mock()
+
+        backend.show(Image.new("RGB", (240, 240), (255, 0, 0)))
+
+        spi.writebytes2.assert_not_called()
+        spi.writebytes.assert_not_called()
+        assert backend.stats()["frames_skipped"] == 1
+        assert backend.stats()["frames_shown"] == 1
+
+    def test_changed_frame_sent(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show(img)
+        spi.writebytes2.reset_mock()
+
+        img.putpixel((120, 120), (0, 0, 255))
+        backend.show(img)
+
+        assert spi.writebytes2.call_count > 0
+
+    def test_frame_resent_after_region_write(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show(img)
+        backend.show_region(Image.new("RGB", (240, 240)), (0, 0, 10, 10))
+        spi.writebytes2.reset_mock()
+
+        backend.show(img)
+
+        assert spi.writebytes2.call_count > 0
+
+    def test_frame_resent_after_clear(self, mock_hardware):
+        backend = _make_backend(mock_hardware)
+        spi = mock_hardware["spi"]
+        img = Image.new("RGB", (240, 240), (255, 0, 0))
+        backend.show(img)
+        backend.clear()
+        spi.writebytes2.reset_mock()
+
+        backend.show(img)
+
+        assert spi.writebytes2.call_count > 0
+
+
 class TestSPIBackendClear:
 
     def test_clear_sends_black_pixels(self, mock_hardware):
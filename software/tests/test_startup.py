@@ -0,0 +1,98 @@
+"""Tests for lazy imports and the startup profiler."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scouterhud.perf.startup import StartupProfiler
+
+SOFTWARE_DIR = Path(__file__).resolve().parents[1]
+
+
+def _modules_after(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the set of loaded modules."""
+    out = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys; print('\\n'.join(sys.modules))"],
+        cwd=SOFTWARE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(out.stdout.split())
+
+
+class TestLazyImports:
+    """Importing the entry point must not pull in mode-specific backends."""
+
+    def test_main_import_skips_heavy_backends(self):
+        mods = _modules_after("import scouterhud.main")
+        for heavy in ("pygame", "paho", "pyzbar", "websockets", "spidev"):
+            assert heavy not in mods, f"{heavy} imported at startup"
+
+    def test_keyboard_module_does_not_import_pygame(self):
+        mods = _modules_after("import scouterhud.input.keyboard_input")
+        assert "pygame" not in mods
+
+    def test_widgets_fonts_loaded_on_first_use(self):
+        from scouterhud.display import widgets
+
+        font = widgets.FONT_TINY
+        assert font is widgets.get_font(widgets.SIZE_TINY)
+
+    def test_widgets_unknown_attribute_raises(self):
+        from scouterhud.display import widgets
+
+        with pytest.raises(AttributeError):
+            widgets.FONT_HUGE
+
+
+class TestStartupProfiler:
+
+    def test_phase_recorded(self):
+        prof = StartupProfiler()
+        with prof.phase("display init"):
+            pass
+        assert any("display init" in line for line in prof.report())
+
+    def test_import_hook_records_new_modules(self):
+        prof = StartupProfiler()
+        sys.modules.pop("colorsys", None)
+        prof.install()
+        try:
+            import colorsys  # noqa: F401
+        finally:
+            prof.uninstall()
+        assert any("colorsys" in line for line in prof.report())
+
+    def test_uninstall_restores_import(self):
+        import builtins
+
+        original = builtins.__import__
+        prof = StartupProfiler()
+        prof.install()
+        prof.uninstall()
+        assert builtins.__import__ is original
+
+    def test_first_frame_only_once(self):
+        prof = StartupProfiler()
+        prof.install()
+        prof.first_frame()
+        first = prof.first_frame_seconds
+        prof.first_frame()
+        assert first is not None
+        assert prof.first_frame_seconds == first
+        assert any("first frame" in line for line in prof.report())
+
+    def test_entry_point_imports_profiled(self):
+        code = (
+            "import sys; sys.argv = ['hud', '--profile-startup']\n"
+            "import scouterhud.main as m\n"
+            "m._startup_profiler.uninstall()\n"
+            "print('\\n'.join(m._startup_profiler.report()))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=SOFTWARE_DIR, capture_output=True, text=True, check=True,
+        )
+        assert "scouterhud.display.renderer" in out.stdout
@@ -0,0 +1,91 @@
+"""Tests for compiled schema threshold tables."""
+
+import pytest
+
+from scouterhud.display.widgets import GREEN, RED, WHITE, YELLOW, field_color, value_color
+from scouterhud.qrlink.protocol import DeviceLink
+from scouterhud.telemetry.thresholds import ALERT, OK, WARN, FieldBands, ThresholdTable
+
+SCHEMA = {
+    "spo2": {"unit": "%", "alert_below": 90},
+    "heart_rate": {"unit": "bpm", "alert_above": 120, "hysteresis": 3},
+    "temp_c": {"unit": "C"},
+}
+
+
+def _make_link(**kwargs):
+    defaults = dict(version=1, id="bed-1", proto="mqtt", host="localhost", port=1883)
+    defaults.update(kwargs)
+    return DeviceLink(**defaults)
+
+
+class TestFieldBands:
+    """Levels match the old value_color thresholds."""
+
+    @pytest.mark.parametrize("value,level", [(120, ALERT), (130, ALERT), (108, WARN), (107, OK)])
+    def test_alert_above(self, value, level):
+        assert FieldBands.from_schema({"alert_above": 120}).level(value) == level
+
+    @pytest.mark.parametrize("value,level", [(90, ALERT), (99, WARN), (99.5, OK)])
+    def test_alert_below(self, value, level):
+        assert FieldBands.from_schema({"alert_below": 90}).level(value) == level
+
+    def test_no_thresholds_is_ok(self):
+        assert FieldBands.from_schema({"unit": "C"}).level(1e9) == OK
+
+    def test_value_color_unchanged(self):
+        assert value_color(85, {"alert_below": 90}) == RED
+        assert value_color(95, {"alert_below": 90}) == YELLOW
+        assert value_color(100, {"alert_below": 90}) == GREEN
+        assert value_color(100, None) == WHITE
+
+
+class TestHysteresis:
+    """Colors stop flickering near a limit."""
+
+    def test_stays_alert_within_hysteresis(self):
+        table = ThresholdTable(SCHEMA)
+        assert table.display_level("heart_rate", 121) == ALERT
+        assert table.display_level("heart_rate", 118) == ALERT   # 120 - 3 < 118
+        assert table.display_level("heart_rate", 116) == WARN
+
+    def test_rising_uses_plain_limits(self):
+        table = ThresholdTable(SCHEMA)
+        assert table.display_level("heart_rate", 119) == WARN
+        assert table.display_level("heart_rate", 105) == WARN    # 108 - 3 <= 105
+        assert table.display_level("heart_rate", 104) == OK
+
+    def test_level_is_stateless(self):
+        table = ThresholdTable(SCHEMA)
+        table.display_level("heart_rate", 125)
+        assert table.level("heart_rate", 118) == WARN
+
+
+class TestThresholdTable:
+    """Lookups, colors and compilation on DeviceLink."""
+
+    def test_unknown_field_and_non_numeric(self):
+        table = ThresholdTable(SCHEMA)
+        assert table.level("rpm", 5000) is None
+        assert table.level("spo2", "--") is None
+        assert field_color(table, "spo2", "--") == WHITE
+        assert field_color(table, "temp_c", 40) == GREEN
+
+    def test_levels_for_phone(self):
+        table = ThresholdTable(SCHEMA)
+        assert table.levels({"spo2": 88, "heart_rate": 80, "status": "x"}) == {
+            "spo2": "alert", "heart_rate": "ok",
+        }
+
+    def test_compiled_on_metadata(self):
+        link = _make_link()
+        link.update_from_metadata({"schema": SCHEMA})
+        table = link.thresholds
+        assert table.schema is SCHEMA
+        assert link.thresholds is table  # no recompilation per frame
+
+    def test_recompiled_when_schema_replaced(self):
+        link = _make_link(schema={"spo2": {"alert_below": 90}})
+        assert link.thresholds.level("spo2", 91) == WARN
+        link.schema = {"spo2": {"alert_below": 80}}
+        assert link.thresholds.level("spo2", 91) == OK
@@ -0,0 +1,160 @@
+"""Tests for background alert monitoring of known devices.
+
+paho's Client is patched: no broker is needed.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from scouterhud.qrlink.protocol import DeviceLink
+from scouterhud.qrlink.watcher import DeviceWatcher, device_alerts
+from scouterhud.telemetry.rules import RuleEngine
+
+
+def _make_link(device_id: str, host: str = "broker", **kwargs):
+    defaults = dict(version=1, id=device_id, proto="mqtt", host=host, port=1883,
+                    topic=f"ward/{device_id}/vitals")
+    defaults.update(kwargs)
+    return DeviceLink(**defaults)
+
+
+def _msg(link: DeviceLink, data: dict):
+    return SimpleNamespace(topic=link.topic, payload=json.dumps(data).encode())
+
+
+@pytest.fixture
+def mqtt_client():
+    with patch("paho.mqtt.client.Client") as MockClient:
+        yield MockClient
+
+
+class _Harness:
+    def __init__(self, rules=None):
+        self.alerts = []
+        self.watcher = DeviceWatcher(
+            RuleEngine(rules), on_alert=lambda link, msgs, crit: self.alerts.append((link.id, msgs, crit)),
+        )
+
+    def watch(self, links, exclude=None):
+        self.watcher.watch(links, exclude)
+        # Wait for the background opens
+        if self.watcher._opener is not None:
+            self.watcher._opener.submit(lambda: None).result()
+
+    def deliver(self, link, data):
+        key = self.watcher._watched[link.id][0]
+        broker = self.watcher._brokers[key]
+        broker._on_message(None, None, _msg(link, data))
+
+
+class TestDeviceAlerts:
+    """Alert flags reported by devices."""
+
+    def test_alert_list(self):
+        assert device_alerts({"alerts": ["LOW_SPO2"]}) == ["LOW_SPO2"]
+
+    def test_active_alert_count(self):
+        assert device_alerts({"active_alerts": 2}) == ["2 ALERTS"]
+
+    def test_no_alerts(self):
+        assert device_alerts({"alerts": [], "active_alerts": 0}) == []
+
+
+class TestSubscriptions:
+    """One client per broker, reconciled incrementally."""
+
+    def test_devices_share_broker_client(self, mqtt_client):
+        h = _Harness()
+        h.watch([_make_link(f"bed-{i}") for i in range(50)])
+        assert mqtt_client.call_count == 1
+        assert h.watcher.stats()["devices"] == 50
+
+    def test_one_client_per_broker(self, mqtt_client):
+        h = _Harness()
+        h.watch([_make_link("a", host="ward-1"), _make_link("b", host="ward-2")])
+        assert mqtt_client.call_count == 2
+
+    def test_active_device_excluded(self, mqtt_client):
+        h = _Harness()
+        h.watch([_make_link("a"), _make_link("b")], exclude="a")
+        assert list(h.watcher._watched) == ["b"]
+
+    def test_unwatch_closes_empty_broker(self, mqtt_client):
+        h = _Harness()
+        h.watch([_make_link("a")])
+        h.watch([])
+        assert h.watcher.stats()["brokers"] == 0
+        mqtt_client.return_value.loop_stop.assert_called_once()
+
+    def test_broker_closed_outside_lock(self, mqtt_client):
+        # loop_stop() joins the network thread, which takes the lock in _check
+        h = _Harness()
+        h.watch([_make_link("a")])
+        held = []
+        mqtt_client.return_value.loop_stop.side_effect = lambda: held.append(h.watcher._lock.locked())
+        h.watch([])
+        assert held == [False]
+
+    def test_subscribes_on_connect(self, mqtt_client):
+        h = _Harness()
+        links = [_make_link("a"), _make_link("b")]
+        h.watch(links)
+        broker = next(iter(h.watcher._brokers.values()))
+        client = mqtt_client.return_value
+        broker._on_connect(client, None, None, 0)
+        client.subscribe.assert_called_once_with([(links[0].topic, 0), (links[1].topic, 0)])
+
+    def test_token_devices_get_own_credentials(self, mqtt_client):
+        creds = []
+        watcher = DeviceWatcher(RuleEngine(), on_alert=lambda *a: None,
+                                credentials_for=lambda link: creds.append(link.id) or (link.id, "tok"))
+        watcher.watch([_make_link("srv-1", auth="token"), _make_link("bed-1")])
+        watcher._opener.submit(lambda: None).result()
+        assert creds == ["srv-1"]
+        mqtt_client.return_value.username_pw_set.assert_called_once_with("srv-1", "tok")
+        watcher.stop()
+
+
+class TestBackgroundAlerts:
+    """Alert evaluation for watched devices."""
+
+    def test_device_alert_raised_once(self, mqtt_client):
+        h = _Harness()
+        link = _make_link("bed-12")
+        h.watch([link])
+        h.deliver(link, {"spo2": 88, "alerts": ["LOW_SPO2"]})
+        h.deliver(link, {"spo2": 87, "alerts": ["LOW_SPO2"]})
+        assert h.alerts == [("bed-12", ["LOW_SPO2"], False)]
+
+    def test_alert_raised_again_after_clearing(self, mqtt_client):
+        h = _Harness()
+        link = _make_link("bed-12")
+        h.watch([link])
+        for alerts in (["LOW_SPO2"], [], ["LOW_SPO2"]):
+            h.deliver(link, {"alerts": alerts})
+        assert len(h.alerts) == 2
+
+    def test_schema_thresholds_checked(self, mqtt_client):
+        h = _Harness()
+        link = _make_link("bed-12", schema={"spo2": {"alert_below": 90}})
+        h.watch([link])
+        h.deliver(link, {"spo2": 85, "alerts": []})
+        assert h.alerts == [("bed-12", ["LOW_SPO2"], False)]
+
+    def test_critical_rule(self, mqtt_client):
+        h = _Harness([{"id": "hypoxia", "field": "spo2", "below": 85, "severity": "critical"}])
+        link = _make_link("bed-12")
+        h.watch([link])
+        h.deliver(link, {"spo2": 80})
+        assert h.alerts == [("bed-12", ["HYPOXIA"], True)]
+
+    def test_invalid_payload_ignored(self, mqtt_client):
+        h = _Harness()
+        link = _make_link("bed-12")
+        h.watch([link])
+        broker = next(iter(h.watcher._brokers.values()))
+        broker._on_message(None, None, SimpleNamespace(topic=link.topic, payload=b"not json"))
+        assert h.alerts == []